@@ -0,0 +1,96 @@
+"""
+Single-pass MP3 assembly for the audio scripts.
+
+Chunk files are concatenated and ID3-tagged in one ffmpeg run with stream
+copy, so the TTS encoder's MP3 frames are written out untouched: no decode,
+no re-encode at 128k, no second full pass over a 30-minute episode. Only
+non-MP3 input (e.g. AIFF from the macOS `say` fallback) is transcoded.
+
+Usage:
+    from audio_assembly import assemble_mp3
+
+    assemble_mp3(chunk_files, Path("GAT-123.mp3"), tags={"title": "...", "artist": "..."})
+"""
+
+import os
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Encoder settings, only used when the input isn't already MP3
+MP3_CODEC = 'libmp3lame'
+MP3_BITRATE = '128k'
+
+# ID3v2.3 is the most widely supported version (Apple Books, podcast apps)
+ID3_VERSION = '3'
+
+def is_mp3(path) -> bool:
+    """True if the file starts with an ID3 tag or an MPEG audio frame sync."""
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(3)
+    except OSError:
+        return False
+    return header.startswith(b'ID3') or (len(header) >= 2 and header[0] == 0xFF and header[1] & 0xE0 == 0xE0)
+
+def concat_list_entry(path: Path) -> str:
+    """ffmpeg concat demuxer line for a path (single quotes escaped)."""
+    escaped = str(Path(path).resolve()).replace("'", "'\\''")
+    return f"file '{escaped}'\n"
+
+def assemble_mp3(chunk_paths: List[Path], output_path: Path,
+                 tags: Optional[Dict[str, str]] = None) -> str:
+    """
+    Concatenate chunks into output_path and write ID3 tags in one ffmpeg pass.
+
+    Audio is stream-copied when every chunk is MP3; otherwise it is encoded
+    once with MP3_CODEC. The result is written to a temp file and renamed,
+    so output_path never holds a partial episode.
+
+    Args:
+        chunk_paths: Audio files in playback order
+        output_path: Final MP3 path
+        tags: ID3 fields (title, album, artist, comment, ...)
+
+    Returns:
+        ffmpeg's stderr (warnings), for the caller to log
+
+    Raises:
+        subprocess.CalledProcessError: If ffmpeg fails
+    """
+    output_path = Path(output_path)
+    concat_file = output_path.parent / f"{output_path.stem}.concat.txt"
+    temp_output = output_path.parent / f"{output_path.stem}.assembling.mp3"
+
+    with open(concat_file, 'w') as f:
+        for chunk_path in chunk_paths:
+            f.write(concat_list_entry(chunk_path))
+
+    if all(is_mp3(p) for p in chunk_paths):
+        codec_args = ['-c:a', 'copy']
+    else:
+        codec_args = ['-c:a', MP3_CODEC, '-b:a', MP3_BITRATE]
+
+    metadata_args = []
+    for key, value in (tags or {}).items():
+        metadata_args += ['-metadata', f'{key}={value}']
+
+    try:
+        result = subprocess.run([
+            'ffmpeg', '-f', 'concat', '-safe', '0',
+            '-i', str(concat_file),
+            '-map', '0:a',
+            *codec_args,
+            '-map_metadata', '-1',
+            *metadata_args,
+            '-id3v2_version', ID3_VERSION,
+            '-f', 'mp3',
+            '-y', str(temp_output)
+        ], check=True, capture_output=True, text=True)
+
+        os.replace(temp_output, output_path)
+        return result.stderr
+    finally:
+        concat_file.unlink()
+        if temp_output.exists():
+            temp_output.unlink()
@@ -0,0 +1,165 @@
+"""
+Duration, disk-space and run-time estimates for audio generation runs.
+
+Estimates come from the text that will actually be voiced (executive summary
+plus cleaned article text), not from counting PDFs: audio length follows the
+character count at the TTS speaking rate, file size follows duration at the
+MP3 bitrate, and run time follows the characters still to synthesize (cached
+chunks are free) spread over the in-flight request cap.
+
+The rates are averages measured on past runs; treat the result as a plan,
+not a guarantee. Disk estimates include a safety margin.
+
+Usage:
+    from audio_estimate import estimate_article, estimate_run
+
+    articles = [estimate_article(ticket_id, intro, text, is_cached=client.is_cached),
+                estimate_article_from_pages(ticket_id, intro, pages=8)]   # Not extracted yet
+    plan = estimate_run(articles, concurrency=6, parallel_articles=2)
+"""
+
+import math
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from shared_patterns import AUDIO_BITRATE, AUDIO_CHUNK_MAX_CHARS
+from streaming_audio import mp3_bitrate, strip_id3v2
+from tts_client import split_for_tts
+
+# Speaking rate of the TTS voice at speed 1.0 (~150 words per minute)
+CHARS_PER_AUDIO_SECOND = 15.0
+
+# TTS throughput of a single in-flight request (characters voiced per second of wall time)
+TTS_CHARS_PER_REQUEST_SECOND = 160.0
+
+# Extraction, Drive upload and JIRA update for the last article (not overlapped with TTS)
+PUBLISH_SECONDS_PER_ARTICLE = 20.0
+
+# Extra disk headroom on top of the estimate
+DISK_SAFETY_MARGIN = 1.25
+
+# Cleaned speech text per page of a browser-printed article PDF, and the page
+# count assumed when it can't be read (for estimates made before extraction)
+CHARS_PER_PDF_PAGE = 2500
+TYPICAL_PDF_PAGES = 6
+
+def parse_bitrate(bitrate: str) -> int:
+    """'128k' -> 128000 bits/s."""
+    bitrate = bitrate.strip().lower()
+    if bitrate.endswith('k'):
+        return int(float(bitrate[:-1]) * 1000)
+    return int(bitrate)
+
+DEFAULT_BITS_PER_SECOND = parse_bitrate(AUDIO_BITRATE)
+
+def calibrate_bitrate(audio_dir: Path, samples: int = 5) -> int:
+    """
+    Bitrate of existing episodes in audio_dir (they are stream copies of TTS
+    output, so new episodes will match), or the configured default.
+    """
+    for path in sorted(Path(audio_dir).glob('GAT-*.mp3'), reverse=True)[:samples]:
+        try:
+            with open(path, 'rb') as f:
+                head = f.read(256 * 1024)
+        except OSError:
+            continue
+        bitrate = mp3_bitrate(strip_id3v2(head))
+        if bitrate:
+            return bitrate
+    return DEFAULT_BITS_PER_SECOND
+
+def estimate_article(ticket_id: str, intro: str, text: str,
+                     is_cached: Optional[Callable[[str], bool]] = None,
+                     bits_per_second: int = DEFAULT_BITS_PER_SECOND) -> Dict:
+    """
+    Estimate one episode: chunks (and how many are cached), duration and size.
+
+    Chunks are produced exactly as generate_audio_openai will produce them
+    (intro chunked on its own), so the chunk count is exact.
+    """
+    chunks = (split_for_tts(intro) if intro else []) + split_for_tts(text)
+    cached = [chunk for chunk in chunks if is_cached and is_cached(chunk)]
+
+    chars = sum(len(chunk) for chunk in chunks)
+    seconds = chars / CHARS_PER_AUDIO_SECOND
+
+    return {
+        'ticket_id': ticket_id,
+        'chars': chars,
+        'chunks': len(chunks),
+        'cached_chunks': len(cached),
+        'uncached_chars': chars - sum(len(chunk) for chunk in cached),
+        'audio_seconds': seconds,
+        'bytes': int(seconds * bits_per_second / 8),
+    }
+
+def estimate_article_from_pages(ticket_id: str, intro: str, pages: Optional[int],
+                                bits_per_second: int = DEFAULT_BITS_PER_SECOND) -> Dict:
+    """
+    Rough estimate_article() for an article whose text hasn't been extracted
+    yet, from its PDF page count. Nothing is counted as cached.
+    """
+    text_chars = (pages or TYPICAL_PDF_PAGES) * CHARS_PER_PDF_PAGE
+    intro_chunks = split_for_tts(intro) if intro else []
+
+    chars = sum(len(chunk) for chunk in intro_chunks) + text_chars
+    seconds = chars / CHARS_PER_AUDIO_SECOND
+
+    return {
+        'ticket_id': ticket_id,
+        'chars': chars,
+        'chunks': len(intro_chunks) + math.ceil(text_chars / AUDIO_CHUNK_MAX_CHARS),
+        'cached_chunks': 0,
+        'uncached_chars': chars,
+        'audio_seconds': seconds,
+        'bytes': int(seconds * bits_per_second / 8),
+        'approximate': True,
+    }
+
+def estimate_run(articles: List[Dict], concurrency: int, parallel_articles: int = 1,
+                 stream: bool = False) -> Dict:
+    """
+    Totals for a run over estimate_article() results.
+
+    Peak disk use is every finished episode plus, for the largest articles in
+    flight at once, their chunk files and the assembly temp file (and the
+    progressive copy when streaming). concurrency is the cap on in-flight
+    TTS requests.
+    """
+    total_bytes = sum(a['bytes'] for a in articles)
+
+    # Transient copies per in-flight article: chunk files + .assembling.mp3 (+ stream)
+    copies = 3 if stream else 2
+    largest = sorted((a['bytes'] for a in articles), reverse=True)[:max(1, parallel_articles)]
+    peak_bytes = total_bytes + copies * sum(largest)
+
+    uncached_chars = sum(a['uncached_chars'] for a in articles)
+    tts_seconds = uncached_chars / (TTS_CHARS_PER_REQUEST_SECOND * max(1, concurrency))
+    wall_seconds = tts_seconds + (PUBLISH_SECONDS_PER_ARTICLE if articles else 0)
+
+    return {
+        'articles': len(articles),
+        'chars': sum(a['chars'] for a in articles),
+        'chunks': sum(a['chunks'] for a in articles),
+        'cached_chunks': sum(a['cached_chunks'] for a in articles),
+        'uncached_chars': uncached_chars,
+        'audio_seconds': sum(a['audio_seconds'] for a in articles),
+        'bytes': total_bytes,
+        'required_bytes': int(peak_bytes * DISK_SAFETY_MARGIN),
+        'wall_seconds': wall_seconds,
+        'approximate': len([a for a in articles if a.get('approximate')]),
+    }
+
+def format_duration(seconds: float) -> str:
+    """Seconds as '1h 05m', '12m 30s' or '45s'."""
+    seconds = int(math.ceil(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}h {minutes:02d}m"
+    if minutes:
+        return f"{minutes}m {secs:02d}s"
+    return f"{secs}s"
+
+def format_mb(num_bytes: float) -> str:
+    return f"{num_bytes / (1024 * 1024):.1f} MB"
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Benchmark the precompiled speech cleaner against the original implementations.
+
+Extracts text from every PDF under pdfs/ (in parallel, via the shared PDF
+text store), then runs both the original per-script clean_text_for_speech
+functions (kept below as reference copies) and speech_cleaning's cleaners
+over it. Reports timing and
+any article whose output differs. Exits non-zero on a mismatch.
+
+Usage:
+    python3 benchmark-speech-cleaner.py [--pdf-dir ../pdfs] [--repeat 5] [--limit N]
+    python3 benchmark-speech-cleaner.py --text-dir /tmp/extracted   # pre-extracted .txt files
+"""
+
+import argparse
+import re
+import shutil
+import sys
+import time
+from pathlib import Path
+
+from pdf_text import extract_pdfs, find_pdfs
+from speech_cleaning import ASSESSMENT_CLEANER, ARTICLE_CLEANER
+
+def reference_assessment_clean(text):
+    """Original clean_text_for_speech from generate-audio-from-assessment.py."""
+    text = re.sub(r'^Open in app\s*\n?', '', text, flags=re.IGNORECASE | re.MULTILINE)
+    text = re.sub(r'Welcome back\. You are signed into your member account.*?Not you\?', '', text, flags=re.DOTALL)
+    text = re.sub(r'bg••••@jaxondigital\.com', '', text)
+    text = re.sub(r'https?://\S+', '', text)
+    text = re.sub(r'(Sidebar menu|Medium Logo|Write|Search|Notifications|Follow publication|Member-only story)', '', text)
+    text = re.sub(r'\b(Follow|Listen|Share|More)\b\s*\n', '', text)
+    text = re.sub(r'\d+ min read\s*·\s*[A-Z][a-z]+\s+\d+,\s+\d+', '', text)
+    text = re.sub(r'\d+ min read', '', text)
+
+    footer_patterns = [
+        r'\n\s*Topics\s*\n',
+        r'\n\s*Topics\s*$',
+        r'\nSee you next time!?\s*\n',
+        r'\nReferences\s*\n',
+        r'[\n\f]Written by\s+[\w\s]+\n',
+        r'\n(?:No )?[Rr]esponses?\s*\(',
+        r'\nSee all from\s+[\w\s]+\n',
+        r'\nRecommended from Medium',
+        r'\nMore from\s+[\w\s]+\n',
+        r'\n\s*--\s*\n',
+        r'\nIf you (?:like|enjoyed).*(?:comment|share|clap)',
+    ]
+
+    earliest_footer_pos = len(text)
+    for pattern in footer_patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match and match.start() < earliest_footer_pos:
+            earliest_footer_pos = match.start()
+
+    if earliest_footer_pos < len(text):
+        text = text[:earliest_footer_pos]
+
+    return reference_code_and_whitespace(text)
+
+def reference_article_clean(text):
+    """Original clean_text_for_speech from generate-article-audio.py."""
+    text = re.sub(r'Welcome back\. You are signed into your member account.*?Not you\?', '', text, flags=re.DOTALL)
+    text = re.sub(r'bg••••@jaxondigital\.com', '', text)
+    text = re.sub(r'https?://\S+', '', text)
+    text = re.sub(r'(Sidebar menu|Medium Logo|Write|Search|Notifications|Follow publication|Member-only story)', '', text)
+    text = re.sub(r'\b(Follow|Listen|Share|More)\b\s*\n', '', text)
+    text = re.sub(r'\d+ min read\s*·\s*[A-Z][a-z]+\s+\d+,\s+\d+', '', text)
+    text = re.sub(r'\d+ min read', '', text)
+    text = re.sub(r'See all from.*', '', text)
+    text = re.sub(r'Recommended from Medium', '', text)
+
+    return reference_code_and_whitespace(text)
+
+def reference_code_and_whitespace(text):
+    """Original code-block removal and whitespace cleanup (shared by both)."""
+    lines = text.split('\n')
+    cleaned_lines = []
+    in_code_block = False
+
+    for line in lines:
+        special_char_count = sum(1 for c in line if c in '{}[]();,=<>|&')
+        total_chars = len(line.strip())
+
+        if total_chars > 10 and special_char_count / total_chars > 0.3:
+            in_code_block = True
+            continue
+        elif in_code_block and total_chars < 20:
+            continue
+        else:
+            in_code_block = False
+            cleaned_lines.append(line)
+
+    text = '\n'.join(cleaned_lines)
+    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+    return text.strip()
+
+def load_corpus(pdf_dir, text_dir, limit):
+    """Return [(name, text)] from pre-extracted .txt files or the shared PDF text store."""
+    corpus = []
+
+    if text_dir:
+        for path in sorted(Path(text_dir).rglob('*.txt'))[:limit]:
+            corpus.append((str(path), path.read_text(encoding='utf-8', errors='replace')))
+        return corpus
+
+    if not shutil.which('pdftotext'):
+        print("Error: pdftotext not found (brew install poppler), or pass --text-dir")
+        sys.exit(1)
+
+    # Extracted in parallel; stored text is reused on later runs
+    for result in extract_pdfs(find_pdfs([pdf_dir])[:limit], timeout=60):
+        if result.error:
+            print(f"  ⚠ Skipping {result.path.name}: {result.error}")
+            continue
+        corpus.append((str(result.path), result.text))
+
+    # Completion order varies between runs; keep the report stable
+    return sorted(corpus)
+
+def time_cleaner(clean, corpus, repeat):
+    """Best-of-repeat seconds to clean the whole corpus, plus the outputs."""
+    best = float('inf')
+    outputs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        outputs = [clean(text) for _, text in corpus]
+        best = min(best, time.perf_counter() - start)
+    return best, outputs
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark speech text cleaning over the PDF corpus")
+    parser.add_argument("--pdf-dir", default=str(Path(__file__).parent.parent / "pdfs"),
+                        help="Directory searched recursively for PDFs (default: ../pdfs)")
+    parser.add_argument("--text-dir", default=None,
+                        help="Use pre-extracted .txt files instead of running pdftotext")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs per cleaner (best is reported)")
+    parser.add_argument("--limit", type=int, default=None, help="Only use the first N documents")
+    args = parser.parse_args()
+
+    print("Loading corpus...")
+    corpus = load_corpus(args.pdf_dir, args.text_dir, args.limit)
+    if not corpus:
+        print("No documents found")
+        sys.exit(1)
+
+    total_chars = sum(len(text) for _, text in corpus)
+    print(f"  {len(corpus)} documents, {total_chars:,} characters\n")
+
+    variants = [
+        ("assessment audio", reference_assessment_clean, ASSESSMENT_CLEANER.clean),
+        ("article audio", reference_article_clean, ARTICLE_CLEANER.clean),
+    ]
+
+    mismatches = 0
+    for name, reference, cleaner in variants:
+        ref_time, ref_outputs = time_cleaner(reference, corpus, args.repeat)
+        new_time, new_outputs = time_cleaner(cleaner, corpus, args.repeat)
+
+        differing = [doc for (doc, _), a, b in zip(corpus, ref_outputs, new_outputs) if a != b]
+        mismatches += len(differing)
+
+        print(f"{name}:")
+        print(f"  original:    {ref_time * 1000:8.1f} ms")
+        print(f"  precompiled: {new_time * 1000:8.1f} ms  ({ref_time / max(new_time, 1e-9):.1f}x)")
+        if differing:
+            print(f"  ✗ {len(differing)} documents differ:")
+            for doc in differing[:10]:
+                print(f"    {doc}")
+        else:
+            print(f"  ✓ identical output for all {len(corpus)} documents")
+        print()
+
+    sys.exit(1 if mismatches else 0)
+
+if __name__ == '__main__':
+    main()
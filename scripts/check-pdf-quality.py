@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Check captured PDFs for paywalls, empty pages, UI-only captures and duplicates.
+
+Runs the content-quality stage (content_quality.py) over PDF files or
+folders and prints a verdict per PDF. Verdicts are stored with the extracted
+text, so the assessment and audio scripts reuse them instead of re-checking.
+Run it right after a capture session to re-save bad PDFs while the browser
+is still open.
+
+Usage:
+    python3 check-pdf-quality.py ../pdfs/medium-articles-2025-10-22
+    python3 check-pdf-quality.py ../pdfs --problems-only
+    python3 check-pdf-quality.py 03-some-article.pdf --refresh    # ignore stored verdicts
+"""
+
+import argparse
+import sys
+
+from content_quality import check_pdf_quality
+from pdf_text import extract_pdfs, find_pdfs
+
+ICONS = {'ok': '✓', 'suspicious': '⚠', 'reject': '✗'}
+
+def main():
+    parser = argparse.ArgumentParser(description="Content-quality verdicts for captured PDFs")
+    parser.add_argument("sources", nargs="+", help="PDF files or directories (searched recursively)")
+    parser.add_argument("--problems-only", action="store_true", help="Only list suspicious and rejected PDFs")
+    parser.add_argument("--refresh", action="store_true", help="Re-check instead of using stored verdicts")
+    parser.add_argument("--workers", type=int, default=None, help="Extraction processes (default: CPU count)")
+    args = parser.parse_args()
+
+    pdfs = find_pdfs(args.sources)
+    if not pdfs:
+        print("No PDFs found")
+        sys.exit(1)
+
+    print(f"🔍 Checking {len(pdfs)} PDFs...\n")
+
+    # Extract in parallel first; the checks below then read text from the store
+    for _ in extract_pdfs(pdfs, workers=args.workers, return_text=False):
+        pass
+
+    counts = {verdict: 0 for verdict in ICONS}
+    for path in pdfs:
+        quality = check_pdf_quality(path, refresh=args.refresh)
+        counts[quality['verdict']] += 1
+        if args.problems_only and quality['verdict'] == 'ok':
+            continue
+        print(f"  {ICONS[quality['verdict']]} {path}: {quality['summary']}")
+
+    print(f"\n✅ OK: {counts['ok']}   ⚠ Suspicious: {counts['suspicious']}   ✗ Rejected: {counts['reject']}")
+    sys.exit(1 if counts['reject'] else 0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Compare the in-process PDF text backend (pypdf) against pdftotext.
+
+Extracts every PDF under pdfs/ with both backends (directly, bypassing the
+text store so timings are real) and compares word sequences, both on the raw
+text and after clean_text_for_speech (what actually gets voiced). Also checks
+first-page extraction (-l 1) the same way. Reports per-backend timing and
+every PDF below the similarity threshold. Exits non-zero if any PDF is below
+it, so it can gate switching PDF_TEXT_BACKEND to pypdf.
+
+Usage:
+    python3 check-pdf-text-parity.py [--pdf-dir ../pdfs] [--limit N] [--min-ratio 0.95]
+"""
+
+import argparse
+import difflib
+import re
+import sys
+import time
+from pathlib import Path
+
+from pdf_text import PdftotextBackend, PypdfBackend, describe_error, find_pdfs
+from speech_cleaning import clean_text_for_speech
+
+WORD_PATTERN = re.compile(r'\w+')
+
+def word_similarity(a: str, b: str) -> float:
+    """Similarity (0-1) of the lowercased word sequences; layout and punctuation are ignored."""
+    words_a = WORD_PATTERN.findall(a.lower())
+    words_b = WORD_PATTERN.findall(b.lower())
+    if not words_a and not words_b:
+        return 1.0
+    return difflib.SequenceMatcher(None, words_a, words_b).ratio()
+
+def timed_extract(backend, path, last_page=None):
+    """(text, seconds, error) for one extraction."""
+    start = time.perf_counter()
+    try:
+        text = backend.extract(path, last_page=last_page)
+    except Exception as e:
+        return None, time.perf_counter() - start, describe_error(e)
+    return text, time.perf_counter() - start, None
+
+def main():
+    parser = argparse.ArgumentParser(description="Check pypdf text extraction against pdftotext")
+    parser.add_argument("--pdf-dir", default=str(Path(__file__).parent.parent / "pdfs"),
+                        help="Directory searched recursively for PDFs (default: ../pdfs)")
+    parser.add_argument("--limit", type=int, default=None, help="Only check the first N PDFs")
+    parser.add_argument("--min-ratio", type=float, default=0.95,
+                        help="Minimum word similarity of cleaned text (default: 0.95)")
+    args = parser.parse_args()
+
+    reference, candidate = PdftotextBackend(), PypdfBackend()
+    for backend in (reference, candidate):
+        if not backend.available():
+            print(f"Error: {backend.name} is not installed")
+            sys.exit(2)
+
+    pdfs = find_pdfs([args.pdf_dir])[:args.limit]
+    if not pdfs:
+        print("No PDFs found")
+        sys.exit(1)
+
+    print(f"Comparing {candidate.name} against {reference.name} on {len(pdfs)} PDFs...\n")
+
+    times = {reference.name: 0.0, candidate.name: 0.0}
+    raw_ratios, clean_ratios, first_page_ratios = [], [], []
+    failures = []
+
+    for index, path in enumerate(pdfs, 1):
+        ref_text, ref_time, ref_error = timed_extract(reference, path)
+        new_text, new_time, new_error = timed_extract(candidate, path)
+        times[reference.name] += ref_time
+        times[candidate.name] += new_time
+
+        if ref_error:
+            # Not a parity problem: the reference can't read it either
+            print(f"  [{index}/{len(pdfs)}] ⚠ {path.name}: {reference.name} failed ({ref_error})")
+            continue
+        if new_error:
+            failures.append((path, f"{candidate.name} failed ({new_error})"))
+            continue
+
+        raw_ratio = word_similarity(ref_text, new_text)
+        clean_ratio = word_similarity(clean_text_for_speech(ref_text), clean_text_for_speech(new_text))
+
+        ref_first, _, _ = timed_extract(reference, path, last_page=1)
+        new_first, _, _ = timed_extract(candidate, path, last_page=1)
+        first_ratio = word_similarity(ref_first or '', new_first or '')
+
+        raw_ratios.append(raw_ratio)
+        clean_ratios.append(clean_ratio)
+        first_page_ratios.append(first_ratio)
+
+        if clean_ratio < args.min_ratio or first_ratio < args.min_ratio:
+            failures.append((path, f"cleaned {clean_ratio:.3f}, first page {first_ratio:.3f}"))
+
+    compared = len(clean_ratios)
+    print(f"\n{reference.name}: {times[reference.name]:.2f}s   "
+          f"{candidate.name}: {times[candidate.name]:.2f}s   (full documents)")
+
+    if compared:
+        print(f"Mean word similarity over {compared} PDFs: raw {sum(raw_ratios) / compared:.3f}, "
+              f"cleaned {sum(clean_ratios) / compared:.3f}, first page {sum(first_page_ratios) / compared:.3f}")
+        print(f"Lowest cleaned similarity: {min(clean_ratios):.3f}")
+
+    if failures:
+        print(f"\n✗ {len(failures)} PDFs below {args.min_ratio} or unreadable by {candidate.name}:")
+        for path, reason in failures:
+            print(f"    {path}: {reason}")
+        sys.exit(1)
+
+    print(f"\n✓ {candidate.name} matches {reference.name} on all {compared} PDFs (≥ {args.min_ratio})")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+"""
+Persistent content-addressed cache for expensive API results.
+
+Each entry is a file named by a SHA-256 of everything that produced it (input
+text, prompt, model settings), so a changed input simply misses and stale
+entries age out. The directory is kept under a size cap by evicting the least
+recently used entries (tracked via file mtime, refreshed on every hit).
+
+Usage:
+    from content_cache import ContentCache, content_key
+
+    cache = ContentCache("~/.cache/jaxon-ai/assessments", max_bytes=200 * 1024 * 1024)
+    key = content_key(model, temperature, messages)
+    result = cache.get_json(key)
+    if result is None:
+        result = call_api()
+        cache.put_json(key, result)
+
+    # Binary entries (e.g. audio) are stored and served as files
+    audio_cache = ContentCache("~/.cache/jaxon-ai/tts", suffix=".mp3")
+    cached_path = audio_cache.get_path(key)
+    audio_cache.put_file(key, "/tmp/chunk0.mp3")
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+# Root for all caches (each consumer uses its own subdirectory)
+DEFAULT_CACHE_ROOT = os.path.expanduser("~/.cache/jaxon-ai")
+
+def content_key(*parts) -> str:
+    """
+    Build a stable SHA-256 key from strings, bytes or JSON-serializable values.
+
+    Parts are length-prefixed so ("ab", "c") and ("a", "bc") never collide.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, bytes):
+            data = part
+        elif isinstance(part, str):
+            data = part.encode('utf-8')
+        else:
+            data = json.dumps(part, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        digest.update(len(data).to_bytes(8, 'big'))
+        digest.update(data)
+    return digest.hexdigest()
+
+class ContentCache:
+    """
+    Size-capped, on-disk cache of content-addressed entries.
+
+    Args:
+        cache_dir: Directory holding the entries (created on first write)
+        max_bytes: Evict least recently used entries above this total size
+        suffix: File extension for entries (e.g. '.json', '.mp3')
+        read: If False, lookups always miss (used for --refresh)
+        write: If False, nothing is stored
+    """
+
+    def __init__(self, cache_dir, max_bytes: int = 200 * 1024 * 1024, suffix: str = '.json',
+                 read: bool = True, write: bool = True):
+        self.cache_dir = Path(os.path.expanduser(str(cache_dir)))
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self.read = read
+        self.write = write
+        self.hits = 0
+        self.misses = 0
+        self._size = None  # Total bytes on disk, computed lazily
+        self._lock = threading.Lock()
+
+    def path_for(self, key: str) -> Path:
+        """Entry path for a key (sharded by the first two hex digits)."""
+        return self.cache_dir / key[:2] / f"{key}{self.suffix}"
+
+    def get_json(self, key: str) -> Optional[Any]:
+        """Return the cached JSON value for key, or None on a miss."""
+        path = self._lookup(key)
+        if path is None:
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            # Corrupt or concurrently evicted entry - treat as a miss
+            return None
+
+    def put_json(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value under key."""
+        if not self.write:
+            return
+
+        data = json.dumps(value, ensure_ascii=False).encode('utf-8')
+        self._store(key, data)
+
+    def get_path(self, key: str) -> Optional[Path]:
+        """Return the path of the cached entry for key (e.g. an audio file), or None on a miss."""
+        return self._lookup(key)
+
+    def contains(self, key: str) -> bool:
+        """True if key is cached (doesn't count as a hit or miss)."""
+        return self.read and self.path_for(key).exists()
+
+    def put_file(self, key: str, source_path) -> None:
+        """Store a copy of a file's bytes under key."""
+        if not self.write:
+            return
+
+        with open(source_path, 'rb') as f:
+            data = f.read()
+        self._store(key, data)
+
+    def _lookup(self, key: str) -> Optional[Path]:
+        """Resolve key to an existing entry, recording hit/miss and recency."""
+        path = self.path_for(key)
+        with self._lock:
+            if not self.read or not path.exists():
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        try:
+            # Refresh mtime so eviction is least-recently-used, not oldest-written
+            os.utime(path, None)
+        except OSError:
+            pass
+
+        return path
+
+    def _store(self, key: str, data: bytes) -> None:
+        """Atomically write an entry (temp file + rename) and enforce the size cap."""
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(dir=str(path.parent), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            previous = path.stat().st_size if path.exists() else 0
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._disk_usage()
+            else:
+                self._size += len(data) - previous
+
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        """All entry files currently in the cache."""
+        if not self.cache_dir.exists():
+            return []
+        return [p for p in self.cache_dir.glob(f"*/*{self.suffix}") if p.is_file()]
+
+    def _disk_usage(self) -> int:
+        total = 0
+        for entry in self._entries():
+            try:
+                total += entry.stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until 90% of max_bytes remains."""
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+
+        entries.sort()
+        target = int(self.max_bytes * 0.9)
+        size = sum(e[1] for e in entries)
+
+        for _, entry_size, entry in entries:
+            if size <= target:
+                break
+            try:
+                entry.unlink()
+                size -= entry_size
+            except OSError:
+                pass
+
+        self._size = size
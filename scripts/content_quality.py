@@ -0,0 +1,156 @@
+"""
+Content-quality verdicts for captured article PDFs.
+
+One stage decides whether a PDF is worth any LLM or TTS spend. It scores the
+extracted text once:
+
+- length: empty and suspiciously short captures
+- paywall markers (shared_patterns.PAYWALL_INDICATORS) on a short text;
+  member-only badges alone (MEMBER_ONLY_INDICATORS) only warn, since
+  readable member stories carry them too
+- UI-chrome ratio: share of lines that are only Medium navigation, buttons,
+  URLs or reading time (what a paywalled capture is mostly made of)
+- duplicate pages: captures that repeat the same page
+
+The verdict is 'ok', 'suspicious' (usable, but warn) or 'reject' (skip the
+article). It is stored in the PDF text store next to the extracted text,
+keyed by the PDF's content hash, so only the first script to see a PDF pays
+for the check.
+
+Usage:
+    from content_quality import check_pdf_quality
+
+    quality = check_pdf_quality(pdf_path)
+    if quality['verdict'] == 'reject':
+        print(f"Skipping: {quality['summary']}")
+"""
+
+import re
+import subprocess
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from content_cache import content_key
+from pdf_text import PDFTextStore, describe_error, get_pdf_text_store
+from shared_patterns import (MEMBER_ONLY_INDICATORS, PAYWALL_INDICATORS, PDF_MIN_CHARS,
+                             PDF_PAYWALL_THRESHOLD, PDF_SUSPICIOUS_THRESHOLD)
+
+# Bump when the rules below change to invalidate stored verdicts
+QUALITY_VERSION = 2
+
+# Lines that are nothing but Medium UI
+CHROME_LINE = re.compile(
+    r'(?:Open in app|Sidebar menu|Medium Logo|Write|Search|Notifications|Home|Library|Profile|Stories|Stats'
+    r'|Sign (?:up|in)|Get started|Follow(?: publication)?|Member-only story|Listen|Share|More|--|·|\d+'
+    r'|\d+ min read.*|https?://\S+|\S+@\S+\.\w+|(?:No )?[Rr]esponses?.*|Welcome back\..*|Not you\?)',
+    re.IGNORECASE
+)
+CHROME_SUSPICIOUS_RATIO = 0.35
+CHROME_REJECT_RATIO = 0.6
+
+# Pages shorter than this (title pages, trailing footers) are not compared
+DUPLICATE_MIN_PAGE_CHARS = 200
+
+VERDICTS = ('ok', 'suspicious', 'reject')
+
+def find_paywall_markers(text: str, indicators: List[str] = PAYWALL_INDICATORS) -> List[str]:
+    """Paywall indicators present in text (PDF text or page HTML)."""
+    lower = text.lower()
+    return [marker for marker in indicators if marker in lower]
+
+def chrome_ratio(text: str) -> float:
+    """Share of non-empty lines that are only UI chrome."""
+    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    if not lines:
+        return 0.0
+    return sum(1 for line in lines if CHROME_LINE.fullmatch(line)) / len(lines)
+
+def duplicate_pages(pages: List[str]) -> int:
+    """Number of substantial pages whose text repeats an earlier page."""
+    seen = set()
+    duplicates = 0
+    for page in pages:
+        normalized = ' '.join(page.split())
+        if len(normalized) < DUPLICATE_MIN_PAGE_CHARS:
+            continue
+        if normalized in seen:
+            duplicates += 1
+        seen.add(normalized)
+    return duplicates
+
+def assess_text(text: str) -> Dict:
+    """
+    Verdict for extracted PDF text (pages separated by form feeds, as
+    pdftotext writes them). Returns the verdict, its reasons and the metrics.
+    """
+    chars = len(text.strip())
+    pages = [page for page in text.split('\f') if page.strip()]
+    markers = find_paywall_markers(text)
+    badges = find_paywall_markers(text, MEMBER_ONLY_INDICATORS)
+    chrome = chrome_ratio(text)
+    duplicates = duplicate_pages(pages)
+    substantial_pages = sum(1 for page in pages if len(' '.join(page.split())) >= DUPLICATE_MIN_PAGE_CHARS)
+
+    rejects = []
+    warnings = []
+
+    if chars < PDF_MIN_CHARS:
+        rejects.append(f"appears empty ({chars} chars)")
+    elif markers and chars < PDF_PAYWALL_THRESHOLD:
+        rejects.append(f"paywall text detected, only {chars} chars")
+    elif chars < PDF_SUSPICIOUS_THRESHOLD:
+        warnings.append(f"suspiciously short ({chars} chars) - may be paywalled")
+    elif badges and chars < PDF_PAYWALL_THRESHOLD:
+        warnings.append(f"member-only story, only {chars} chars - may be truncated")
+
+    if chrome >= CHROME_REJECT_RATIO:
+        rejects.append(f"mostly UI chrome ({chrome:.0%} of lines)")
+    elif chrome >= CHROME_SUSPICIOUS_RATIO:
+        warnings.append(f"high UI chrome ({chrome:.0%} of lines)")
+
+    if duplicates and duplicates * 2 >= substantial_pages:
+        rejects.append(f"{duplicates} of {substantial_pages} pages duplicated")
+    elif duplicates:
+        warnings.append(f"{duplicates} duplicate page{'s' if duplicates != 1 else ''}")
+
+    verdict = 'reject' if rejects else 'suspicious' if warnings else 'ok'
+    reasons = rejects + warnings
+
+    return {
+        'verdict': verdict,
+        'summary': '; '.join(reasons) or 'ok',
+        'reasons': reasons,
+        'chars': chars,
+        'pages': len(pages),
+        'paywall_markers': markers,
+        'member_only_markers': badges,
+        'chrome_ratio': round(chrome, 3),
+        'duplicate_pages': duplicates,
+    }
+
+def check_pdf_quality(pdf_path, store: Optional[PDFTextStore] = None, refresh: bool = False) -> Dict:
+    """
+    Verdict for a PDF, from the text store or assessed (and stored) now.
+
+    A PDF that can't be read is rejected; that verdict isn't stored, so a
+    fixed PDF or newly installed backend is checked again next time.
+    """
+    store = store or get_pdf_text_store()
+
+    try:
+        digest = store.fingerprint(pdf_path)
+        key = content_key('pdf-quality', QUALITY_VERSION, store.backend.version, digest)
+
+        quality = None if refresh else store.cache.get_json(key)
+        if isinstance(quality, dict) and quality.get('verdict') in VERDICTS:
+            return quality
+
+        quality = assess_text(store.text(pdf_path))
+    except (subprocess.SubprocessError, OSError) as e:
+        reason = f"unreadable ({describe_error(e)})"
+        return {'verdict': 'reject', 'summary': reason, 'reasons': [reason]}
+
+    quality['sha256'] = digest
+    quality['checked'] = datetime.now().isoformat(timespec='seconds')
+    store.cache.put_json(key, quality)
+    return quality
@@ -0,0 +1,63 @@
+"""
+Voiced text of each audio episode, saved next to the audio library.
+
+When an episode is generated, the exact text sent to TTS (executive summary
+intro plus cleaned article text) and its ID3 tags are written to
+audio-reviews/sources/<ticket>.json. Re-voicing the library (new voice,
+model or speed) then starts from this text instead of finding, extracting
+and cleaning every PDF again, and produces the same chunks.
+
+Usage:
+    from episode_sources import save_episode_source, load_episode_source
+
+    save_episode_source(audio_dir, "GAT-123", text, intro=intro, tags=tags)
+    source = load_episode_source(audio_dir, "GAT-123")  # {"text", "intro", "tags", ...} or None
+"""
+
+import json
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+SOURCES_DIR_NAME = "sources"
+
+def episode_source_path(audio_dir, ticket_id: str) -> Path:
+    return Path(audio_dir) / SOURCES_DIR_NAME / f"{ticket_id}.json"
+
+def save_episode_source(audio_dir, ticket_id: str, text: str, intro: Optional[str] = None,
+                        tags: Optional[Dict[str, str]] = None) -> Path:
+    """Atomically write the voiced text and tags of an episode. Returns the path."""
+    path = episode_source_path(audio_dir, ticket_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    source = {
+        "ticket_id": ticket_id,
+        "saved": datetime.now().isoformat(timespec="seconds"),
+        "intro": intro or "",
+        "text": text,
+        "tags": tags or {},
+    }
+
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{ticket_id}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(source, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+    return path
+
+def load_episode_source(audio_dir, ticket_id: str) -> Optional[Dict]:
+    """The saved source of an episode, or None if missing or unreadable."""
+    path = episode_source_path(audio_dir, ticket_id)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            source = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return source if source.get("text") else None
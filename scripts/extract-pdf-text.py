@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Extract text from whole PDF directories into the shared PDF text store.
+
+Runs extraction across a process pool (one worker per CPU by default) and
+prints each PDF as it finishes. Already-stored PDFs are skipped in
+milliseconds, so this is cheap to re-run. Afterwards every script that reads
+PDF text (assessment, audio, recommendations, metadata fixes) is served from
+the store instead of spawning pdftotext.
+
+Usage:
+    python3 extract-pdf-text.py                                  # all of ../pdfs
+    python3 extract-pdf-text.py ../pdfs/medium-articles-2025-10-2*
+    python3 extract-pdf-text.py ../pdfs --layout --workers 4     # -layout text (retry-single-audio.py)
+    python3 extract-pdf-text.py ../pdfs --first-page             # first page only (author lookups)
+    python3 extract-pdf-text.py ../pdfs --backend pypdf          # in-process backend
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from pdf_text import (BACKENDS, DEFAULT_BACKEND, EXTRACTION_TIMEOUT, PDF_TEXT_STORE_DIR,
+                      extract_pdfs, find_pdfs, get_backend)
+
+def main():
+    parser = argparse.ArgumentParser(description="Fill the shared PDF text store from PDF directories")
+    parser.add_argument("sources", nargs="*", default=[str(Path(__file__).parent.parent / "pdfs")],
+                        help="PDF files or directories, searched recursively (default: ../pdfs)")
+    parser.add_argument("--layout", action="store_true", help="Extract -layout text instead of raw text")
+    parser.add_argument("--first-page", action="store_true", help="Only extract the first page")
+    parser.add_argument("--backend", default=DEFAULT_BACKEND, choices=['auto'] + list(BACKENDS),
+                        help=f"Extraction backend (default: {DEFAULT_BACKEND}, from PDF_TEXT_BACKEND)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--timeout", type=float, default=EXTRACTION_TIMEOUT,
+                        help=f"Seconds per PDF (default: {EXTRACTION_TIMEOUT})")
+    parser.add_argument("--quiet", action="store_true", help="Only print failures and the summary")
+    args = parser.parse_args()
+
+    pdfs = find_pdfs(args.sources)
+    if not pdfs:
+        print("No PDFs found")
+        sys.exit(1)
+
+    try:
+        backend = get_backend(args.backend)
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    print(f"📄 {len(pdfs)} PDFs → {PDF_TEXT_STORE_DIR} ({backend.name})\n")
+
+    start = time.monotonic()
+    extracted = stored = failed = 0
+    results = extract_pdfs(pdfs, layout=args.layout, last_page=1 if args.first_page else None,
+                           timeout=args.timeout, workers=args.workers, return_text=False,
+                           backend=backend.name)
+
+    for done, result in enumerate(results, 1):
+        if result.error:
+            failed += 1
+            print(f"  [{done}/{len(pdfs)}] ✗ {result.path}: {result.error}")
+        elif result.extracted:
+            extracted += 1
+            if not args.quiet:
+                print(f"  [{done}/{len(pdfs)}] ✓ {result.path}")
+        else:
+            stored += 1
+
+    elapsed = time.monotonic() - start
+    print(f"\n✅ Extracted {extracted}, already stored {stored}, failed {failed} ({elapsed:.1f}s)")
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()
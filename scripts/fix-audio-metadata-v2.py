@@ -7,6 +7,8 @@ import subprocess
 import re
 from pathlib import Path
 
+from pdf_metadata import extract_pdf_metadata
+
 AUDIO_DIR = Path("/Users/bgerby/Documents/dev/ai/audio-reviews")
 ANALYSIS_DIR = Path("/tmp")
 PDF_DIRS = [
@@ -15,50 +17,10 @@ PDF_DIRS = [
 ]
 
 def extract_title_and_author(pdf_path):
-    """Extract article title and author from PDF."""
+    """Extract article title and author from PDF (first page, via pdf_metadata)."""
     try:
-        result = subprocess.run(
-            ['pdftotext', str(pdf_path), '-'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        text = result.stdout
-
-        # Extract title - usually appears after publication name, before "min read"
-        # Pattern: Publication name · Follow (optional)\n\nTitle\nXX min read · Date\nAuthor
-
-        # Look for the article title (between publication header and "min read")
-        title_match = re.search(
-            r'(?:· Follow publication|Follow)\s*\n\s*\n(.+?)\n\s*\d+\s+min read',
-            text,
-            re.DOTALL
-        )
-
-        if title_match:
-            title = title_match.group(1).strip()
-            # Clean up any remaining newlines within title
-            title = ' '.join(title.split())
-        else:
-            # Fallback: try to find text before "min read"
-            title_match = re.search(r'(.+?)\n\s*\d+\s+min read', text)
-            title = title_match.group(1).strip() if title_match else "Unknown Title"
-            title = ' '.join(title.split())
-
-        # Extract author - appears after "min read · Date"
-        author_match = re.search(
-            r'\d+\s+min read\s+·\s+[A-Z][a-z]+\s+\d+,\s+\d+\s*\n\s*([^\n]+)',
-            text
-        )
-
-        if author_match:
-            author = author_match.group(1).strip()
-            # Remove "Follow", "Listen", "Share" etc that might appear
-            author = re.sub(r'\s*(Follow|Listen|Share|More)\s*$', '', author)
-        else:
-            author = "Unknown Author"
-
-        return title, author
+        metadata = extract_pdf_metadata(pdf_path)
+        return metadata.title or "Unknown Title", metadata.author or "Unknown Author"
 
     except Exception as e:
         print(f"Error extracting from PDF: {e}")
@@ -7,13 +7,36 @@ AI agent initiatives, and generates a comprehensive markdown assessment document
 
 Usage:
     export OPENAI_API_KEY="sk-proj-..."
-    python3 generate-article-assessment.py <pdf_dir> <metadata_json> <output_md>
+    python3 generate-article-assessment.py <pdf_dir> <metadata_json> <output_md> [options]
 
 Arguments:
     pdf_dir: Directory containing article PDFs
     metadata_json: JSON file with article metadata (from monitor/extract scripts)
     output_md: Output path for assessment markdown file
 
+Options:
+    --workers N: Number of articles analyzed concurrently (default: 4)
+    --rpm N: Maximum OpenAI requests per minute across all workers (default: 60)
+    --max-chunk-tokens N: Max article tokens per analysis call (default: 16000)
+    --chunk-workers N: Chunks of one long article analyzed concurrently (default: 4)
+    --reduce-fanin N: Max chunk analyses per synthesis call; more are reduced
+                      hierarchically in groups of N (default: 6)
+    --resume: Skip articles already in the checkpoint journal and rebuild from it
+    --journal PATH: Checkpoint journal (default: <output_md>.journal.jsonl)
+    --batch: Submit all requests through the OpenAI Batch API instead of live
+             calls (for backfills; results can take up to 24h)
+    --batch-poll-interval N: Seconds between batch status checks (default: 60)
+    --batch-base-url URL: Alternate API base URL for batch calls (e.g. a local
+                          stand-in server for testing)
+    --prefilter: Score articles locally against past assessments and tag clear
+                 LOW articles without calling the model (requires numpy)
+    --prefilter-threshold X: Pre-filter score below which an article is
+                             skipped (default: -0.05; lower is more conservative)
+    --assessments-dir DIR: Historical assessments used to train the pre-filter
+                           (default: ../assessments)
+    --no-cache: Don't read or write the on-disk analysis cache
+    --refresh: Ignore cached analyses but store fresh results
+
 Example:
     python3 generate-article-assessment.py \
         /Users/bgerby/Documents/dev/ai/pdfs/optimizely-articles-2025-10-23/ \
@@ -28,10 +51,22 @@ import subprocess
 import re
 import time
 import random
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
+from content_cache import ContentCache, DEFAULT_CACHE_ROOT, content_key
+from pdf_text import read_pdf_text, extract_pdfs
+from content_quality import check_pdf_quality
+from text_chunking import get_token_counter, pack_chunks
+from strategic_context import STRATEGIC_CONTEXT
+from openai_batch import BatchBackend, OpenAIBatchBackend, DEFAULT_POLL_INTERVAL, run_batch
+from relevance_prefilter import RelevancePrefilter, prefiltered_analysis, write_audit_report, PREFILTER_MARKER
+from relevance_prefilter import DEFAULT_THRESHOLD as DEFAULT_PREFILTER_THRESHOLD
+
 # Check for OpenAI package
 try:
     from openai import OpenAI
@@ -40,6 +75,72 @@ except ImportError:
     print("Error: openai package not installed. Install with: pip3 install openai")
     sys.exit(1)
 
+# Model settings (part of every cache key)
+MODEL = "gpt-4-turbo-preview"
+TEMPERATURE = 0.3
+
+# Token budget for chunking (gpt-4-turbo-preview: 128K context, 4K completion)
+MODEL_CONTEXT_TOKENS = 128000
+MAX_COMPLETION_TOKENS = 4096
+MESSAGE_OVERHEAD_TOKENS = 8     # Per-message role/format tokens
+DEFAULT_MAX_CHUNK_TOKENS = 16000  # Keeps per-call latency and focus reasonable
+MAX_CHUNK_TOKENS = DEFAULT_MAX_CHUNK_TOKENS
+COUNT_TOKENS = get_token_counter(MODEL)
+
+# Analysis cache (override with --no-cache / --refresh)
+ANALYSIS_CACHE_DIR = os.path.join(DEFAULT_CACHE_ROOT, "assessments")
+ANALYSIS_CACHE_MAX_MB = 200
+
+# Configured in main(); None disables caching
+ANALYSIS_CACHE: Optional[ContentCache] = None
+
+# Concurrency defaults (override with --workers / --rpm)
+DEFAULT_WORKERS = 4
+DEFAULT_REQUESTS_PER_MINUTE = 60
+
+class RateLimiter:
+    """
+    Thread-safe token bucket shared by every OpenAI request in a run.
+
+    Tokens refill continuously at requests_per_minute / 60 per second, up to
+    `burst` tokens. acquire() blocks until a token is available, so any number
+    of worker threads stay under the same request budget.
+    """
+
+    def __init__(self, requests_per_minute: int, burst: Optional[int] = None):
+        if requests_per_minute < 1:
+            raise ValueError(f"requests_per_minute must be at least 1, got {requests_per_minute}")
+        self.rate = requests_per_minute / 60.0
+        self.capacity = float(burst if burst is not None else max(1, requests_per_minute // 10))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request token is available, then consume it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                wait = (1 - self.tokens) / self.rate
+
+            time.sleep(wait)
+
+# Map-reduce settings for multi-chunk articles (override with --chunk-workers / --reduce-fanin)
+DEFAULT_CHUNK_WORKERS = 4
+DEFAULT_REDUCE_FANIN = 6
+CHUNK_WORKERS = DEFAULT_CHUNK_WORKERS
+REDUCE_FANIN = DEFAULT_REDUCE_FANIN
+
+# Shared by all worker threads (replaced in main() when --rpm is given)
+RATE_LIMITER = RateLimiter(DEFAULT_REQUESTS_PER_MINUTE)
+
 def openai_api_call_with_retry(api_call_func, max_retries=5):
     """
     Wrapper for OpenAI API calls with exponential backoff for rate limits.
@@ -55,6 +156,8 @@ def openai_api_call_with_retry(api_call_func, max_retries=5):
         Last exception if all retries fail
     """
     for attempt in range(max_retries):
+        # Every attempt (including retries) draws from the shared request budget
+        RATE_LIMITER.acquire()
         try:
             return api_call_func()
         except openai.RateLimitError as e:
@@ -76,97 +179,105 @@ def openai_api_call_with_retry(api_call_func, max_retries=5):
             # Other errors, don't retry
             raise
 
-# Path to canonical strategic context in Pivot project
-PIVOT_STRATEGIC_CONTEXT_PATH = "/Users/bgerby/Documents/dev/pivot/sprint-0/STRATEGIC_CONTEXT.md"
+class UsageStats:
+    """
+    Thread-safe record of token usage per API call.
 
-def load_strategic_context() -> str:
+    Tracks cached vs uncached input tokens from the response usage fields
+    (prompt_tokens_details.cached_tokens), to verify prompt-prefix reuse.
     """
-    Load strategic context from canonical Pivot project source with fallback.
 
-    Returns:
-        Strategic context string for AI analysis
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def record(self, label: str, usage):
+        """Record one call's usage (response.usage object or batch usage dict)."""
+        if usage is None:
+            return
+
+        if isinstance(usage, dict):
+            prompt_tokens = usage.get("prompt_tokens", 0)
+            completion_tokens = usage.get("completion_tokens", 0)
+            cached_tokens = (usage.get("prompt_tokens_details") or {}).get("cached_tokens", 0)
+        else:
+            prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+            completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+            details = getattr(usage, "prompt_tokens_details", None)
+            cached_tokens = (getattr(details, "cached_tokens", 0) or 0) if details else 0
+
+        with self.lock:
+            self.calls.append({
+                "label": label,
+                "prompt_tokens": prompt_tokens,
+                "cached_tokens": cached_tokens,
+                "uncached_tokens": prompt_tokens - cached_tokens,
+                "completion_tokens": completion_tokens
+            })
+
+    def totals(self) -> Dict:
+        with self.lock:
+            totals = {"calls": len(self.calls), "prompt_tokens": 0, "cached_tokens": 0,
+                      "uncached_tokens": 0, "completion_tokens": 0}
+            for call in self.calls:
+                for key in ("prompt_tokens", "cached_tokens", "uncached_tokens", "completion_tokens"):
+                    totals[key] += call[key]
+        return totals
+
+    def save(self, path: str):
+        """Write per-call usage and totals to a JSON file."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"model": MODEL, "totals": self.totals(), "calls": self.calls}, f, indent=2)
+
+USAGE_STATS = UsageStats()
+
+def completion_body(messages: List[Dict]) -> Dict:
+    """Request body for a JSON-mode chat completion (live or batch)."""
+    return {
+        "model": MODEL,
+        "messages": messages,
+        "temperature": TEMPERATURE,
+        "response_format": {"type": "json_object"}
+    }
+
+def completion_cache_key(messages: List[Dict]) -> str:
     """
-    try:
-        if os.path.exists(PIVOT_STRATEGIC_CONTEXT_PATH):
-            with open(PIVOT_STRATEGIC_CONTEXT_PATH, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-                # Extract "For AI Analysis & Content Review" section (lines 309-353)
-                match = re.search(
-                    r'## For AI Analysis & Content Review.*?(?=\n---)',
-                    content,
-                    re.DOTALL
-                )
+    Cache key for a completion.
 
-                if match:
-                    context = match.group(0)
-                    print("✓ Loaded strategic context from Pivot project")
-                    return f"""
-Jaxon Digital Strategic Context (Source: Pivot Project)
+    Covers the model, temperature and the fully rendered messages (article
+    text, prompt template and strategic context), so any change to those
+    inputs produces a fresh API call.
+    """
+    return content_key(MODEL, TEMPERATURE, messages)
 
-NOTE: Jaxon Digital is transforming from an Optimizely implementation partner
-to a SaaS platform for AI Operations (October 2025 - 6 month transformation).
+def get_cached_completion(messages: List[Dict]) -> Optional[Dict]:
+    """Return a cached completion result, or None on a miss (or with caching off)."""
+    if ANALYSIS_CACHE is None:
+        return None
+    return ANALYSIS_CACHE.get_json(completion_cache_key(messages))
 
-{context}
+def store_completion(messages: List[Dict], result: Dict):
+    """Store a completion result in ANALYSIS_CACHE (no-op with caching off)."""
+    if ANALYSIS_CACHE is not None:
+        ANALYSIS_CACHE.put_json(completion_cache_key(messages), result)
 
-**Current Focus:**
-- Building AI Operations Platform (SaaS model)
-- Agent orchestration with LangGraph + n8n
-- Agent #19 (Early Warning System) as top priority
-- Product-led growth targeting agencies first
-- Multi-tenant platform architecture
-- Subscription billing and managed services
-"""
+def request_json_completion(client: OpenAI, messages: List[Dict], label: str = "") -> Dict:
+    """Run a JSON-mode chat completion, served from ANALYSIS_CACHE when possible."""
+    cached = get_cached_completion(messages)
+    if cached is not None:
+        return cached
 
-        # Fallback to legacy context
-        print("⚠ Pivot context not found, using legacy strategic context")
-        return JAXON_STRATEGIC_CONTEXT_LEGACY
+    # Wrap API call with retry logic for rate limit handling
+    def make_api_call():
+        return client.chat.completions.create(**completion_body(messages))
 
-    except Exception as e:
-        print(f"⚠ Error loading Pivot context: {e}, using legacy strategic context")
-        return JAXON_STRATEGIC_CONTEXT_LEGACY
-
-# Legacy strategic context (fallback for when Pivot project unavailable)
-JAXON_STRATEGIC_CONTEXT_LEGACY = """
-Jaxon Digital is an Optimizely implementation partner focused on AI agent initiatives:
-
-**Current Focus:**
-- Custom MCP (Model Context Protocol) development for Optimizely DXP operations
-- Building production agents for CMS, Commerce, and DevOps automation
-- Managed agent operations service ($8-20K/month)
-- Custom system integrations ($40-100K per MCP)
-
-**Technology Stack:**
-- Custom MCPs for Optimizely-specific operations
-- n8n for workflow orchestration
-- Multi-MCP orchestration for complex workflows
-- Event-driven proactive monitoring agents
-
-**Relevance Criteria:**
-
-HIGH Priority (⭐⭐⭐⭐⭐):
-- Direct MCP development insights or competitive intelligence
-- AI agent architecture and production patterns
-- Optimizely platform integration strategies
-- Competitive analysis (e.g., other developers building Optimizely MCPs)
-- Event-driven automation and proactive monitoring
-
-MEDIUM Priority (⭐⭐⭐):
-- Optimizely platform features and capabilities
-- DevOps automation and deployment workflows
-- CMS/Commerce enhancements
-- General AI/ML trends applicable to our work
-- Client education topics
-
-LOW Priority (⭐):
-- Niche technical implementations not applicable to our clients
-- Off-topic content (health, finance, etc.)
-- Basic tutorials or beginner content
-- Peripheral technologies unrelated to our stack
-"""
+    response = openai_api_call_with_retry(make_api_call)
+    USAGE_STATS.record(label, getattr(response, "usage", None))
+    result = json.loads(response.choices[0].message.content)
 
-# Load strategic context at module initialization
-JAXON_STRATEGIC_CONTEXT = load_strategic_context()
+    store_completion(messages, result)
+
+    return result
 
 def clean_text_for_analysis(text: str) -> str:
     """Clean extracted PDF text for better analysis."""
@@ -193,19 +304,12 @@ def clean_text_for_analysis(text: str) -> str:
     return text.strip()
 
 def extract_pdf_text(pdf_path: str) -> Optional[str]:
-    """Extract text from PDF using pdftotext."""
+    """Extract text from PDF using pdftotext (via the shared text store)."""
     try:
-        result = subprocess.run(
-            ['pdftotext', pdf_path, '-'],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        if result.returncode == 0:
-            return clean_text_for_analysis(result.stdout)
-        else:
-            print(f"  ⚠ pdftotext failed for {pdf_path}: {result.stderr}")
-            return None
+        return clean_text_for_analysis(read_pdf_text(pdf_path))
+    except subprocess.CalledProcessError as e:
+        print(f"  ⚠ pdftotext failed for {pdf_path}: {e.stderr}")
+        return None
     except subprocess.TimeoutExpired:
         print(f"  ⚠ Timeout extracting text from {pdf_path}")
         return None
@@ -213,67 +317,107 @@ def extract_pdf_text(pdf_path: str) -> Optional[str]:
         print(f"  ⚠ Error extracting text from {pdf_path}: {e}")
         return None
 
-def chunk_text(text: str, max_chars: int = 12000, overlap: int = 500) -> List[str]:
-    """Split text into overlapping chunks for large documents."""
-    if len(text) <= max_chars:
-        return [text]
-
-    chunks = []
-    start = 0
-    while start < len(text):
-        end = start + max_chars
-
-        # Try to break at paragraph boundary
-        if end < len(text):
-            paragraph_break = text.rfind('\n\n', start, end)
-            if paragraph_break > start + (max_chars // 2):
-                end = paragraph_break
+def chunk_token_budget(title: str, url: str, ticket_id: str) -> int:
+    """
+    Tokens available for article content in one chunk analysis call.
 
-        chunks.append(text[start:end])
-        start = end - overlap  # Overlap to maintain context
+    The model's context window minus the reserved completion tokens and
+    everything else in the prompt (instructions, strategic context, article
+    header), capped at MAX_CHUNK_TOKENS.
+    """
+    overhead = sum(
+        COUNT_TOKENS(message["content"]) + MESSAGE_OVERHEAD_TOKENS
+        for message in build_chunk_messages(title, url, "", ticket_id, 99, 99)
+    )
+    available = MODEL_CONTEXT_TOKENS - MAX_COMPLETION_TOKENS - overhead
+    return max(1, min(MAX_CHUNK_TOKENS, available))
 
-    return chunks
+def chunk_text(text: str, max_tokens: int) -> List[str]:
+    """Split text into chunks of at most max_tokens, on paragraph/sentence boundaries."""
+    return pack_chunks(text, max_tokens, COUNT_TOKENS)
 
 def analyze_article(client: OpenAI, title: str, url: str, text: str, ticket_id: str) -> Dict:
     """Analyze a single article using OpenAI API."""
-    # Chunk text if too large
-    chunks = chunk_text(text, max_chars=12000)
+    # Chunk text if it doesn't fit the model's context alongside the prompt
+    chunks = chunk_text(text, chunk_token_budget(title, url, ticket_id))
 
-    # For multi-chunk documents, analyze each chunk and synthesize
+    # For multi-chunk documents, analyze chunks concurrently (map) and synthesize (reduce)
     if len(chunks) > 1:
-        print(f"  → Article split into {len(chunks)} chunks for analysis")
-        chunk_analyses = []
-
-        for i, chunk in enumerate(chunks, 1):
-            analysis = analyze_chunk(client, title, url, chunk, ticket_id, i, len(chunks))
-            if analysis:
-                chunk_analyses.append(analysis)
-            time.sleep(1)  # Rate limiting
-
-        # Synthesize chunk analyses
-        return synthesize_analyses(client, title, url, chunk_analyses, ticket_id)
+        print(f"  → {ticket_id}: Article split into {len(chunks)} chunks for analysis")
+        chunk_analyses = analyze_chunks_concurrently(client, title, url, chunks, ticket_id)
+        return reduce_analyses(client, title, url, chunk_analyses, ticket_id)
     else:
         # Single chunk - direct analysis
         return analyze_chunk(client, title, url, chunks[0], ticket_id, 1, 1)
 
-def analyze_chunk(client: OpenAI, title: str, url: str, text: str, ticket_id: str,
-                  chunk_num: int, total_chunks: int) -> Optional[Dict]:
-    """Analyze a single text chunk."""
-    chunk_context = f" (Part {chunk_num}/{total_chunks})" if total_chunks > 1 else ""
+def analyze_chunks_concurrently(client: OpenAI, title: str, url: str,
+                                chunks: List[str], ticket_id: str) -> List[Dict]:
+    """
+    Analyze all chunks of one article in parallel, preserving chunk order.
 
-    prompt = f"""Analyze this article{chunk_context} for relevance to Jaxon Digital's AI agent initiatives.
+    Requests still draw from the shared RATE_LIMITER, so fanning out a long
+    article never exceeds the run's overall request budget.
+    """
+    results: List[Optional[Dict]] = [None] * len(chunks)
 
-Article: {title}
-URL: {url}
-Ticket: {ticket_id}
+    with ThreadPoolExecutor(max_workers=max(1, min(CHUNK_WORKERS, len(chunks)))) as executor:
+        futures = {
+            executor.submit(analyze_chunk, client, title, url, chunk, ticket_id, i, len(chunks)): i - 1
+            for i, chunk in enumerate(chunks, 1)
+        }
 
-{JAXON_STRATEGIC_CONTEXT}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
 
-Article Content:
-{text[:15000]}
+    return [analysis for analysis in results if analysis]
+
+def reduce_analyses(client: OpenAI, title: str, url: str,
+                    analyses: List[Dict], ticket_id: str) -> Dict:
+    """
+    Synthesize chunk analyses, reducing hierarchically when there are many.
+
+    While there are more than REDUCE_FANIN analyses, consecutive groups of
+    REDUCE_FANIN are synthesized in parallel into intermediate analyses, so
+    no synthesis prompt ever carries more than REDUCE_FANIN inputs.
+    """
+    if not analyses:
+        return merge_chunk_analyses(analyses)
+
+    fanin = max(2, REDUCE_FANIN)
+    level = 1
+
+    while len(analyses) > fanin:
+        groups = [analyses[i:i + fanin] for i in range(0, len(analyses), fanin)]
+        print(f"  → {ticket_id}: Reducing {len(analyses)} analyses in {len(groups)} groups (level {level})")
+
+        def reduce_group(group):
+            if len(group) == 1:
+                return group[0]
+            return synthesize_analyses(client, title, url, group, ticket_id)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(CHUNK_WORKERS, len(groups)))) as executor:
+            analyses = list(executor.map(reduce_group, groups))
+
+        level += 1
+
+    return synthesize_analyses(client, title, url, analyses, ticket_id)
+
+def analysis_system_prefix() -> str:
+    """
+    Stable prompt prefix shared by every chunk and synthesis request in a run.
+
+    Everything that does not vary per article (analyst role and strategic
+    context) comes first, so providers that cache prompt prefixes can reuse
+    it across calls. Per-article content always goes after it.
+    """
+    return f"""You are a strategic analyst for Jaxon Digital, assessing article relevance to AI agent initiatives.
+
+{STRATEGIC_CONTEXT.text}"""
+
+CHUNK_INSTRUCTIONS = """Analyze each article you are given for relevance to Jaxon Digital's AI agent initiatives.
 
 Provide analysis in JSON format:
-{{
+{
   "priority": "HIGH|MEDIUM|LOW",
   "stars": 1-5,
   "relevance_summary": "2-3 sentence summary of why this matters to Jaxon",
@@ -281,7 +425,7 @@ Provide analysis in JSON format:
   "strategic_implications": ["implication 1", "implication 2", ...],
   "action_items": ["action 1", "action 2", ...],
   "topics": ["topic1", "topic2", ...]
-}}
+}
 
 Focus on:
 - Specific technical details and approaches
@@ -290,31 +434,59 @@ Focus on:
 - Client education opportunities
 """
 
-    try:
-        # Wrap API call with retry logic for rate limit handling
-        def make_api_call():
-            return client.chat.completions.create(
-                model="gpt-4-turbo-preview",
-                messages=[
-                    {"role": "system", "content": "You are a strategic analyst for Jaxon Digital, assessing article relevance to AI agent initiatives."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                response_format={"type": "json_object"}
-            )
+SYNTHESIS_INSTRUCTIONS = """You will be given chunk analyses of a multi-part article. Synthesize them into a unified strategic assessment.
+
+Provide unified analysis in JSON format:
+{
+  "priority": "HIGH|MEDIUM|LOW",
+  "stars": 1-5,
+  "relevance_summary": "2-3 sentence comprehensive summary",
+  "key_insights": ["unified insight 1", "unified insight 2", ...],
+  "strategic_implications": ["unified implication 1", ...],
+  "action_items": ["unified action 1", ...],
+  "topics": ["topic1", "topic2", ...]
+}
+
+Combine insights from all chunks, prioritize most important points, remove duplicates.
+"""
 
-        response = openai_api_call_with_retry(make_api_call)
-        analysis = json.loads(response.choices[0].message.content)
-        return analysis
+def build_chunk_messages(title: str, url: str, text: str, ticket_id: str,
+                         chunk_num: int, total_chunks: int) -> List[Dict]:
+    """Build chat messages for analyzing one chunk: stable system prefix, variable article suffix."""
+    chunk_context = f" (Part {chunk_num}/{total_chunks})" if total_chunks > 1 else ""
+
+    prompt = f"""Analyze this article{chunk_context}.
+
+Article: {title}
+URL: {url}
+Ticket: {ticket_id}
+
+Article Content:
+{text}
+"""
+
+    return [
+        {"role": "system", "content": f"{analysis_system_prefix()}\n\n{CHUNK_INSTRUCTIONS}"},
+        {"role": "user", "content": prompt}
+    ]
+
+def analyze_chunk(client: OpenAI, title: str, url: str, text: str, ticket_id: str,
+                  chunk_num: int, total_chunks: int) -> Optional[Dict]:
+    """Analyze a single text chunk."""
+    try:
+        return request_json_completion(
+            client, build_chunk_messages(title, url, text, ticket_id, chunk_num, total_chunks),
+            label=f"{ticket_id}::chunk-{chunk_num}"
+        )
 
     except Exception as e:
         print(f"  ⚠ OpenAI API error for {ticket_id}: {e}")
         return None
 
-def synthesize_analyses(client: OpenAI, title: str, url: str,
-                       chunk_analyses: List[Dict], ticket_id: str) -> Dict:
-    """Synthesize multiple chunk analyses into unified assessment."""
-    synthesis_prompt = f"""Synthesize these chunk analyses into a unified strategic assessment.
+def build_synthesis_messages(title: str, url: str, chunk_analyses: List[Dict],
+                             ticket_id: str) -> List[Dict]:
+    """Build chat messages for synthesizing chunk analyses of one article."""
+    synthesis_prompt = f"""Synthesize these chunk analyses.
 
 Article: {title}
 URL: {url}
@@ -322,38 +494,21 @@ Ticket: {ticket_id}
 
 Chunk Analyses:
 {json.dumps(chunk_analyses, indent=2)}
-
-{JAXON_STRATEGIC_CONTEXT}
-
-Provide unified analysis in JSON format:
-{{
-  "priority": "HIGH|MEDIUM|LOW",
-  "stars": 1-5,
-  "relevance_summary": "2-3 sentence comprehensive summary",
-  "key_insights": ["unified insight 1", "unified insight 2", ...],
-  "strategic_implications": ["unified implication 1", ...],
-  "action_items": ["unified action 1", ...],
-  "topics": ["topic1", "topic2", ...]
-}}
-
-Combine insights from all chunks, prioritize most important points, remove duplicates.
 """
 
-    try:
-        # Wrap API call with retry logic for rate limit handling
-        def make_api_call():
-            return client.chat.completions.create(
-                model="gpt-4-turbo-preview",
-                messages=[
-                    {"role": "system", "content": "You are a strategic analyst synthesizing multi-part article analysis."},
-                    {"role": "user", "content": synthesis_prompt}
-                ],
-                temperature=0.3,
-                response_format={"type": "json_object"}
-            )
+    return [
+        {"role": "system", "content": f"{analysis_system_prefix()}\n\n{SYNTHESIS_INSTRUCTIONS}"},
+        {"role": "user", "content": synthesis_prompt}
+    ]
 
-        response = openai_api_call_with_retry(make_api_call)
-        return json.loads(response.choices[0].message.content)
+def synthesize_analyses(client: OpenAI, title: str, url: str,
+                       chunk_analyses: List[Dict], ticket_id: str) -> Dict:
+    """Synthesize multiple chunk analyses into unified assessment."""
+    try:
+        return request_json_completion(
+            client, build_synthesis_messages(title, url, chunk_analyses, ticket_id),
+            label=f"{ticket_id}::synthesis"
+        )
 
     except Exception as e:
         print(f"  ⚠ Synthesis error for {ticket_id}: {e}")
@@ -416,43 +571,108 @@ def format_article_section(article: Dict, analysis: Dict) -> str:
 {chr(10).join(f"- {action}" for action in analysis.get("action_items", []))}
 
 **Topics:** {", ".join(analysis.get("topics", []))}
-
+{PREFILTER_MARKER + chr(10) if analysis.get("prefiltered") else ""}
 ---
 
 """
     return section
 
-def generate_assessment_document(articles: List[Dict], analyses: Dict,
-                                output_path: str, source: str = "Articles"):
-    """Generate complete assessment markdown document."""
-    # Count priorities
-    priority_counts = {"HIGH": 0, "MEDIUM": 0, "LOW": 0}
-    for analysis in analyses.values():
-        priority = analysis.get("priority", "LOW")
-        priority_counts[priority] = priority_counts.get(priority, 0) + 1
+PRIORITY_SECTIONS = [
+    ("HIGH", "⭐⭐⭐⭐⭐",
+     "These articles have direct relevance to Jaxon's current initiatives and should be reviewed immediately."),
+    ("MEDIUM", "⭐⭐⭐",
+     "These articles have moderate relevance and should be reviewed when time permits."),
+    ("LOW", "⭐",
+     "These articles have minimal relevance to Jaxon's current focus."),
+]
 
-    # Sort articles by priority
-    priority_order = {"HIGH": 0, "MEDIUM": 1, "LOW": 2}
-    sorted_articles = sorted(
-        articles,
-        key=lambda a: (
-            priority_order.get(analyses.get(a.get("ticket_id", ""), {}).get("priority", "LOW"), 3),
-            a.get("ticket_id", "")
-        )
-    )
+class AssessmentWriter:
+    """
+    Streaming writer for the assessment document and its JSON sidecar.
+
+    Each analysis is formatted and appended to a per-priority part file as
+    soon as it is added, so partial results are readable in <output>.parts/
+    during long runs. Only (ticket ID, offset, length) is kept in memory.
+    finalize() assembles the document once, copying sections from the part
+    files sorted by ticket ID within each priority, and writes the same data
+    as structured JSON (<output>.json). Both record the strategic context
+    version, so feedback can be matched to the context it was judged against.
+    """
 
-    # Generate document
-    date = datetime.now().strftime("%Y-%m-%d")
-    doc = f"""# {source} Relevance Assessment
+    def __init__(self, output_path: str, source: str = "Articles", total_articles: int = 0,
+                 context_version: str = "unknown"):
+        self.output_path = output_path
+        self.json_path = str(Path(output_path).with_suffix(".json"))
+        self.source = source
+        self.total_articles = total_articles
+        self.context_version = context_version
+        self.parts_dir = Path(f"{output_path}.parts")
+        self.parts_dir.mkdir(parents=True, exist_ok=True)
+        self.records_path = self.parts_dir / "records.jsonl"
+        self.priority_counts = {"HIGH": 0, "MEDIUM": 0, "LOW": 0}
+        self.sections = {}  # ticket_id -> (priority, offset, length) in the priority part file
+        self.records = {}   # ticket_id -> (offset, length) in records.jsonl
+        self.lock = threading.Lock()
+
+        # Start from empty part files (a previous run's parts are stale)
+        for priority, _, _ in PRIORITY_SECTIONS:
+            open(self.part_path(priority), 'wb').close()
+        open(self.records_path, 'wb').close()
+
+    def part_path(self, priority: str) -> Path:
+        return self.parts_dir / f"{priority}.md"
+
+    def add(self, article: Dict, analysis: Dict):
+        """Append one article's section and JSON record. Thread-safe."""
+        ticket_id = article.get("ticket_id", "UNKNOWN")
+        priority = analysis.get("priority", "LOW")
+        section = format_article_section(article, analysis).encode('utf-8')
+        record = (json.dumps({
+            "ticket_id": ticket_id,
+            "title": article.get("title", "Unknown Title"),
+            "url": article.get("url", "Unknown URL"),
+            "author": article.get("author", "Unknown"),
+            "published_date": article.get("published_date", "Unknown"),
+            "analysis": analysis
+        }, ensure_ascii=False) + "\n").encode('utf-8')
+
+        with self.lock:
+            if ticket_id in self.records:
+                # Re-added (e.g. retried) - the newest analysis wins
+                previous = self.sections.pop(ticket_id, None)
+                if previous:
+                    self.priority_counts[previous[0]] -= 1
+
+            self.priority_counts[priority] = self.priority_counts.get(priority, 0) + 1
+            self.records[ticket_id] = self._append(self.records_path, record)
+
+            # Only the three known priorities get a document section
+            if priority in ("HIGH", "MEDIUM", "LOW"):
+                offset, length = self._append(self.part_path(priority), section)
+                self.sections[ticket_id] = (priority, offset, length)
+
+    @staticmethod
+    def _append(path: Path, data: bytes) -> Tuple[int, int]:
+        """Append data to path and return (offset, length)."""
+        with open(path, 'ab') as f:
+            offset = f.tell()
+            f.write(data)
+            f.flush()
+        return offset, len(data)
+
+    def header(self) -> str:
+        date = datetime.now().strftime("%Y-%m-%d")
+        return f"""# {self.source} Relevance Assessment
 
 **Date:** {date}
-**Total Articles:** {len(articles)}
+**Total Articles:** {self.total_articles}
+**Strategic Context Version:** {self.context_version}
 
 ## Summary Statistics
 
-- **HIGH Priority:** {priority_counts['HIGH']} articles ⭐⭐⭐⭐⭐
-- **MEDIUM Priority:** {priority_counts['MEDIUM']} articles ⭐⭐⭐
-- **LOW Priority:** {priority_counts['LOW']} articles ⭐
+- **HIGH Priority:** {self.priority_counts['HIGH']} articles ⭐⭐⭐⭐⭐
+- **MEDIUM Priority:** {self.priority_counts['MEDIUM']} articles ⭐⭐⭐
+- **LOW Priority:** {self.priority_counts['LOW']} articles ⭐
 
 ## Assessment Methodology
 
@@ -464,59 +684,77 @@ Articles were analyzed against Jaxon Digital's strategic focus areas:
 
 ---
 
-## HIGH Priority Articles (⭐⭐⭐⭐⭐)
-
-These articles have direct relevance to Jaxon's current initiatives and should be reviewed immediately.
-
 """
 
-    # Add HIGH priority articles
-    high_articles = [a for a in sorted_articles if analyses.get(a.get("ticket_id", ""), {}).get("priority") == "HIGH"]
-    if high_articles:
-        for article in high_articles:
-            ticket_id = article.get("ticket_id", "UNKNOWN")
-            if ticket_id in analyses:
-                doc += format_article_section(article, analyses[ticket_id])
-    else:
-        doc += "No HIGH priority articles in this batch.\n\n---\n\n"
+    def finalize(self):
+        """Assemble the markdown document and JSON sidecar, then drop the part files."""
+        with self.lock:
+            self._write_document()
+            self._write_json()
 
-    # Add MEDIUM priority articles
-    doc += """## MEDIUM Priority Articles (⭐⭐⭐)
+        for path in self.parts_dir.iterdir():
+            path.unlink()
+        self.parts_dir.rmdir()
 
-These articles have moderate relevance and should be reviewed when time permits.
+        print(f"\n✓ Assessment document written to: {self.output_path}")
+        print(f"✓ Structured results written to: {self.json_path}")
 
-"""
-
-    medium_articles = [a for a in sorted_articles if analyses.get(a.get("ticket_id", ""), {}).get("priority") == "MEDIUM"]
-    if medium_articles:
-        for article in medium_articles:
-            ticket_id = article.get("ticket_id", "UNKNOWN")
-            if ticket_id in analyses:
-                doc += format_article_section(article, analyses[ticket_id])
-    else:
-        doc += "No MEDIUM priority articles in this batch.\n\n---\n\n"
+    def _write_document(self):
+        temp_path = f"{self.output_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as out:
+            out.write(self.header())
 
-    # Add LOW priority articles
-    doc += """## LOW Priority Articles (⭐)
+            for priority, stars, description in PRIORITY_SECTIONS:
+                out.write(f"## {priority} Priority Articles ({stars})\n\n{description}\n\n")
 
-These articles have minimal relevance to Jaxon's current focus.
-
-"""
-
-    low_articles = [a for a in sorted_articles if analyses.get(a.get("ticket_id", ""), {}).get("priority") == "LOW"]
-    if low_articles:
-        for article in low_articles:
-            ticket_id = article.get("ticket_id", "UNKNOWN")
-            if ticket_id in analyses:
-                doc += format_article_section(article, analyses[ticket_id])
-    else:
-        doc += "No LOW priority articles in this batch.\n\n"
-
-    # Write to file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(doc)
+                entries = sorted(
+                    (ticket_id, offset, length)
+                    for ticket_id, (section_priority, offset, length) in self.sections.items()
+                    if section_priority == priority
+                )
+                if not entries:
+                    trailer = "\n---\n\n" if priority != "LOW" else "\n"
+                    out.write(f"No {priority} priority articles in this batch.\n{trailer}")
+                    continue
+
+                with open(self.part_path(priority), 'rb') as part:
+                    for _, offset, length in entries:
+                        part.seek(offset)
+                        out.write(part.read(length).decode('utf-8'))
+
+        os.replace(temp_path, self.output_path)
+
+    def _write_json(self):
+        """Stream records into one JSON document, in document order."""
+        priority_order = {priority: n for n, (priority, _, _) in enumerate(PRIORITY_SECTIONS)}
+        order = sorted(
+            self.records,
+            key=lambda ticket_id: (
+                priority_order.get(self.sections.get(ticket_id, ("",))[0], len(priority_order)),
+                ticket_id
+            )
+        )
 
-    print(f"\n✓ Assessment document written to: {output_path}")
+        temp_path = f"{self.json_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as out, open(self.records_path, 'rb') as records:
+            summary = {
+                "source": self.source,
+                "date": datetime.now().strftime("%Y-%m-%d"),
+                "total_articles": self.total_articles,
+                "strategic_context_version": self.context_version,
+                "priority_counts": self.priority_counts
+            }
+            out.write("{\n")
+            for key, value in summary.items():
+                out.write(f"  {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)},\n")
+            out.write('  "articles": [')
+            for n, ticket_id in enumerate(order):
+                offset, length = self.records[ticket_id]
+                records.seek(offset)
+                out.write(("," if n else "") + "\n    " + records.read(length).decode('utf-8').rstrip("\n"))
+            out.write("\n  ]\n}\n")
+
+        os.replace(temp_path, self.json_path)
 
 def enrich_metadata_with_tickets(articles: List[Dict], state_file: str = "~/.optimizely-blog-state.json") -> List[Dict]:
     """Enrich article metadata with ticket IDs from state file."""
@@ -572,14 +810,457 @@ def enrich_metadata_with_tickets(articles: List[Dict], state_file: str = "~/.opt
 
     return enriched
 
-def main():
-    if len(sys.argv) != 4:
-        print(__doc__)
-        sys.exit(1)
+def find_article_pdf(article: Dict, pdf_dir: str, index: int) -> Optional[Path]:
+    """The article's PDF in pdf_dir (by its pdf_filename glob), or None."""
+    pdf_filename = article.get("pdf_filename", f"{index:02d}-*.pdf")
+    pdf_files = list(Path(pdf_dir).glob(pdf_filename if '*' in pdf_filename else f"*{pdf_filename}*"))
+    return pdf_files[0] if pdf_files else None
+
+def load_article_text(article: Dict, pdf_dir: str, index: int) -> Optional[str]:
+    """Get cleaned article text from metadata or the matching PDF."""
+    ticket_id = article.get("ticket_id", f"UNKNOWN-{index}")
+
+    # Already loaded by an earlier stage (e.g. the relevance pre-filter)
+    if article.get("cleaned_text"):
+        return article["cleaned_text"]
+    pdf_filename = article.get("pdf_filename", f"{index:02d}-*.pdf")
+
+    # Check if article has text directly in metadata (e.g., FreeCodeCamp from RSS)
+    if "article_text" in article and article["article_text"]:
+        text = clean_text_for_analysis(article["article_text"])
+        print(f"  {ticket_id}: Using article text from metadata ({len(text)} characters)")
+        return text
+
+    # Fall back to PDF extraction (Medium, Optimizely, Anthropic)
+    pdf_file = find_article_pdf(article, pdf_dir, index)
+
+    if not pdf_file:
+        print(f"  ⚠ {ticket_id}: PDF not found: {pdf_filename}")
+        return None
+
+    pdf_path = str(pdf_file)
+
+    # Reject paywalled, empty or broken captures before any API spend
+    quality = check_pdf_quality(pdf_path)
+    if quality['verdict'] == 'reject':
+        print(f"  ⚠ {ticket_id}: Skipping PDF ({quality['summary']})")
+        return None
+    if quality['verdict'] == 'suspicious':
+        print(f"  ⚠ {ticket_id}: PDF looks suspicious ({quality['summary']})")
+
+    # Extract text
+    text = extract_pdf_text(pdf_path)
+    if not text:
+        print(f"  ⚠ {ticket_id}: Could not extract text from PDF")
+        return None
+
+    print(f"  {ticket_id}: Extracted {len(text)} characters from PDF")
+    return text
+
+def assess_article(client: OpenAI, article: Dict, pdf_dir: str, index: int, total: int) -> Optional[Dict]:
+    """Load and analyze one article. Runs inside a worker thread."""
+    ticket_id = article.get("ticket_id", f"UNKNOWN-{index}")
+    title = article.get("title", "Unknown Title")
+    url = article.get("url", "")
+
+    print(f"[{index}/{total}] {ticket_id}: {title[:50]}...")
+
+    text = load_article_text(article, pdf_dir, index)
+    if not text:
+        return None
+
+    # Analyze with OpenAI
+    analysis = analyze_article(client, title, url, text, ticket_id)
+    if analysis:
+        print(f"  ✓ {ticket_id}: Analysis complete: {analysis.get('priority', 'UNKNOWN')}")
+    else:
+        print(f"  ⚠ {ticket_id}: Analysis failed")
+
+    return analysis
+
+def prefilter_articles(articles: List[Dict], pdf_dir: str, assessments_dir: str,
+                       threshold: float, report_path: str,
+                       completed: Optional[Dict[str, Dict]] = None) -> Dict[str, Dict]:
+    """
+    Tag clear LOW articles locally before any model call.
+
+    Every pending article is scored against historical HIGH/LOW assessments
+    (see relevance_prefilter). Articles below the threshold get a LOW analysis
+    marked "prefiltered"; the rest are left for the model. Loaded text is kept
+    on the article so the analysis stage doesn't extract it again. All scores
+    and decisions are written to report_path for auditing.
+
+    Returns:
+        Dict of ticket ID -> synthesized LOW analysis for skipped articles
+    """
+    try:
+        prefilter = RelevancePrefilter.from_assessments(assessments_dir, STRATEGIC_CONTEXT.text)
+    except (RuntimeError, ValueError) as e:
+        print(f"⚠ Pre-filter disabled: {e}")
+        return {}
+
+    todo = [(i, article) for i, article in enumerate(articles, 1)
+             if not (completed and article.get("ticket_id", f"UNKNOWN-{i}") in completed)]
+
+    # Extract the PDFs in parallel processes first; loading below then reads the text store
+    pdfs = [find_article_pdf(article, pdf_dir, i) for i, article in todo
+            if not article.get("article_text") and not article.get("cleaned_text")]
+    pdfs = [pdf for pdf in pdfs if pdf]
+    if pdfs:
+        print(f"Pre-filter: extracting {len(pdfs)} PDFs...")
+        try:
+            for _ in extract_pdfs(pdfs, return_text=False):
+                pass
+        except FileNotFoundError as e:
+            print(f"  ⚠ Parallel extraction unavailable ({e}); extracting one at a time")
+
+    pending = []
+    for i, article in todo:
+        ticket_id = article.get("ticket_id", f"UNKNOWN-{i}")
+        text = load_article_text(article, pdf_dir, i)
+        if not text:
+            continue
+        article["cleaned_text"] = text
+        pending.append((ticket_id, article))
+
+    if not pending:
+        return {}
+
+    scores = prefilter.score([(article.get("title", ""), article["cleaned_text"]) for _, article in pending])
+
+    skipped = {}
+    rows = []
+    for (ticket_id, article), score in zip(pending, scores):
+        title = article.get("title", "Unknown Title")
+        terms = prefilter.top_terms(f"{title} {article['cleaned_text']}")
+        if score < threshold:
+            skipped[ticket_id] = prefiltered_analysis(score, threshold, terms)
+        rows.append({
+            "ticket_id": ticket_id,
+            "title": title,
+            "score": float(score),
+            "skipped": score < threshold,
+            "terms": terms
+        })
+
+    write_audit_report(report_path, rows, threshold, source=assessments_dir)
+    print(f"Pre-filter: {len(skipped)} of {len(pending)} articles tagged LOW locally "
+          f"(threshold {threshold}); audit: {report_path}\n")
+
+    return skipped
+
+class CheckpointJournal:
+    """
+    Append-only JSONL journal of completed article analyses.
+
+    One line is written (and fsynced) per successful analysis, so a run that
+    dies partway through can be continued with --resume and the markdown
+    rebuilt without repeating finished articles.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+
+    def load(self) -> Dict[str, Dict]:
+        """Return completed analyses keyed by ticket ID (later entries win)."""
+        completed = {}
+        if not os.path.exists(self.path):
+            return completed
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        for line_num, line in enumerate(content.splitlines(), 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+                completed[entry["ticket_id"]] = entry["analysis"]
+            except (ValueError, KeyError):
+                # A crash mid-write can leave a truncated final line
+                print(f"  ⚠ Skipping unreadable journal line {line_num} in {self.path}")
+
+        # Terminate a truncated final line so new entries start on their own line
+        if content and not content.endswith("\n"):
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write("\n")
+
+        return completed
+
+    def reset(self):
+        """Start a fresh journal for a new (non-resumed) run."""
+        with self.lock:
+            open(self.path, 'w', encoding='utf-8').close()
+
+    def append(self, article: Dict, analysis: Dict):
+        """Durably record one completed analysis."""
+        entry = {
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "ticket_id": article.get("ticket_id"),
+            "title": article.get("title"),
+            "url": article.get("url"),
+            "analysis": analysis
+        }
+
+        with self.lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+def analyze_articles_concurrently(client: OpenAI, articles: List[Dict], pdf_dir: str,
+                                  workers: int = DEFAULT_WORKERS,
+                                  journal: Optional[CheckpointJournal] = None,
+                                  completed: Optional[Dict[str, Dict]] = None,
+                                  writer: Optional[AssessmentWriter] = None) -> Dict:
+    """
+    Analyze articles on a bounded thread pool.
+
+    Requests are paced by the shared RATE_LIMITER, so the worker count only
+    bounds how many articles are in flight. Articles already in `completed`
+    (from a resumed journal) are reused instead of re-analyzed, and each new
+    analysis is appended to `journal` (and streamed to `writer`) as soon as
+    it finishes. Results are
+    returned keyed by ticket ID in metadata order, regardless of completion
+    order.
+    """
+    results = dict(completed or {})
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {}
+        for i, article in enumerate(articles, 1):
+            ticket_id = article.get("ticket_id", f"UNKNOWN-{i}")
+            if ticket_id in results:
+                reason = "pre-filtered as LOW" if results[ticket_id].get("prefiltered") else "journal"
+                print(f"[{i}/{len(articles)}] {ticket_id}: Already analyzed ({reason}), skipping")
+                continue
+            future = executor.submit(assess_article, client, article, pdf_dir, i, len(articles))
+            futures[future] = (ticket_id, article)
+
+        for future in as_completed(futures):
+            ticket_id, article = futures[future]
+            try:
+                analysis = future.result()
+            except Exception as e:
+                print(f"  ⚠ {ticket_id}: Unexpected error: {e}")
+                continue
+
+            if analysis:
+                results[ticket_id] = analysis
+                if journal is not None:
+                    journal.append(article, analysis)
+                if writer is not None:
+                    writer.add(article, analysis)
+
+    return order_analyses(articles, results)
+
+def order_analyses(articles: List[Dict], results: Dict[str, Dict]) -> Dict:
+    """Key analyses by ticket ID in metadata order (deterministic document and summary)."""
+    analyses = {}
+    for i, article in enumerate(articles, 1):
+        ticket_id = article.get("ticket_id", f"UNKNOWN-{i}")
+        if ticket_id in results:
+            analyses[ticket_id] = results[ticket_id]
 
-    pdf_dir = sys.argv[1]
-    metadata_json = sys.argv[2]
-    output_md = sys.argv[3]
+    return analyses
+
+def parse_completion_body(body: Optional[Dict]) -> Optional[Dict]:
+    """Extract the JSON analysis from a chat completion response body."""
+    if not body:
+        return None
+    try:
+        return json.loads(body["choices"][0]["message"]["content"])
+    except (KeyError, IndexError, TypeError, ValueError):
+        return None
+
+def run_completion_batch(backend: BatchBackend, work_dir: str, label: str,
+                         requests: Dict[str, List[Dict]], poll_interval: int) -> Dict[str, Optional[Dict]]:
+    """Serve requests (custom_id -> messages) from the cache and batch the rest."""
+    results = {}
+    pending = []
+
+    for custom_id, messages in requests.items():
+        cached = get_cached_completion(messages)
+        if cached is not None:
+            results[custom_id] = cached
+        else:
+            pending.append((custom_id, messages))
+
+    if pending:
+        responses = run_batch(
+            backend, [(custom_id, completion_body(messages)) for custom_id, messages in pending],
+            work_dir, label=label, poll_interval=poll_interval
+        )
+        for custom_id, messages in pending:
+            body = responses.get(custom_id)
+            if body:
+                USAGE_STATS.record(custom_id, body.get("usage"))
+            result = parse_completion_body(body)
+            if result is not None:
+                store_completion(messages, result)
+            results[custom_id] = result
+
+    return results
+
+def analyze_articles_batch(articles: List[Dict], pdf_dir: str, backend: BatchBackend,
+                           work_dir: str, poll_interval: int = DEFAULT_POLL_INTERVAL,
+                           journal: Optional[CheckpointJournal] = None,
+                           completed: Optional[Dict[str, Dict]] = None,
+                           writer: Optional[AssessmentWriter] = None) -> Dict:
+    """
+    Analyze articles through the Batch API instead of live calls.
+
+    The first batch carries every chunk of every pending article. Each later
+    batch carries the synthesis requests for multi-chunk articles, grouped by
+    REDUCE_FANIN exactly like reduce_analyses(), until every article has a
+    single analysis. Cached completions are reused and never submitted.
+    Results are merged into the same analyses structure as live mode.
+    """
+    results = dict(completed or {})
+    jobs = {}
+
+    for i, article in enumerate(articles, 1):
+        ticket_id = article.get("ticket_id", f"UNKNOWN-{i}")
+        title = article.get("title", "Unknown Title")
+        url = article.get("url", "")
+
+        if ticket_id in results:
+            reason = "pre-filtered as LOW" if results[ticket_id].get("prefiltered") else "journal"
+            print(f"[{i}/{len(articles)}] {ticket_id}: Already analyzed ({reason}), skipping")
+            continue
+
+        print(f"[{i}/{len(articles)}] {ticket_id}: {title[:50]}...")
+        text = load_article_text(article, pdf_dir, i)
+        if not text:
+            continue
+
+        chunks = chunk_text(text, chunk_token_budget(title, url, ticket_id))
+        jobs[ticket_id] = {"title": title, "url": url, "article": article, "chunks": chunks}
+
+    Path(work_dir).mkdir(parents=True, exist_ok=True)
+
+    # Map: one request per chunk across all articles
+    requests = {}
+    for ticket_id, job in jobs.items():
+        total = len(job["chunks"])
+        for n, chunk in enumerate(job["chunks"], 1):
+            requests[f"{ticket_id}::chunk-{n}"] = build_chunk_messages(
+                job["title"], job["url"], chunk, ticket_id, n, total
+            )
+
+    responses = run_completion_batch(backend, work_dir, "chunks", requests, poll_interval)
+
+    for ticket_id, job in jobs.items():
+        chunk_results = [responses.get(f"{ticket_id}::chunk-{n}") for n in range(1, len(job["chunks"]) + 1)]
+        job["analyses"] = [analysis for analysis in chunk_results if analysis]
+        # Single-chunk articles are analyzed directly; multi-chunk ones need synthesis
+        job["final"] = len(job["chunks"]) == 1
+
+    # Reduce: one batch per level of the synthesis tree
+    fanin = max(2, REDUCE_FANIN)
+    level = 1
+    while True:
+        reducing = {tid: job for tid, job in jobs.items() if not job["final"] and job["analyses"]}
+        if not reducing:
+            break
+
+        requests = {}
+        groups_by_ticket = {}
+        for ticket_id, job in reducing.items():
+            analyses = job["analyses"]
+            groups = [analyses[i:i + fanin] for i in range(0, len(analyses), fanin)]
+            groups_by_ticket[ticket_id] = groups
+
+            for g, group in enumerate(groups):
+                # Lone leftovers pass through, except the final synthesis
+                if len(group) > 1 or len(groups) == 1:
+                    requests[f"{ticket_id}::reduce-{level}-{g}"] = build_synthesis_messages(
+                        job["title"], job["url"], group, ticket_id
+                    )
+
+        responses = run_completion_batch(backend, work_dir, f"reduce-{level}", requests, poll_interval)
+
+        for ticket_id, groups in groups_by_ticket.items():
+            reduced = []
+            for g, group in enumerate(groups):
+                custom_id = f"{ticket_id}::reduce-{level}-{g}"
+                if custom_id in requests:
+                    # Fallback: merge naively if the synthesis request failed
+                    reduced.append(responses.get(custom_id) or merge_chunk_analyses(group))
+                else:
+                    reduced.append(group[0])
+
+            jobs[ticket_id]["analyses"] = reduced
+            jobs[ticket_id]["final"] = len(groups) == 1
+
+        level += 1
+
+    for ticket_id, job in jobs.items():
+        if not job["analyses"]:
+            print(f"  ⚠ {ticket_id}: Analysis failed")
+            continue
+
+        analysis = job["analyses"][0]
+        results[ticket_id] = analysis
+        print(f"  ✓ {ticket_id}: Analysis complete: {analysis.get('priority', 'UNKNOWN')}")
+        if journal is not None:
+            journal.append(job["article"], analysis)
+        if writer is not None:
+            writer.add(job["article"], analysis)
+
+    return order_analyses(articles, results)
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate strategic relevance assessment for article PDFs",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument("pdf_dir", help="Directory containing article PDFs")
+    parser.add_argument("metadata_json", help="JSON file with article metadata")
+    parser.add_argument("output_md", help="Output path for assessment markdown file")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Articles analyzed concurrently (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--rpm", type=int, default=DEFAULT_REQUESTS_PER_MINUTE,
+                        help=f"Max OpenAI requests per minute (default: {DEFAULT_REQUESTS_PER_MINUTE})")
+    parser.add_argument("--max-chunk-tokens", type=int, default=DEFAULT_MAX_CHUNK_TOKENS,
+                        help=f"Max article tokens per analysis call (default: {DEFAULT_MAX_CHUNK_TOKENS})")
+    parser.add_argument("--chunk-workers", type=int, default=DEFAULT_CHUNK_WORKERS,
+                        help=f"Chunks of one article analyzed concurrently (default: {DEFAULT_CHUNK_WORKERS})")
+    parser.add_argument("--reduce-fanin", type=int, default=DEFAULT_REDUCE_FANIN,
+                        help=f"Max analyses per synthesis call (default: {DEFAULT_REDUCE_FANIN})")
+    parser.add_argument("--resume", action="store_true",
+                        help="Skip articles already in the checkpoint journal and rebuild from it")
+    parser.add_argument("--journal", default=None,
+                        help="Checkpoint journal path (default: <output_md>.journal.jsonl)")
+    parser.add_argument("--batch", action="store_true",
+                        help="Submit all requests through the OpenAI Batch API (for large backfills)")
+    parser.add_argument("--batch-poll-interval", type=int, default=DEFAULT_POLL_INTERVAL,
+                        help=f"Seconds between batch status checks (default: {DEFAULT_POLL_INTERVAL})")
+    parser.add_argument("--batch-base-url", default=None,
+                        help="Alternate API base URL for batch calls (e.g. a local stand-in server)")
+    parser.add_argument("--prefilter", action="store_true",
+                        help="Tag clear LOW articles locally before calling the model (requires numpy)")
+    parser.add_argument("--prefilter-threshold", type=float, default=DEFAULT_PREFILTER_THRESHOLD,
+                        help=f"Pre-filter skip threshold (default: {DEFAULT_PREFILTER_THRESHOLD})")
+    parser.add_argument("--assessments-dir", default=str(Path(__file__).parent.parent / "assessments"),
+                        help="Historical assessments used to train the pre-filter")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Don't read or write the on-disk analysis cache")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Ignore cached analyses but store fresh results")
+
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error(f"--workers must be at least 1 (got {args.workers})")
+    if args.rpm < 1:
+        parser.error(f"--rpm must be at least 1 (got {args.rpm})")
+
+    pdf_dir = args.pdf_dir
+    metadata_json = args.metadata_json
+    output_md = args.output_md
 
     # Check OpenAI API key
     api_key = os.environ.get("OPENAI_API_KEY")
@@ -588,9 +1269,25 @@ def main():
         print("Set it with: export OPENAI_API_KEY='sk-proj-...'")
         sys.exit(1)
 
-    # Initialize OpenAI client
+    # Initialize OpenAI client and shared rate limiter
     client = OpenAI(api_key=api_key)
 
+    global RATE_LIMITER, ANALYSIS_CACHE, CHUNK_WORKERS, REDUCE_FANIN, MAX_CHUNK_TOKENS
+    RATE_LIMITER = RateLimiter(args.rpm)
+    CHUNK_WORKERS = args.chunk_workers
+    REDUCE_FANIN = args.reduce_fanin
+    MAX_CHUNK_TOKENS = args.max_chunk_tokens
+
+    if not args.no_cache:
+        ANALYSIS_CACHE = ContentCache(
+            ANALYSIS_CACHE_DIR,
+            max_bytes=ANALYSIS_CACHE_MAX_MB * 1024 * 1024,
+            read=not args.refresh
+        )
+
+    # Load strategic context once up front (memoized for all worker threads)
+    print(f"Strategic context version: {STRATEGIC_CONTEXT.version}")
+
     # Load metadata
     print(f"Loading article metadata from {metadata_json}...")
     try:
@@ -616,57 +1313,22 @@ def main():
     articles = enrich_metadata_with_tickets(articles)
     print(f"Enriched articles with ticket IDs\n")
 
-    # Process each article
-    analyses = {}
-    for i, article in enumerate(articles, 1):
-        ticket_id = article.get("ticket_id", f"UNKNOWN-{i}")
-        title = article.get("title", "Unknown Title")
-        url = article.get("url", "")
-        pdf_filename = article.get("pdf_filename", f"{i:02d}-*.pdf")
-
-        print(f"[{i}/{len(articles)}] {ticket_id}: {title[:50]}...")
-
-        # Check if article has text directly in metadata (e.g., FreeCodeCamp from RSS)
-        text = None
-        if "article_text" in article and article["article_text"]:
-            text = clean_text_for_analysis(article["article_text"])
-            print(f"  → Using article text from metadata ({len(text)} characters)")
-        else:
-            # Fall back to PDF extraction (Medium, Optimizely, Anthropic)
-            # Find PDF file
-            pdf_pattern = Path(pdf_dir) / pdf_filename
-            pdf_files = list(Path(pdf_dir).glob(pdf_filename if '*' in pdf_filename else f"*{pdf_filename}*"))
-
-            if not pdf_files:
-                print(f"  ⚠ PDF not found: {pdf_filename}")
-                continue
-
-            pdf_path = str(pdf_files[0])
-
-            # Extract text
-            text = extract_pdf_text(pdf_path)
-            if not text:
-                print(f"  ⚠ Could not extract text from PDF")
-                continue
-
-            print(f"  → Extracted {len(text)} characters from PDF")
-
-        # Analyze with OpenAI
-        analysis = analyze_article(client, title, url, text, ticket_id)
-        if analysis:
-            analyses[ticket_id] = analysis
-            priority = analysis.get("priority", "UNKNOWN")
-            print(f"  ✓ Analysis complete: {priority}")
-        else:
-            print(f"  ⚠ Analysis failed")
-
-        # Rate limiting
-        time.sleep(1)
+    # Checkpoint journal: resume from it, or start a fresh one
+    journal = CheckpointJournal(args.journal or f"{output_md}.journal.jsonl")
+    completed = {}
+    if args.resume:
+        completed = journal.load()
+        print(f"Resuming: {len(completed)} analyses loaded from {journal.path}")
+    else:
+        journal.reset()
 
-    # Generate assessment document
-    print(f"\n{'='*60}")
-    print("GENERATING ASSESSMENT DOCUMENT")
-    print(f"{'='*60}\n")
+    # Cheap local pass: tag obvious LOW articles so they never reach the model
+    if args.prefilter:
+        prefiltered = prefilter_articles(
+            articles, pdf_dir, args.assessments_dir, args.prefilter_threshold,
+            f"{output_md}.prefilter.md", completed=completed
+        )
+        completed.update(prefiltered)
 
     # Detect source from directory path or article metadata
     if "optimizely" in pdf_dir.lower():
@@ -676,7 +1338,39 @@ def main():
     else:
         source = "Medium Articles"
 
-    generate_assessment_document(articles, analyses, output_md, source)
+    # Stream sections to disk as analyses arrive (journaled and pre-filtered ones first)
+    writer = AssessmentWriter(output_md, source, total_articles=len(articles),
+                              context_version=STRATEGIC_CONTEXT.version)
+    for i, article in enumerate(articles, 1):
+        ticket_id = article.get("ticket_id", f"UNKNOWN-{i}")
+        if ticket_id in completed:
+            writer.add(article, completed[ticket_id])
+    print(f"Partial results: {writer.parts_dir}/\n")
+
+    if args.batch:
+        # Offline mode: submit everything through the Batch API and poll
+        batch_client = OpenAI(api_key=api_key, base_url=args.batch_base_url) if args.batch_base_url else client
+        backend = OpenAIBatchBackend(batch_client)
+        work_dir = f"{output_md}.batch"
+        print(f"Analyzing via Batch API (work dir: {work_dir})\n")
+        analyses = analyze_articles_batch(
+            articles, pdf_dir, backend, work_dir, args.batch_poll_interval,
+            journal=journal, completed=completed, writer=writer
+        )
+    else:
+        # Process articles concurrently (bounded by --workers, paced by --rpm)
+        print(f"Analyzing with {args.workers} workers at up to {args.rpm} requests/minute\n")
+        analyses = analyze_articles_concurrently(
+            client, articles, pdf_dir, args.workers, journal=journal, completed=completed,
+            writer=writer
+        )
+
+    # Generate assessment document
+    print(f"\n{'='*60}")
+    print("GENERATING ASSESSMENT DOCUMENT")
+    print(f"{'='*60}\n")
+
+    writer.finalize()
 
     # Summary
     print(f"\n{'='*60}")
@@ -685,6 +1379,21 @@ def main():
     print(f"Total articles: {len(articles)}")
     print(f"Successfully analyzed: {len(analyses)}")
     print(f"Failed: {len(articles) - len(analyses)}")
+    if args.prefilter:
+        skipped = sum(1 for analysis in analyses.values() if analysis.get("prefiltered"))
+        print(f"Pre-filtered as LOW (no API call): {skipped}")
+    if ANALYSIS_CACHE is not None:
+        print(f"Cache: {ANALYSIS_CACHE.hits} hits, {ANALYSIS_CACHE.misses} misses ({ANALYSIS_CACHE_DIR})")
+
+    usage = USAGE_STATS.totals()
+    if usage["calls"]:
+        usage_path = f"{output_md}.usage.json"
+        USAGE_STATS.save(usage_path)
+        cached_pct = 100.0 * usage["cached_tokens"] / max(1, usage["prompt_tokens"])
+        print(f"API calls: {usage['calls']}")
+        print(f"Input tokens: {usage['prompt_tokens']:,} ({usage['cached_tokens']:,} cached, {cached_pct:.0f}%)")
+        print(f"Output tokens: {usage['completion_tokens']:,}")
+        print(f"Per-call usage saved to: {usage_path}")
 
     priority_counts = {"HIGH": 0, "MEDIUM": 0, "LOW": 0}
     for analysis in analyses.values():
@@ -10,6 +10,13 @@ import subprocess
 import re
 from pathlib import Path
 
+from tts_client import get_tts_client, split_for_tts
+from audio_assembly import assemble_mp3
+from episode_sources import save_episode_source
+from speech_cleaning import ARTICLE_CLEANER
+from pdf_text import read_pdf_text
+from pdf_metadata import extract_pdf_metadata
+
 # Configuration
 PDF_DIRS = [
     Path("/Users/bgerby/Documents/dev/ai/pdfs/medium-articles-2025-10-16"),
@@ -22,116 +29,24 @@ ANALYSIS_DIR = Path("/tmp")
 MIN_STARS = 3
 
 def extract_text_from_pdf(pdf_path):
-    """Extract text from PDF using pdftotext."""
+    """Extract text from PDF using pdftotext (via the shared text store)."""
     try:
-        result = subprocess.run(
-            ['pdftotext', str(pdf_path), '-'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return result.stdout
+        return read_pdf_text(pdf_path)
     except subprocess.CalledProcessError as e:
         print(f"Error extracting text from {pdf_path}: {e}")
         return None
 
-def extract_title_and_author(text):
-    """Extract article title, author, and publish date from PDF text."""
+def extract_title_and_author(pdf_path):
+    """Extract article title, author, and publish date from the PDF (first page, via pdf_metadata)."""
     try:
-        # Extract title - appears after publication name, before "min read"
-        title_match = re.search(
-            r'(?:· Follow publication|Follow)\s*\n\s*\n(.+?)\n\s*\d+\s+min read',
-            text,
-            re.DOTALL
-        )
-
-        if title_match:
-            title = title_match.group(1).strip()
-            title = ' '.join(title.split())  # Clean up newlines
-        else:
-            # Fallback
-            title_match = re.search(r'(.+?)\n\s*\d+\s+min read', text)
-            title = title_match.group(1).strip() if title_match else None
-            if title:
-                title = ' '.join(title.split())
-
-        # Extract publish date - appears as "X min read · Month Day, Year"
-        date_match = re.search(
-            r'\d+\s+min read\s+·\s+([A-Z][a-z]+)\s+(\d+),\s+(\d+)',
-            text
-        )
-
-        if date_match:
-            month, day, year = date_match.groups()
-            # Convert to natural format
-            publish_date = f"{month} {day}, {year}"
-        else:
-            publish_date = None
-
-        # Extract author - appears after "min read · Date"
-        author_match = re.search(
-            r'\d+\s+min read\s+·\s+[A-Z][a-z]+\s+\d+,\s+\d+\s*\n\s*([^\n]+)',
-            text
-        )
-
-        if author_match:
-            author = author_match.group(1).strip()
-            author = re.sub(r'\s*(Follow|Listen|Share|More)\s*$', '', author)
-        else:
-            author = None
-
-        return title, author, publish_date
-
+        metadata = extract_pdf_metadata(pdf_path)
+        return metadata.title, metadata.author, metadata.date
     except Exception as e:
         return None, None, None
 
 def clean_text_for_speech(text):
-    """Clean text to make it better for text-to-speech."""
-    # Remove login/account UI elements (appears at top of PDFs)
-    text = re.sub(r'Welcome back\. You are signed into your member account.*?Not you\?', '', text, flags=re.DOTALL)
-    text = re.sub(r'bg••••@jaxondigital\.com', '', text)
-
-    # Remove URLs
-    text = re.sub(r'https?://\S+', '', text)
-
-    # Remove common Medium UI elements and buttons
-    text = re.sub(r'(Sidebar menu|Medium Logo|Write|Search|Notifications|Follow publication|Member-only story)', '', text)
-    text = re.sub(r'\b(Follow|Listen|Share|More)\b\s*\n', '', text)
-    text = re.sub(r'\d+ min read\s*·\s*[A-Z][a-z]+\s+\d+,\s+\d+', '', text)  # "10 min read · Oct 8, 2025"
-    text = re.sub(r'\d+ min read', '', text)
-    text = re.sub(r'See all from.*', '', text)
-    text = re.sub(r'Recommended from Medium', '', text)
-
-    # Remove code blocks (lines with high density of special characters)
-    lines = text.split('\n')
-    cleaned_lines = []
-    in_code_block = False
-
-    for line in lines:
-        # Detect code-like patterns
-        special_char_count = sum(1 for c in line if c in '{}[]();,=<>|&')
-        total_chars = len(line.strip())
-
-        # If line has >30% special chars and >10 chars, likely code
-        if total_chars > 10 and special_char_count / total_chars > 0.3:
-            in_code_block = True
-            continue
-        # Skip short lines immediately after code (often fragments)
-        elif in_code_block and total_chars < 20:
-            continue
-        else:
-            in_code_block = False
-            cleaned_lines.append(line)
-
-    text = '\n'.join(cleaned_lines)
-
-    # Remove excessive newlines
-    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
-
-    # Remove leading/trailing whitespace
-    text = text.strip()
-
-    return text
+    """Clean text to make it better for text-to-speech (no footer cropping)."""
+    return ARTICLE_CLEANER.clean(text)
 
 def get_star_rating(gat_number):
     """Check analysis file for star rating."""
@@ -239,98 +154,35 @@ def get_executive_summary(gat_number, star_rating, article_title=None, publish_d
 
     return None
 
-def generate_audio_openai(text, output_path, title):
-    """Generate audio using OpenAI TTS API."""
-    import json
-    import tempfile
-
-    # Get API key from environment
-    api_key = os.environ.get('OPENAI_API_KEY')
-    if not api_key:
-        print("Error: OPENAI_API_KEY not set in environment")
+def generate_audio_openai(text, output_path, title, tags=None):
+    """Generate audio using OpenAI TTS API, concatenated and tagged in one pass."""
+    # Shared pooled client (keep-alive connections, validated responses)
+    try:
+        client = get_tts_client()
+    except ValueError as e:
+        print(f"Error: {e}")
         return False
 
     try:
-        # OpenAI has 4096 char limit - split into chunks if needed
-        max_chunk_size = 4000  # Leave some margin
-
-        if len(text) <= max_chunk_size:
-            # Single chunk - simple case
-            chunks = [text]
-        else:
-            # Split on paragraph boundaries to avoid cutting mid-sentence
-            paragraphs = text.split('\n\n')
-            chunks = []
-            current_chunk = ""
-
-            for para in paragraphs:
-                if len(current_chunk) + len(para) + 2 <= max_chunk_size:
-                    current_chunk += para + "\n\n"
-                else:
-                    if current_chunk:
-                        chunks.append(current_chunk.strip())
-                    current_chunk = para + "\n\n"
-
-            if current_chunk:
-                chunks.append(current_chunk.strip())
-
-        # Generate audio for each chunk
-        chunk_files = []
-        for i, chunk in enumerate(chunks):
-            chunk_file = output_path.parent / f"{output_path.stem}.chunk{i}.mp3"
-
-            # Create temporary file for request
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                json.dump({
-                    "model": "tts-1",
-                    "input": chunk,
-                    "voice": "onyx",
-                    "speed": 1.0
-                }, f)
-                json_file = f.name
-
-            # Call OpenAI API using curl
-            subprocess.run([
-                'curl', '-s',
-                'https://api.openai.com/v1/audio/speech',
-                '-H', f'Authorization: Bearer {api_key}',
-                '-H', 'Content-Type: application/json',
-                '-d', f'@{json_file}',
-                '--output', str(chunk_file)
-            ], check=True, capture_output=True)
-
-            # Clean up temp file
-            os.unlink(json_file)
-
-            if not chunk_file.exists() or chunk_file.stat().st_size < 1000:
-                print(f"Error: Chunk {i} not created or too small")
-                # Clean up chunk files
-                for cf in chunk_files:
+        # OpenAI has 4096 char limit - split on paragraph/sentence/clause boundaries
+        chunks = split_for_tts(text)
+
+        # Generate audio for each chunk (concurrently, retried per chunk)
+        chunk_files = [output_path.parent / f"{output_path.stem}.chunk{i}.mp3" for i in range(len(chunks))]
+        ok = client.synthesize_chunks(chunks, chunk_files)
+
+        if not all(ok):
+            print(f"Error: {ok.count(False)} of {len(chunks)} chunks failed")
+            # Clean up chunk files
+            for cf in chunk_files:
+                if cf.exists():
                     cf.unlink()
-                return False
-
-            chunk_files.append(chunk_file)
+            return False
 
-        # Combine chunks using ffmpeg if multiple
-        if len(chunk_files) == 1:
-            chunk_files[0].rename(output_path)
-        else:
-            # Create concat file for ffmpeg
-            concat_file = output_path.parent / f"{output_path.stem}.concat.txt"
-            with open(concat_file, 'w') as f:
-                for chunk_file in chunk_files:
-                    f.write(f"file '{chunk_file.name}'\n")
-
-            # Concatenate audio files
-            subprocess.run([
-                'ffmpeg', '-f', 'concat', '-safe', '0',
-                '-i', str(concat_file),
-                '-acodec', 'copy',
-                '-y', str(output_path)
-            ], check=True, capture_output=True)
-
-            # Clean up
-            concat_file.unlink()
+        # Combine chunks and write ID3 tags with stream copy (no re-encode)
+        try:
+            assemble_mp3(chunk_files, output_path, tags)
+        finally:
             for chunk_file in chunk_files:
                 chunk_file.unlink()
 
@@ -345,70 +197,58 @@ def generate_audio_openai(text, output_path, title):
         print(f"Error generating audio: {e}")
         return False
 
-def generate_audio(text, output_path, title):
-    """Generate audio - tries OpenAI first, falls back to macOS say."""
+def generate_audio(text, output_path, title, tags=None):
+    """Generate tagged MP3 audio - tries OpenAI first, falls back to macOS say."""
     # Try OpenAI TTS first (much better quality)
     if os.environ.get('OPENAI_API_KEY'):
         # OpenAI outputs MP3 directly - use that
-        if generate_audio_openai(text, output_path, title):
+        if generate_audio_openai(text, output_path, title, tags):
             return True
         else:
             print("  OpenAI TTS failed, falling back to macOS say...")
 
-    # Fallback to macOS say (outputs AIFF)
+    # Fallback to macOS say (outputs AIFF, encoded to MP3 while tagging)
+    aiff_path = output_path.with_suffix('.aiff')
     try:
         # Use Daniel voice (UK English, more natural)
         # Rate: 160 words per minute
         subprocess.run(
-            ['say', '-v', 'Daniel', '-r', '160', '-o', str(output_path), text],
+            ['say', '-v', 'Daniel', '-r', '160', '-o', str(aiff_path), text],
             check=True
         )
+        assemble_mp3([aiff_path], output_path, tags)
         return True
     except subprocess.CalledProcessError as e:
         print(f"Error generating audio: {e}")
         return False
-
-def add_metadata(audio_path, title, track_number, star_rating, author="Unknown Author", slug=""):
-    """Add ID3 metadata to audio file using ffmpeg."""
-    try:
-        # Add metadata to MP3 (need to re-encode for metadata to work)
-        # Include slug in filename for easier identification
-        if slug:
-            final_mp3 = audio_path.parent / f"GAT-{track_number}-{slug}.mp3"
-        else:
-            final_mp3 = audio_path.parent / f"GAT-{track_number}.mp3"
-
-        # Improve title display for Books app
-        # Remove "GAT-XXX:" prefix and replace all colons with dashes
-        # "233 - AI Agent for DevOps - How to Build..." instead of "GAT-233: AI Agent for DevOps: How to Build..."
-        display_title = title.replace(f'GAT-{track_number}:', f'{track_number} -')
-        display_title = display_title.replace(':', ' -')  # Replace remaining colons
-
-        # Use title as album so each appears as separate audiobook
-        album_name = display_title
-
-        subprocess.run([
-            'ffmpeg', '-i', str(audio_path),
-            '-acodec', 'libmp3lame',
-            '-ab', '128k',
-            '-metadata', f'title={display_title}',
-            '-metadata', f'album={album_name}',
-            '-metadata', f'artist={author}',
-            '-metadata', 'album_artist=Medium Articles',
-            '-metadata', 'track=1',  # Always track 1 since each is its own book
-            '-metadata', f'comment=Relevance: {star_rating}/5 stars',
-            '-metadata', 'genre=Podcast',
-            '-y',  # Overwrite output file
-            str(final_mp3)
-        ], check=True, capture_output=True)
-
-        # Remove temp file
-        audio_path.unlink()
-
-        return final_mp3
-    except subprocess.CalledProcessError as e:
-        print(f"Error adding metadata: {e}")
-        return None
+    finally:
+        if aiff_path.exists():
+            aiff_path.unlink()
+
+def episode_metadata(title, track_number, star_rating, author="Unknown Author", slug=""):
+    """Final MP3 filename and ID3 tags for an article."""
+    # Include slug in filename for easier identification
+    if slug:
+        filename = f"GAT-{track_number}-{slug}.mp3"
+    else:
+        filename = f"GAT-{track_number}.mp3"
+
+    # Improve title display for Books app
+    # Remove "GAT-XXX:" prefix and replace all colons with dashes
+    # "233 - AI Agent for DevOps - How to Build..." instead of "GAT-233: AI Agent for DevOps: How to Build..."
+    display_title = title.replace(f'GAT-{track_number}:', f'{track_number} -')
+    display_title = display_title.replace(':', ' -')  # Replace remaining colons
+
+    tags = {
+        'title': display_title,
+        'album': display_title,  # Use title as album so each appears as separate audiobook
+        'artist': author,
+        'album_artist': 'Medium Articles',
+        'track': '1',  # Always track 1 since each is its own book
+        'comment': f'Relevance: {star_rating}/5 stars',
+        'genre': 'Podcast',
+    }
+    return filename, tags
 
 def process_article(pdf_path):
     """Process a single article PDF."""
@@ -454,7 +294,7 @@ def process_article(pdf_path):
         return False
 
     # Extract title, author, and publish date for metadata and summary
-    article_title, article_author, publish_date = extract_title_and_author(text)
+    article_title, article_author, publish_date = extract_title_and_author(pdf_path)
 
     # Clean text
     print(f"  Cleaning text...")
@@ -470,15 +310,7 @@ def process_article(pdf_path):
         print(f"  Adding executive summary...")
         text = executive_summary + "\n\n" + text
 
-    # Generate audio
-    print(f"  Generating audio ({len(text)} chars)...")
-    temp_audio = AUDIO_OUTPUT_DIR / f"GAT-{gat_number}.temp.mp3"
-
-    if not generate_audio(text, temp_audio, filename):
-        return False
-
-    # Add metadata
-    print(f"  Adding metadata...")
+    # Metadata is written while the audio is assembled
     if article_title and article_author:
         title = f"GAT-{gat_number}: {article_title}"
         author = article_author
@@ -487,11 +319,24 @@ def process_article(pdf_path):
         title = f"GAT-{gat_number}: {filename.replace('GAT-' + gat_number + '-', '')} ({star_rating}/5)"
         author = "Unknown Author"
 
-    mp3_path = add_metadata(temp_audio, title, int(gat_number), star_rating, author, slug)
-    if not mp3_path:
+    mp3_name, tags = episode_metadata(title, int(gat_number), star_rating, author, slug)
+    mp3_path = AUDIO_OUTPUT_DIR / mp3_name
+
+    # Generate audio
+    print(f"  Generating audio ({len(text)} chars)...")
+    if not generate_audio(text, mp3_path, filename, tags):
         return False
 
     print(f"  ✓ Created: {mp3_path}")
+
+    # Keep the voiced text so the episode can be re-voiced without the PDF. The
+    # summary is voiced as part of the text here (not chunked on its own), so it
+    # is saved that way to reproduce the same chunks.
+    try:
+        save_episode_source(AUDIO_OUTPUT_DIR, f"GAT-{gat_number}", text, tags=tags)
+    except OSError as e:
+        print(f"  ⚠ Could not save episode source: {e}")
+
     return True
 
 def main():
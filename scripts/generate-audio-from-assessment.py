@@ -6,18 +6,46 @@ Works with assessment markdown and numbered PDFs (01-article.pdf format).
 Usage:
     python3 generate-audio-from-assessment.py \\
         /Users/bgerby/Documents/dev/ai/pdfs/medium-articles-2025-10-21 \\
-        /Users/bgerby/Documents/dev/ai/assessments/medium-articles-relevance-assessment-2025-10-21.md
+        /Users/bgerby/Documents/dev/ai/assessments/medium-articles-relevance-assessment-2025-10-21.md \\
+        [metadata_json] [--plan] [--no-tts-cache] [--stream] [--publish-partial-after MINUTES]
+
+Options:
+    --plan: Print the estimated audio duration, disk space, TTS chunks and run time
+            for the HIGH priority articles, then exit without generating anything.
+            Extracts every article for exact figures; a normal run only estimates
+            (from already-stored text, else PDF page counts) so extraction stays
+            overlapped with TTS in the pipeline
+    --no-tts-cache: Synthesize every chunk again instead of reusing cached audio
+    --stream: Write each episode progressively to audio-reviews/streaming/ as chunks
+              arrive, so it can be played while the rest is still generating
+    --publish-partial-after MINUTES: Also publish a partial episode (Drive + RSS feed)
+              once the first MINUTES of audio are ready; replaced by the full
+              episode when it finishes (implies --stream)
 """
 
+import argparse
 import fcntl
 import os
 import sys
 import re
 import subprocess
 import json
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+from tts_client import get_tts_client, split_for_tts, DEFAULT_CHUNK_WORKERS, DEFAULT_MAX_CONCURRENT
+from audio_estimate import (estimate_article, estimate_article_from_pages, estimate_run,
+                            calibrate_bitrate, format_duration, format_mb)
+from audio_assembly import assemble_mp3
+from speech_cleaning import clean_text_for_speech
+from streaming_audio import ProgressiveEpisode
+from episode_sources import save_episode_source
+from pdf_text import read_pdf_text, get_pdf_text_store, pdf_page_count
+from content_quality import check_pdf_quality
+
 # Try to import tqdm for progress bars (optional)
 try:
     from tqdm import tqdm
@@ -44,7 +72,7 @@ def log_subprocess_error(command_name, stderr_output, log_file="/tmp/workflow-er
         print(f"  ⚠️  Warning: Could not write to error log: {e}")
 
 def extract_text_from_pdf(pdf_path, validate_content=True):
-    """Extract text from PDF using pdftotext with content validation.
+    """Extract text from PDF using pdftotext (via the shared text store) with content validation.
 
     Args:
         pdf_path: Path to PDF file
@@ -54,39 +82,16 @@ def extract_text_from_pdf(pdf_path, validate_content=True):
         Extracted text, or None if extraction fails or content is invalid
     """
     try:
-        result = subprocess.run(
-            ['pdftotext', str(pdf_path), '-'],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=30
-        )
-        text = result.stdout
+        text = read_pdf_text(pdf_path)
 
-        # Content validation: Check for paywalled or empty PDFs
+        # Content validation: paywalled, empty or broken PDFs (verdict is stored with the text)
         if validate_content:
-            text_length = len(text.strip())
-
-            # Check for paywall indicators
-            paywall_indicators = [
-                'member-only story',
-                'this story is for medium members',
-                'upgrade to continue reading',
-                'become a member to read this story',
-                'sign up to read'
-            ]
-
-            has_paywall = any(indicator in text.lower() for indicator in paywall_indicators)
-
-            # Validation checks
-            if text_length < 100:
-                print(f"  ⚠️  WARNING: PDF appears empty ({text_length} chars)")
-                return None
-            elif text_length < 500:
-                print(f"  ⚠️  WARNING: PDF suspiciously short ({text_length} chars) - may be paywalled")
-            elif has_paywall and text_length < 2000:
-                print(f"  ⚠️  WARNING: PDF may be paywalled (paywall text detected, only {text_length} chars)")
+            quality = check_pdf_quality(pdf_path)
+            if quality['verdict'] == 'reject':
+                print(f"  ⚠️  WARNING: PDF rejected: {quality['summary']}")
                 return None
+            elif quality['verdict'] == 'suspicious':
+                print(f"  ⚠️  WARNING: PDF suspicious: {quality['summary']}")
 
         return text
     except subprocess.TimeoutExpired:
@@ -99,79 +104,6 @@ def extract_text_from_pdf(pdf_path, validate_content=True):
         print(f"  ✗ Unexpected error: {e}")
         return None
 
-def clean_text_for_speech(text):
-    """Clean text to make it better for text-to-speech."""
-    # Remove "Open in app" header (appears at top of Medium PDFs)
-    text = re.sub(r'^Open in app\s*\n?', '', text, flags=re.IGNORECASE | re.MULTILINE)
-
-    # Remove login/account UI elements
-    text = re.sub(r'Welcome back\. You are signed into your member account.*?Not you\?', '', text, flags=re.DOTALL)
-    text = re.sub(r'bg••••@jaxondigital\.com', '', text)
-
-    # Remove URLs
-    text = re.sub(r'https?://\S+', '', text)
-
-    # Remove common Medium UI elements
-    text = re.sub(r'(Sidebar menu|Medium Logo|Write|Search|Notifications|Follow publication|Member-only story)', '', text)
-    text = re.sub(r'\b(Follow|Listen|Share|More)\b\s*\n', '', text)
-    text = re.sub(r'\d+ min read\s*·\s*[A-Z][a-z]+\s+\d+,\s+\d+', '', text)
-    text = re.sub(r'\d+ min read', '', text)
-
-    # IMPROVED: Crop at footer sections (Topics, Author bio, Recommendations)
-    # Find earliest occurrence of footer patterns and truncate there
-    footer_patterns = [
-        r'\n\s*Topics\s*\n',                    # "Topics" section header (explicit)
-        r'\n\s*Topics\s*$',                     # "Topics" at end of line
-        r'\nSee you next time!?\s*\n',          # Common author sign-off
-        r'\nReferences\s*\n',                   # References section (often before topics)
-        r'[\n\f]Written by\s+[\w\s]+\n',        # "Written by [Name]" (may have form feed)
-        r'\n(?:No )?[Rr]esponses?\s*\(',        # "Responses (12)" or "No responses yet"
-        r'\nSee all from\s+[\w\s]+\n',          # "See all from [Author]"
-        r'\nRecommended from Medium',           # Medium recommendations section
-        r'\nMore from\s+[\w\s]+\n',             # "More from [Publication]"
-        r'\n\s*--\s*\n',                        # Horizontal rule often precedes footer
-        r'\nIf you (?:like|enjoyed).*(?:comment|share|clap)', # Call-to-action at end
-    ]
-
-    earliest_footer_pos = len(text)
-    matched_pattern = None
-
-    for pattern in footer_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match and match.start() < earliest_footer_pos:
-            earliest_footer_pos = match.start()
-            matched_pattern = pattern
-
-    # Crop at footer if found
-    if earliest_footer_pos < len(text):
-        text = text[:earliest_footer_pos]
-        # Note: Could add logging here for debugging
-        # print(f"  → Cropped {len(text[earliest_footer_pos:])} chars at pattern: {matched_pattern}")
-
-    # Remove code blocks
-    lines = text.split('\n')
-    cleaned_lines = []
-    in_code_block = False
-
-    for line in lines:
-        special_char_count = sum(1 for c in line if c in '{}[]();,=<>|&')
-        total_chars = len(line.strip())
-
-        if total_chars > 10 and special_char_count / total_chars > 0.3:
-            in_code_block = True
-            continue
-        elif in_code_block and total_chars < 20:
-            continue
-        else:
-            in_code_block = False
-            cleaned_lines.append(line)
-
-    text = '\n'.join(cleaned_lines)
-    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
-    text = text.strip()
-
-    return text
-
 def parse_assessment(assessment_path, metadata_path=None):
     """Parse assessment markdown to extract article metadata and ratings."""
     with open(assessment_path, 'r') as f:
@@ -275,90 +207,76 @@ def parse_assessment(assessment_path, metadata_path=None):
 
     return articles
 
-def generate_audio_openai(text, output_path):
-    """Generate audio using OpenAI TTS API."""
-    import tempfile
+def generate_audio_openai(text, output_path, workers=DEFAULT_CHUNK_WORKERS, intro=None, tags=None,
+                          stream_path=None, partial_after=None, on_partial=None):
+    """
+    Generate audio using OpenAI TTS API.
+
+    Chunks are synthesized concurrently through the shared pooled TTS client
+    (each retried on its own, with in-flight requests capped across articles)
+    and concatenated in document order. Chunks whose text was voiced before
+    come from the TTS cache. The intro (executive summary) is chunked on its
+    own, so changing it never shifts the article's chunk boundaries.
 
-    api_key = os.environ.get('OPENAI_API_KEY')
-    if not api_key:
-        print("Error: OPENAI_API_KEY not set in environment")
+    Concatenation and ID3 tagging (tags) happen in a single stream-copy pass.
+
+    With stream_path, chunks are also appended to a progressive MP3 there as
+    they arrive in order. With partial_after (seconds), a partial episode is
+    written next to output_path once that much audio is ready, and
+    on_partial(partial_path, seconds) is called.
+    """
+    try:
+        client = get_tts_client(use_cache=TTS_USE_CACHE)
+    except ValueError as e:
+        print(f"Error: {e}")
         return False
 
     try:
-        max_chunk_size = 4000
+        chunks = (split_for_tts(intro) if intro else []) + split_for_tts(text)
+        chunk_files = [output_path.parent / f"{output_path.stem}.chunk{i}.mp3" for i in range(len(chunks))]
+
+        cached = sum(1 for chunk in chunks if client.is_cached(chunk))
+        if cached:
+            print(f"  ♻ {cached}/{len(chunks)} chunks reused from TTS cache")
+
+        episode = None
+        if stream_path:
+            partial_tags = dict(tags or {})
+            if partial_tags.get('title'):
+                partial_tags['title'] = f"{partial_tags['title']} (partial)"
+            episode = ProgressiveEpisode(
+                stream_path, len(chunks), tags=tags,
+                partial_path=output_path.parent / f"{output_path.stem}.partial.mp3",
+                partial_after=partial_after,
+                partial_tags=partial_tags,
+                on_partial=on_partial
+            )
+            print(f"  ▶ Streaming to {stream_path}")
 
-        if len(text) <= max_chunk_size:
-            chunks = [text]
-        else:
-            paragraphs = text.split('\n\n')
-            chunks = []
-            current_chunk = ""
-
-            for para in paragraphs:
-                if len(current_chunk) + len(para) + 2 <= max_chunk_size:
-                    current_chunk += para + "\n\n"
-                else:
-                    if current_chunk:
-                        chunks.append(current_chunk.strip())
-                    current_chunk = para + "\n\n"
-
-            if current_chunk:
-                chunks.append(current_chunk.strip())
-
-        chunk_files = []
-        for i, chunk in enumerate(chunks):
-            chunk_file = output_path.parent / f"{output_path.stem}.chunk{i}.mp3"
-
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                json.dump({
-                    "model": "tts-1",
-                    "input": chunk,
-                    "voice": "onyx",
-                    "speed": 1.0
-                }, f)
-                json_file = f.name
-
-            subprocess.run([
-                'curl', '-s',
-                'https://api.openai.com/v1/audio/speech',
-                '-H', f'Authorization: Bearer {api_key}',
-                '-H', 'Content-Type: application/json',
-                '-d', f'@{json_file}',
-                '--output', str(chunk_file)
-            ], check=True, capture_output=True)
-
-            os.unlink(json_file)
-
-            if not chunk_file.exists() or chunk_file.stat().st_size < 1000:
-                print(f"Error: Chunk {i} not created or too small")
-                for cf in chunk_files:
-                    cf.unlink()
-                return False
+        ok = client.synthesize_chunks(chunks, chunk_files, workers=workers,
+                                      on_chunk=episode.chunk_ready if episode else None)
 
-            chunk_files.append(chunk_file)
+        if not all(ok):
+            failed = [str(i + 1) for i, success in enumerate(ok) if not success]
+            print(f"Error: Chunk(s) {', '.join(failed)} of {len(chunks)} failed")
+            for cf in chunk_files:
+                if cf.exists():
+                    cf.unlink()
+            if episode:
+                episode.finish()
+            return False
 
-        if len(chunk_files) == 1:
-            chunk_files[0].rename(output_path)
-        else:
-            concat_file = output_path.parent / f"{output_path.stem}.concat.txt"
-            with open(concat_file, 'w') as f:
-                for chunk_file in chunk_files:
-                    f.write(f"file '{chunk_file.name}'\n")
-
-            result = subprocess.run([
-                'ffmpeg', '-f', 'concat', '-safe', '0',
-                '-i', str(concat_file),
-                '-acodec', 'copy',
-                '-y', str(output_path)
-            ], check=True, capture_output=True, text=True)
-
-            # Log any warnings from FFmpeg
-            if result.stderr:
-                log_subprocess_error("FFmpeg concat", result.stderr)
-
-            concat_file.unlink()
+        try:
+            stderr = assemble_mp3(chunk_files, output_path, tags)
+        finally:
             for chunk_file in chunk_files:
                 chunk_file.unlink()
+            if episode:
+                episode.finish()
+
+        # Log any warnings from FFmpeg
+        if stderr:
+            log_subprocess_error("FFmpeg concat", stderr)
 
         if output_path.exists() and output_path.stat().st_size > 1000:
             return True
@@ -366,49 +284,33 @@ def generate_audio_openai(text, output_path):
             print(f"Error: Final audio file not created or too small")
             return False
 
+    except subprocess.CalledProcessError as e:
+        print(f"Error assembling audio: {e}")
+        log_subprocess_error("FFmpeg concat", e.stderr)
+        return False
     except Exception as e:
         print(f"Error generating audio: {e}")
         import traceback
         traceback.print_exc()
         return False
 
-def add_metadata(audio_path, title, gat_number, description="High Priority Article", author="Medium Author"):
-    """Add ID3 metadata to audio file."""
-    try:
-        final_mp3 = audio_path.parent / f"{gat_number}.mp3"
-
-        display_title = f"{gat_number.replace('GAT-', '')} - {title}"
-        album_name = display_title
-
-        # Truncate description if too long (RSS readers typically limit to ~200 chars)
-        if len(description) > 200:
-            description = description[:197] + "..."
-
-        result = subprocess.run([
-            'ffmpeg', '-i', str(audio_path),
-            '-acodec', 'libmp3lame',
-            '-ab', '128k',
-            '-metadata', f'title={display_title}',
-            '-metadata', f'album={album_name}',
-            '-metadata', f'artist={author}',
-            '-metadata', 'album_artist=Medium Articles',
-            '-metadata', 'track=1',
-            '-metadata', f'comment={description}',
-            '-metadata', 'genre=Podcast',
-            '-y',
-            str(final_mp3)
-        ], check=True, capture_output=True, text=True)
+def episode_tags(title, gat_number, description="High Priority Article", author="Medium Author"):
+    """ID3 tags for an article episode."""
+    display_title = f"{gat_number.replace('GAT-', '')} - {title}"
 
-        # Log any warnings from FFmpeg
-        if result.stderr:
-            log_subprocess_error("FFmpeg metadata", result.stderr)
-
-        audio_path.unlink()
+    # Truncate description if too long (RSS readers typically limit to ~200 chars)
+    if len(description) > 200:
+        description = description[:197] + "..."
 
-        return final_mp3
-    except subprocess.CalledProcessError as e:
-        print(f"Error adding metadata: {e}")
-        return None
+    return {
+        'title': display_title,
+        'album': display_title,
+        'artist': author,
+        'album_artist': 'Medium Articles',
+        'track': '1',
+        'comment': description,
+        'genre': 'Podcast',
+    }
 
 def get_drive_service():
     """Get Google Drive API service using token from MCP server."""
@@ -503,8 +405,6 @@ def upload_audio_to_drive(audio_path, review_date: str = None):
     from googleapiclient.http import MediaFileUpload
 
     try:
-        service = get_drive_service()
-
         # Parse review date and get/create date-specific MP3 folder
         if review_date:
             date_obj = datetime.strptime(review_date, '%Y-%m-%d')
@@ -515,7 +415,10 @@ def upload_audio_to_drive(audio_path, review_date: str = None):
         month = date_obj.strftime('%m')
         day = date_obj.strftime('%d')
 
-        mp3_folder_id = get_or_create_mp3_folder(service, year, month, day)
+        # Serialized: concurrent uploads would race on token refresh and folder creation
+        with DRIVE_LOCK:
+            service = get_drive_service()
+            mp3_folder_id = get_or_create_mp3_folder(service, year, month, day)
 
         file_name = os.path.basename(audio_path)
         file_metadata = {
@@ -557,6 +460,30 @@ def upload_audio_to_drive(audio_path, review_date: str = None):
         print(f"  ✗ Error uploading to Drive: {e}")
         return None
 
+def drive_file_id(link):
+    """File ID from a Drive view link (/d/FILE_ID/) or download link (id=FILE_ID)."""
+    match = re.search(r'/d/([a-zA-Z0-9_-]+)/', link) or re.search(r'[?&]id=([a-zA-Z0-9_-]+)', link)
+    return match.group(1) if match else None
+
+def trash_drive_file(link):
+    """Move an uploaded file to the Drive trash (recoverable there). Returns True on success."""
+    file_id = drive_file_id(link)
+    if not file_id:
+        return False
+
+    try:
+        with DRIVE_LOCK:
+            service = get_drive_service()
+        service.files().update(
+            fileId=file_id,
+            body={'trashed': True},
+            supportsAllDrives=True
+        ).execute()
+        return True
+    except Exception as e:
+        print(f"  ⚠ Failed to move Drive file {file_id} to trash: {e}")
+        return False
+
 def build_jira_description(article, pdf_link=None, audio_link=None):
     """Build complete JIRA description with assessment."""
     source = "Optimizely World Blog" if "world.optimizely.com" in article['article_url'] else "Medium"
@@ -740,13 +667,476 @@ To be reviewed for relevance to Jaxon Digital's AI agent initiatives."""
         traceback.print_exc()
         return False
 
-def main():
-    if len(sys.argv) < 3:
-        print(__doc__)
-        sys.exit(1)
+# Audio pipeline: each stage has its own pool, so PDF extraction for the next
+# article, TTS for the current one and upload/JIRA for the previous one overlap
+EXTRACT_WORKERS = 2
+SYNTHESIZE_WORKERS = 2   # Articles in TTS at once (chunk requests are capped by the TTS client)
+PUBLISH_WORKERS = 2
+
+TTS_USE_CACHE = True     # Reuse cached TTS chunks (off with --no-tts-cache)
+
+DRIVE_LOCK = threading.Lock()        # Token refresh and date folder creation
+DRIVE_URLS_LOCK = threading.Lock()   # drive-urls.json read-modify-write
+FEED_LOCK = threading.Lock()         # RSS feed regenerate/commit/push
+
+# Streaming mode: progressive MP3s while chunks are still being synthesized
+STREAM_DIR_NAME = "streaming"
+FEED_DIR = Path('/Users/bgerby/Documents/dev/ai/jaxon-research-feed')
+
+def find_article_pdf(pdf_dir, article_num, article, quiet=False):
+    """Find an article's PDF by ticket ID, falling back to its number."""
+    # Format 1: GAT-387-how-to-work-with-claude-code...pdf
+    pdf_pattern = f"{article['ticket_id']}-*.pdf"
+    matching_pdfs = list(pdf_dir.glob(pdf_pattern))
+    if matching_pdfs:
+        if not quiet:
+            print(f"  {article['ticket_id']}: Found PDF: {matching_pdfs[0].name}")
+        return matching_pdfs[0]
+
+    # Format 2 (fallback): 03-how-to-work-with-claude-code...pdf
+    numbered_pattern = f"{article_num:02d}-*.pdf"
+    matching_pdfs = list(pdf_dir.glob(numbered_pattern))
+    if matching_pdfs:
+        if not quiet:
+            print(f"  {article['ticket_id']}: Found PDF using numbered format: {matching_pdfs[0].name}")
+        return matching_pdfs[0]
+
+    if not quiet:
+        print(f"  ⚠ {article['ticket_id']}: No PDF found (tried {pdf_pattern} and {numbered_pattern})")
+    return None
+
+def extract_stage(article_num, article, pdf_dir):
+    """Stage 1: find, extract and clean the article text. Returns text or None."""
+    pdf_path = find_article_pdf(pdf_dir, article_num, article)
+    if not pdf_path:
+        return None
+
+    print(f"  {article['ticket_id']}: Extracting text from PDF...")
+    text = extract_text_from_pdf(pdf_path)
+    if not text:
+        return None
+
+    text = clean_text_for_speech(text)
+    if len(text) < 100:
+        print(f"  ⚠ {article['ticket_id']}: Text too short ({len(text)} chars)")
+        return None
+
+    return text
+
+def synthesize_stage(article, text, output_mp3, stream=False, partial_minutes=None, on_partial=None):
+    """
+    Stage 2: voice the executive summary and article into a tagged MP3.
+
+    With stream, the episode is also written progressively to STREAM_DIR_NAME;
+    with partial_minutes, on_partial(partial_mp3, seconds) is called once that
+    much audio is ready.
+    """
+    # Executive summary is voiced first, as its own chunk(s)
+    intro = article['executive_summary']
+
+    # Generate audio (concatenated and tagged in one pass)
+    print(f"  {article['ticket_id']}: Generating audio ({len(intro) + len(text)} chars)...")
+    tags = episode_tags(article['title'], article['ticket_id'], article['relevance_summary'])
+
+    stream_path = output_mp3.parent / STREAM_DIR_NAME / output_mp3.name if stream or partial_minutes else None
+    partial_after = partial_minutes * 60 if partial_minutes else None
+
+    if not generate_audio_openai(text, output_mp3, intro=intro, tags=tags, stream_path=stream_path,
+                                 partial_after=partial_after, on_partial=on_partial):
+        print(f"  ✗ {article['ticket_id']}: Audio generation failed")
+        return None
+
+    print(f"  ✓ {article['ticket_id']}: Created {output_mp3}")
+
+    # Keep the voiced text so the episode can be re-voiced without the PDF
+    try:
+        save_episode_source(output_mp3.parent, article['ticket_id'], text, intro=intro, tags=tags)
+    except OSError as e:
+        print(f"  ⚠ {article['ticket_id']}: Could not save episode source: {e}")
+
+    return output_mp3
+
+def record_drive_url(output_dir, final_mp3, audio_drive_link, unless_exists=None):
+    """
+    Add an episode's direct download link to drive-urls.json.
+
+    If unless_exists is given and that file exists (checked under the lock),
+    nothing is recorded. Returns True if the link was recorded.
+    """
+    # Convert view link to download link
+    # Format: https://drive.google.com/file/d/FILE_ID/view?usp=drivesdk
+    # Convert to: https://drive.google.com/uc?export=download&id=FILE_ID
+    file_id = drive_file_id(audio_drive_link)
+    if not file_id:
+        return False
+
+    download_link = f"https://drive.google.com/uc?export=download&id={file_id}"
+    drive_urls_file = output_dir / "drive-urls.json"
+
+    with DRIVE_URLS_LOCK:
+        if unless_exists and Path(unless_exists).exists():
+            return False
+
+        try:
+            if drive_urls_file.exists():
+                with open(drive_urls_file, 'r') as f:
+                    drive_urls = json.load(f)
+            else:
+                drive_urls = {}
+
+            drive_urls[final_mp3.name] = download_link
+
+            with open(drive_urls_file, 'w') as f:
+                json.dump(drive_urls, f, indent=2, sort_keys=True)
+
+            print(f"  ✓ Updated drive-urls.json ({final_mp3.name})")
+            return True
+        except Exception as e:
+            print(f"  ⚠ Failed to update drive-urls.json: {e}")
+            return False
+
+def retire_partial_episode(output_dir, final_mp3):
+    """
+    Remove a partial episode: local file, drive-urls.json entry and the
+    uploaded Drive file (moved to trash). Called when the full episode is
+    published, or when it failed, so no partial stays in the feed.
+
+    Returns True if a published partial was removed (the feed needs updating).
+    """
+    partial_mp3 = final_mp3.parent / f"{final_mp3.stem}.partial.mp3"
+    drive_urls_file = output_dir / "drive-urls.json"
+
+    with DRIVE_URLS_LOCK:
+        if partial_mp3.exists():
+            partial_mp3.unlink()
+
+        try:
+            if not drive_urls_file.exists():
+                return False
+            with open(drive_urls_file, 'r') as f:
+                drive_urls = json.load(f)
+            download_link = drive_urls.pop(partial_mp3.name, None)
+            if download_link is None:
+                return False
+            with open(drive_urls_file, 'w') as f:
+                json.dump(drive_urls, f, indent=2, sort_keys=True)
+            print(f"  ✓ Removed partial episode {partial_mp3.name} from drive-urls.json")
+        except Exception as e:
+            print(f"  ⚠ Failed to remove {partial_mp3.name} from drive-urls.json: {e}")
+            return False
+
+    if trash_drive_file(download_link):
+        print(f"  ✓ Moved partial episode {partial_mp3.name} to Drive trash")
+    return True
+
+def update_rss_feed(commit_msg):
+    """Regenerate the podcast RSS feed and push it to GitHub Pages. Returns True on success."""
+    with FEED_LOCK:
+        try:
+            # Regenerate RSS feed
+            result = subprocess.run(
+                ['python3', 'generate-feed.py'],
+                cwd=str(FEED_DIR),
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
+
+            if result.returncode != 0:
+                print(f"✗ RSS feed generation failed: {result.stderr}")
+                return False
+
+            print("✓ RSS feed regenerated")
+
+            # Commit and push to GitHub Pages
+            subprocess.run(['git', 'add', 'feed.rss'], cwd=str(FEED_DIR), check=True)
+            subprocess.run(['git', 'commit', '-m', commit_msg], cwd=str(FEED_DIR), check=True)
+            subprocess.run(['git', 'push'], cwd=str(FEED_DIR), check=True)
+
+            print("✓ RSS feed published to GitHub Pages")
+            return True
+
+        except Exception as e:
+            print(f"✗ Error updating RSS feed: {e}")
+            print("  You can manually update with:")
+            print(f"  cd {FEED_DIR}")
+            print("  python3 generate-feed.py")
+            print("  git add feed.rss && git commit -m 'Update feed' && git push")
+            return False
+
+def publish_partial_stage(article, partial_mp3, seconds, output_dir, review_date):
+    """
+    Publish a partial episode (Drive, drive-urls.json, RSS feed) while the rest generates.
+
+    Skipped if the full episode already exists; retire_partial_episode
+    removes it again once the full episode is published.
+    """
+    ticket_id = article['ticket_id']
+    final_mp3 = output_dir / f"{ticket_id}.mp3"
+    if final_mp3.exists():
+        partial_mp3.unlink(missing_ok=True)
+        return False
+
+    print(f"  {ticket_id}: Publishing partial episode ({seconds / 60:.1f} min ready)...")
+    audio_drive_link = upload_audio_to_drive(partial_mp3, review_date)
+    if not audio_drive_link:
+        print(f"  ⚠ {ticket_id}: Partial episode upload failed")
+        return False
+
+    if not record_drive_url(output_dir, partial_mp3, audio_drive_link, unless_exists=final_mp3):
+        # Full episode finished first (or drive-urls.json failed) - don't leave the upload behind
+        partial_mp3.unlink(missing_ok=True)
+        trash_drive_file(audio_drive_link)
+        return False
+
+    if not update_rss_feed(f"Add partial audio review {ticket_id}"):
+        return False
+
+    print(f"  ✓ {ticket_id}: Partial episode published")
+    return True
+
+def publish_stage(article, final_mp3, output_dir, review_date):
+    """Stage 3: upload to Drive, record the link and update JIRA. Returns a result record."""
+    ticket_id = article['ticket_id']
+    result = {
+        'ticket_id': ticket_id,
+        'audio_path': str(final_mp3),
+        'title': article['title'],
+        'status': 'generated',
+        'jira_updated': False
+    }
+
+    # The full episode supersedes any partial one
+    retire_partial_episode(output_dir, final_mp3)
+
+    # Upload to Google Drive
+    print(f"  {ticket_id}: Uploading to Google Drive...")
+    audio_drive_link = upload_audio_to_drive(final_mp3, review_date)
+
+    if not audio_drive_link:
+        print(f"  ⚠ {ticket_id}: Drive upload failed (audio file still available locally)")
+        return result
+
+    print(f"  ✓ {ticket_id}: Uploaded: {audio_drive_link}")
+    result['audio_drive_link'] = audio_drive_link
+    record_drive_url(output_dir, final_mp3, audio_drive_link)
+
+    # Update JIRA ticket with audio link (re-update with assessment + audio)
+    print(f"  {ticket_id}: Updating JIRA ticket with audio link...")
+    if update_jira_with_assessment(ticket_id, article, audio_link=audio_drive_link):
+        print(f"  ✓ {ticket_id}: JIRA ticket updated with audio link")
+        result['jira_updated'] = True
+    else:
+        print(f"  ⚠ {ticket_id}: JIRA update failed (audio file still available)")
 
-    pdf_dir = Path(sys.argv[1])
-    assessment_path = Path(sys.argv[2])
+    return result
+
+def plan_audio_run(article_items, pdf_dir, output_dir, stream=False, extract=False):
+    """
+    Estimate the run for the articles that still need audio.
+
+    With extract (--plan), every article is extracted and cleaned so chunk
+    counts are exact. Otherwise nothing is extracted here - that stays in the
+    pipeline, overlapped with TTS: articles whose text is already in the PDF
+    text store are estimated exactly, the rest from their PDF page count.
+
+    Returns (plan, estimates).
+    """
+    todo = [(num, article) for num, article in article_items
+            if not (output_dir / f"{article['ticket_id']}.mp3").exists()]
+
+    try:
+        is_cached = get_tts_client(use_cache=TTS_USE_CACHE).is_cached
+    except ValueError:
+        is_cached = None  # No API key: cached chunks can't be counted
+
+    bits_per_second = calibrate_bitrate(output_dir)
+    store = get_pdf_text_store()
+
+    def estimate(item):
+        article_num, article = item
+        ticket_id, intro = article['ticket_id'], article['executive_summary']
+        try:
+            if extract:
+                text = extract_stage(article_num, article, pdf_dir)
+            else:
+                pdf_path = find_article_pdf(pdf_dir, article_num, article, quiet=True)
+                if not pdf_path:
+                    return None
+                text = store.stored_text(pdf_path)
+                if text is None:
+                    return estimate_article_from_pages(ticket_id, intro, pdf_page_count(pdf_path),
+                                                       bits_per_second=bits_per_second)
+                text = clean_text_for_speech(text)
+        except Exception as e:
+            print(f"  ✗ {ticket_id}: Estimate failed: {e}")
+            return None
+
+        if not text or len(text) < 100:
+            return None
+        return estimate_article(ticket_id, intro, text, is_cached=is_cached, bits_per_second=bits_per_second)
+
+    with ThreadPoolExecutor(max_workers=EXTRACT_WORKERS, thread_name_prefix="estimate") as executor:
+        results = list(executor.map(estimate, todo))
+    estimates = [e for e in results if e]
+
+    concurrency = min(DEFAULT_MAX_CONCURRENT, SYNTHESIZE_WORKERS * DEFAULT_CHUNK_WORKERS)
+    plan = estimate_run(estimates, concurrency=concurrency,
+                        parallel_articles=SYNTHESIZE_WORKERS, stream=stream)
+    plan['existing'] = len(article_items) - len(todo)
+    plan['failed'] = len(todo) - len(estimates)
+    plan['bits_per_second'] = bits_per_second
+
+    return plan, estimates
+
+def print_audio_plan(plan, estimates):
+    """Print per-article and total estimates from plan_audio_run."""
+    print(f"\n{'Ticket':<10} {'Chars':>8} {'Chunks':>8} {'Cached':>7} {'Audio':>9} {'Size':>10}")
+    for e in estimates:
+        approx = '~' if e.get('approximate') else ' '
+        print(f"{e['ticket_id']:<10}{approx}{e['chars']:>8,} {e['chunks']:>8} {e['cached_chunks']:>7} "
+              f"{format_duration(e['audio_seconds']):>9} {format_mb(e['bytes']):>10}")
+
+    print(f"\nAudio Plan:")
+    print(f"  Articles to voice: {plan['articles']} "
+          f"({plan['existing']} already have audio, {plan['failed']} without usable text)")
+    print(f"  Audio duration: ~{format_duration(plan['audio_seconds'])} ({plan['chars']:,} chars)")
+    print(f"  TTS chunks: {plan['chunks']} ({plan['cached_chunks']} cached)")
+    print(f"  Output size: ~{format_mb(plan['bytes'])} at {plan['bits_per_second'] // 1000} kbps")
+    print(f"  Disk required (incl. temp files and margin): ~{format_mb(plan['required_bytes'])}")
+    print(f"  Estimated run time: ~{format_duration(plan['wall_seconds'])}")
+    if plan['approximate']:
+        print(f"  (~ {plan['approximate']} articles not extracted yet: estimated from PDF page count;"
+              f" --plan extracts them for exact figures)")
+
+def run_audio_pipeline(article_items, pdf_dir, output_dir, review_date, stream=False, partial_minutes=None):
+    """
+    Run extract -> synthesize -> publish as overlapping stages.
+
+    Each stage has its own bounded pool, and a finished item is handed to the
+    next stage's queue immediately. A failure (or exception) in any stage
+    only drops that article. Returns result records in article order.
+
+    Partial episodes (partial_minutes) are published from the publish pool
+    while their article is still in TTS.
+    """
+    done = queue.Queue()  # (article_num, result or None), one per article
+
+    extract_pool = ThreadPoolExecutor(max_workers=EXTRACT_WORKERS, thread_name_prefix="extract")
+    synthesize_pool = ThreadPoolExecutor(max_workers=SYNTHESIZE_WORKERS, thread_name_prefix="tts")
+    publish_pool = ThreadPoolExecutor(max_workers=PUBLISH_WORKERS, thread_name_prefix="publish")
+
+    def guarded(stage_name, article, func, *args):
+        """Run one stage for one article; on failure, report it and end the article."""
+        try:
+            return func(*args)
+        except Exception as e:
+            print(f"  ✗ {article['ticket_id']}: {stage_name} failed: {e}")
+            return None
+
+    partials_published = set()
+
+    def run_publish_partial(article_num, article, partial_mp3, seconds):
+        if guarded("Partial publish", article, publish_partial_stage,
+                   article, partial_mp3, seconds, output_dir, review_date):
+            partials_published.add(article_num)
+
+    def run_publish(article_num, article, final_mp3):
+        done.put((article_num, guarded("Publish", article, publish_stage,
+                                       article, final_mp3, output_dir, review_date)))
+
+    def run_synthesize(article_num, article, text, output_mp3):
+        def on_partial(partial_mp3, seconds):
+            publish_pool.submit(run_publish_partial, article_num, article, partial_mp3, seconds)
+
+        final_mp3 = guarded("Audio generation", article, synthesize_stage, article, text, output_mp3,
+                            stream, partial_minutes, on_partial)
+        if final_mp3:
+            publish_pool.submit(run_publish, article_num, article, final_mp3)
+        else:
+            done.put((article_num, None))
+
+    def run_extract(article_num, article, output_mp3):
+        text = guarded("Extraction", article, extract_stage, article_num, article, pdf_dir)
+        if text:
+            synthesize_pool.submit(run_synthesize, article_num, article, text, output_mp3)
+        else:
+            done.put((article_num, None))
+
+    pending = 0
+    results = {}
+    for article_num, article in article_items:
+        print(f"Article {article_num}: {article['title']} [{article['ticket_id']}]")
+
+        # Check if audio already exists
+        output_mp3 = output_dir / f"{article['ticket_id']}.mp3"
+        if output_mp3.exists():
+            print(f"  ✓ Audio already exists: {output_mp3}")
+            results[article_num] = {
+                'ticket_id': article['ticket_id'],
+                'audio_path': str(output_mp3),
+                'status': 'existing'
+            }
+            continue
+
+        extract_pool.submit(run_extract, article_num, article, output_mp3)
+        pending += 1
+
+    # Progress bar over completed articles (if tqdm available)
+    progress_desc = "Generating audio" if HAS_TQDM else None
+    for _ in tqdm(range(pending), desc=progress_desc, unit="article", disable=not HAS_TQDM):
+        article_num, result = done.get()
+        if result:
+            results[article_num] = result
+
+    for pool in (extract_pool, synthesize_pool, publish_pool):
+        pool.shutdown(wait=True)
+
+    for article_num in partials_published:
+        if article_num in results:
+            results[article_num]['partial_published'] = True
+
+    return [results[num] for num in sorted(results)]
+
+def positive_minutes(value):
+    """argparse type for --publish-partial-after."""
+    try:
+        minutes = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid minutes: {value!r}")
+    if minutes <= 0:
+        raise argparse.ArgumentTypeError(f"minutes must be greater than 0, got {value}")
+    return minutes
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate audio for HIGH priority articles in an assessment",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument("pdf_dir", help="Directory containing the article PDFs")
+    parser.add_argument("assessment_md", help="Assessment markdown file")
+    parser.add_argument("metadata_json", nargs="?", default=None,
+                        help="Article metadata JSON for ticket IDs (default: looked up in /tmp/ by date)")
+    parser.add_argument("--plan", action="store_true",
+                        help="Print the estimated run (exact, from extracted text) and exit")
+    parser.add_argument("--no-tts-cache", action="store_true",
+                        help="Synthesize every chunk again instead of reusing cached audio")
+    parser.add_argument("--stream", action="store_true",
+                        help="Write episodes progressively to audio-reviews/streaming/ as chunks arrive")
+    parser.add_argument("--publish-partial-after", type=positive_minutes, default=None, metavar="MINUTES",
+                        help="Publish a partial episode once MINUTES of audio are ready (implies --stream)")
+    args = parser.parse_args()
+
+    partial_minutes = args.publish_partial_after
+    stream = args.stream or partial_minutes is not None
+    plan_only = args.plan
+
+    global TTS_USE_CACHE
+    TTS_USE_CACHE = not args.no_tts_cache
+
+    pdf_dir = Path(args.pdf_dir)
+    assessment_path = Path(args.assessment_md)
     output_dir = Path("/Users/bgerby/Documents/dev/ai/audio-reviews")
 
     # Extract review date from assessment filename for proper Drive folder organization
@@ -756,10 +1146,8 @@ def main():
     review_date = date_match.group(1) if date_match else None
 
     # Optional metadata path for ticket ID mapping
-    metadata_path = None
-    if len(sys.argv) > 3:
-        metadata_path = sys.argv[3]
-    else:
+    metadata_path = args.metadata_json
+    if not metadata_path:
         # Try to find metadata JSON automatically in /tmp/
         import glob
         if review_date:
@@ -783,47 +1171,23 @@ def main():
         print(f"Error: Assessment file not found: {assessment_path}")
         sys.exit(1)
 
-    # Prevent concurrent execution with lockfile
-    lock_file_path = '/tmp/generate-audio-from-assessment.lock'
-    lock_file = open(lock_file_path, 'w')
-
-    try:
-        # Try to acquire exclusive lock (non-blocking)
-        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
-    except BlockingIOError:
-        print("❌ Error: Another instance of this script is already running")
-        print(f"   Lock file: {lock_file_path}")
-        print("   If no other instance is running, remove the lock file manually")
-        sys.exit(1)
+    # Prevent concurrent execution with lockfile (--plan only reads, so it may run alongside)
+    if not plan_only:
+        lock_file_path = '/tmp/generate-audio-from-assessment.lock'
+        lock_file = open(lock_file_path, 'w')
 
-    # Lock will be automatically released when script exits (or file closes)
-
-    # Check disk space before starting (critical - audio files can be large!)
-    import shutil
-    try:
-        free_space_bytes = shutil.disk_usage(output_dir.parent if output_dir.exists() else '.').free
-        free_space_mb = free_space_bytes / (1024 * 1024)
-
-        # Estimate: ~10MB per article (conservative estimate for audio files)
-        # Count PDFs to estimate required space
-        pdf_count = len(list(pdf_dir.glob('*.pdf')))
-        required_space_mb = pdf_count * 10
-
-        print(f"\nDisk Space Check:")
-        print(f"  Available: {free_space_mb:.1f} MB")
-        print(f"  Required: ~{required_space_mb} MB (for ~{pdf_count} articles)")
-
-        if free_space_mb < required_space_mb:
-            print(f"  ✗ ERROR: Insufficient disk space!")
-            print(f"  Need at least {required_space_mb} MB, have {free_space_mb:.1f} MB")
+        try:
+            # Try to acquire exclusive lock (non-blocking)
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            print("❌ Error: Another instance of this script is already running")
+            print(f"   Lock file: {lock_file_path}")
+            print("   If no other instance is running, remove the lock file manually")
             sys.exit(1)
 
-        print(f"  ✓ Sufficient disk space available\n")
-    except Exception as e:
-        print(f"  ⚠ Warning: Could not check disk space: {e}")
-        # Continue anyway - disk space check is informational
+        # Lock will be automatically released when script exits (or file closes)
+        output_dir.mkdir(parents=True, exist_ok=True)
 
-    output_dir.mkdir(parents=True, exist_ok=True)
 
     print("Medium Article Audio Generator")
     print("=" * 50)
@@ -840,6 +1204,39 @@ def main():
     print(f"Found {len(articles)} articles")
     print()
 
+    # Only HIGH priority articles get audio
+    high_articles = {k: v for k, v in articles.items() if v['priority'] == 'HIGH'}
+
+    # Estimate the run (--plan extracts every article for exact figures; a real
+    # run leaves extraction to the pipeline so it overlaps with TTS)
+    print(f"Estimating audio for {len(high_articles)} HIGH priority articles...")
+    plan, estimates = plan_audio_run(sorted(high_articles.items()), pdf_dir, output_dir, stream,
+                                     extract=plan_only)
+    print_audio_plan(plan, estimates)
+
+    if plan_only:
+        return
+
+    # Check disk space before starting (critical - audio files can be large!)
+    import shutil
+    try:
+        free_space_bytes = shutil.disk_usage(output_dir).free
+        required_bytes = plan['required_bytes']
+
+        print(f"\nDisk Space Check:")
+        print(f"  Available: {format_mb(free_space_bytes)}")
+        print(f"  Required: ~{format_mb(required_bytes)} (for {plan['articles']} articles)")
+
+        if free_space_bytes < required_bytes:
+            print(f"  ✗ ERROR: Insufficient disk space!")
+            print(f"  Need at least {format_mb(required_bytes)}, have {format_mb(free_space_bytes)}")
+            sys.exit(1)
+
+        print(f"  ✓ Sufficient disk space available\n")
+    except Exception as e:
+        print(f"  ⚠ Warning: Could not check disk space: {e}")
+        # Continue anyway - disk space check is informational
+
     # PHASE 1: Update JIRA tickets with assessments for ALL articles
     print("=" * 50)
     print("PHASE 1: Updating JIRA tickets with assessments")
@@ -858,151 +1255,29 @@ def main():
             print(f"  ✗ JIRA update failed")
 
     # PHASE 2: Generate audio for HIGH priority articles only
-    high_articles = {k: v for k, v in articles.items() if v['priority'] == 'HIGH'}
     print(f"\n{'=' * 50}")
     print(f"PHASE 2: Generating audio for {len(high_articles)} HIGH priority articles")
     print("=" * 50)
     print()
 
-    results = []
-
-    # Progress bar for audio generation (if tqdm available)
-    article_items = sorted(high_articles.items())
-    progress_desc = "Generating audio" if HAS_TQDM else None
-
-    for article_num, article in tqdm(article_items, desc=progress_desc, unit="article", disable=not HAS_TQDM):
-        if HAS_TQDM:
-            tqdm.write(f"\nProcessing Article {article_num}: {article['title']}")
-        else:
-            print(f"\nProcessing Article {article_num}: {article['title']}")
-        print(f"Ticket: {article['ticket_id']}")
-
-        # Check if audio already exists
-        output_mp3 = output_dir / f"{article['ticket_id']}.mp3"
-        if output_mp3.exists():
-            print(f"  ✓ Audio already exists: {output_mp3}")
-            results.append({
-                'ticket_id': article['ticket_id'],
-                'audio_path': str(output_mp3),
-                'status': 'existing'
-            })
-            continue
-
-        # Find PDF - try both GAT format and numbered format
-        # Format 1: GAT-387-how-to-work-with-claude-code...pdf
-        pdf_pattern = f"{article['ticket_id']}-*.pdf"
-        matching_pdfs = list(pdf_dir.glob(pdf_pattern))
-
-        # Format 2 (fallback): 03-how-to-work-with-claude-code...pdf
-        if not matching_pdfs:
-            numbered_pattern = f"{article_num:02d}-*.pdf"
-            matching_pdfs = list(pdf_dir.glob(numbered_pattern))
-            if matching_pdfs:
-                print(f"  Found PDF using numbered format: {matching_pdfs[0].name}")
-            else:
-                print(f"  ⚠ No PDF found (tried {pdf_pattern} and {numbered_pattern})")
-                continue
-        else:
-            print(f"  Found PDF: {matching_pdfs[0].name}")
-
-        pdf_path = matching_pdfs[0]
-
-        # Extract and clean text
-        print(f"  Extracting text from PDF...")
-        text = extract_text_from_pdf(pdf_path)
-        if not text:
-            continue
-
-        text = clean_text_for_speech(text)
-        if len(text) < 100:
-            print(f"  ⚠ Text too short ({len(text)} chars)")
-            continue
-
-        # Prepend executive summary
-        full_text = article['executive_summary'] + text
-
-        # Generate audio
-        print(f"  Generating audio ({len(full_text)} chars)...")
-        temp_audio = output_dir / f"{article['ticket_id']}.temp.mp3"
-
-        if not generate_audio_openai(full_text, temp_audio):
-            print(f"  ✗ Audio generation failed")
-            continue
-
-        # Add metadata
-        print(f"  Adding metadata...")
-        final_mp3 = add_metadata(temp_audio, article['title'], article['ticket_id'], article['relevance_summary'])
-
-        if not final_mp3:
-            print(f"  ✗ Metadata addition failed")
-            continue
-
-        print(f"  ✓ Created: {final_mp3}")
-
-        # Upload to Google Drive
-        print(f"  Uploading to Google Drive...")
-        audio_drive_link = upload_audio_to_drive(final_mp3, review_date)
-
-        if audio_drive_link:
-            print(f"  ✓ Uploaded: {audio_drive_link}")
-
-            # Convert view link to download link
-            # Format: https://drive.google.com/file/d/FILE_ID/view?usp=drivesdk
-            # Convert to: https://drive.google.com/uc?export=download&id=FILE_ID
-            file_id_match = re.search(r'/d/([a-zA-Z0-9_-]+)/', audio_drive_link)
-            if file_id_match:
-                file_id = file_id_match.group(1)
-                download_link = f"https://drive.google.com/uc?export=download&id={file_id}"
-
-                # Update drive-urls.json
-                drive_urls_file = output_dir / "drive-urls.json"
-                try:
-                    if drive_urls_file.exists():
-                        with open(drive_urls_file, 'r') as f:
-                            drive_urls = json.load(f)
-                    else:
-                        drive_urls = {}
-
-                    drive_urls[f"{article['ticket_id']}.mp3"] = download_link
-
-                    with open(drive_urls_file, 'w') as f:
-                        json.dump(drive_urls, f, indent=2, sort_keys=True)
-
-                    print(f"  ✓ Updated drive-urls.json")
-                except Exception as e:
-                    print(f"  ⚠ Failed to update drive-urls.json: {e}")
-
-            # Update JIRA ticket with audio link (re-update with assessment + audio)
-            print(f"  Updating JIRA ticket {article['ticket_id']} with audio link...")
-            if update_jira_with_assessment(article['ticket_id'], article, audio_link=audio_drive_link):
-                print(f"  ✓ JIRA ticket updated with audio link")
-                results.append({
-                    'ticket_id': article['ticket_id'],
-                    'audio_path': str(final_mp3),
-                    'audio_drive_link': audio_drive_link,
-                    'title': article['title'],
-                    'status': 'generated',
-                    'jira_updated': True
-                })
-            else:
-                print(f"  ⚠ JIRA update failed (audio file still available)")
-                results.append({
-                    'ticket_id': article['ticket_id'],
-                    'audio_path': str(final_mp3),
-                    'audio_drive_link': audio_drive_link,
-                    'title': article['title'],
-                    'status': 'generated',
-                    'jira_updated': False
-                })
-        else:
-            print(f"  ⚠ Drive upload failed (audio file still available locally)")
-            results.append({
-                'ticket_id': article['ticket_id'],
-                'audio_path': str(final_mp3),
-                'title': article['title'],
-                'status': 'generated',
-                'jira_updated': False
-            })
+    if stream:
+        print(f"Streaming episodes to {output_dir / STREAM_DIR_NAME}/ as chunks arrive")
+        if partial_minutes:
+            print(f"Publishing partial episodes after {partial_minutes:g} min of audio")
+        print()
+
+    results = run_audio_pipeline(sorted(high_articles.items()), pdf_dir, output_dir, review_date,
+                                 stream=stream, partial_minutes=partial_minutes)
+
+    # A partial whose full episode failed must not stay in the feed on its own
+    retired = 0
+    if partial_minutes:
+        finished = {r['ticket_id'] for r in results}
+        for article_num, article in sorted(high_articles.items()):
+            ticket_id = article['ticket_id']
+            if ticket_id not in finished and retire_partial_episode(output_dir, output_dir / f"{ticket_id}.mp3"):
+                print(f"  ⚠ {ticket_id}: Full episode failed - partial episode retired")
+                retired += 1
 
     # Save results for reference
     results_file = output_dir / "audio-generation-results.json"
@@ -1017,44 +1292,16 @@ def main():
     print(f"JIRA tickets updated: {jira_updated}")
     print(f"Results saved to: {results_file}")
 
-    # Update RSS feed if any audio files were generated
-    if uploaded > 0:
+    # Update RSS feed if any audio files were generated (or partial episodes need replacing or removing)
+    partials = len([r for r in results if r.get('partial_published')]) + retired
+    if uploaded > 0 or partials > 0:
         print(f"\n{'=' * 50}")
         print("Updating podcast RSS feed...")
-        feed_dir = Path('/Users/bgerby/Documents/dev/ai/jaxon-research-feed')
 
-        try:
-            # Regenerate RSS feed
-            result = subprocess.run(
-                ['python3', 'generate-feed.py'],
-                cwd=str(feed_dir),
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-
-            if result.returncode == 0:
-                print("✓ RSS feed regenerated")
-
-                # Commit and push to GitHub Pages
-                commit_msg = f"Add {uploaded} audio reviews from {Path(pdf_dir).name.split('-')[-1]}"
-
-                subprocess.run(['git', 'add', 'feed.rss'], cwd=str(feed_dir), check=True)
-                subprocess.run(['git', 'commit', '-m', commit_msg], cwd=str(feed_dir), check=True)
-                subprocess.run(['git', 'push'], cwd=str(feed_dir), check=True)
-
-                print("✓ RSS feed published to GitHub Pages")
-                print("\nSubscribe URL:")
-                print("https://jaxondigital.github.io/jaxon-research-feed/feed.rss")
-            else:
-                print(f"✗ RSS feed generation failed: {result.stderr}")
-
-        except Exception as e:
-            print(f"✗ Error updating RSS feed: {e}")
-            print("  You can manually update with:")
-            print(f"  cd {feed_dir}")
-            print("  python3 generate-feed.py")
-            print("  git add feed.rss && git commit -m 'Update feed' && git push")
+        commit_msg = f"Add {uploaded} audio reviews from {Path(pdf_dir).name.split('-')[-1]}"
+        if update_rss_feed(commit_msg):
+            print("\nSubscribe URL:")
+            print("https://jaxondigital.github.io/jaxon-research-feed/feed.rss")
 
 if __name__ == '__main__':
     main()
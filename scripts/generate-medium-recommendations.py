@@ -26,10 +26,11 @@ import sys
 import json
 import re
 import os
-import subprocess
 from collections import defaultdict, Counter
 from datetime import datetime
 
+from pdf_metadata import extract_pdf_metadata
+
 def parse_assessment(assessment_path):
     """Parse relevance assessment markdown to get priority ratings per article."""
     with open(assessment_path, 'r') as f:
@@ -113,49 +114,15 @@ def parse_assessment(assessment_path):
 
     return articles
 
-def extract_author_from_pdf(pdf_path):
-    """Extract author name from PDF using pdftotext."""
+def extract_metadata_from_pdf(pdf_path):
+    """Author, publication, etc. from the PDF's first page (ArticleMetadata), or None."""
     if not os.path.exists(pdf_path):
         return None
 
     try:
-        # Extract first page text
-        result = subprocess.run(
-            ['pdftotext', '-l', '1', pdf_path, '-'],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-
-        if result.returncode != 0:
-            return None
-
-        text = result.stdout
-
-        # Common patterns for author names on Medium
-        # Pattern 1: "Written by AuthorName" or "By AuthorName"
-        match = re.search(r'(?:Written by|By)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', text)
-        if match:
-            return match.group(1)
-
-        # Pattern 2: Author name usually appears near top, look for capitalized names
-        lines = text.split('\n')[:10]  # First 10 lines
-        for line in lines:
-            # Skip common headers
-            if any(skip in line for skip in ['Medium', 'Member-only', 'Open in app', 'Sign up', 'Sign in']):
-                continue
-            # Look for names (2-3 capitalized words)
-            match = re.search(r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})$', line.strip())
-            if match:
-                name = match.group(1)
-                # Exclude common false positives
-                if name not in ['The Context', 'Context Layer', 'Model Context']:
-                    return name
-
-        return None
-
+        return extract_pdf_metadata(pdf_path)
     except Exception as e:
-        print(f"Warning: Failed to extract author from {pdf_path}: {e}", file=sys.stderr)
+        print(f"Warning: Failed to extract metadata from {pdf_path}: {e}", file=sys.stderr)
         return None
 
 def extract_publication_from_url(url):
@@ -227,8 +194,9 @@ def generate_recommendations(assessment_path, metadata_path, pdf_dir=None):
         meta = article_map[num]
         priority = article['priority']
 
-        # Extract author
+        # Extract author (and publication) from the PDF
         author = None
+        pdf_metadata = None
         if pdf_dir:
             # Find PDF by article number prefix (robust to filename variations)
             pdf_prefix = f"{num:02d}-"
@@ -236,7 +204,8 @@ def generate_recommendations(assessment_path, metadata_path, pdf_dir=None):
 
             if pdf_files:
                 pdf_path = os.path.join(pdf_dir, pdf_files[0])
-                author = extract_author_from_pdf(pdf_path)
+                pdf_metadata = extract_metadata_from_pdf(pdf_path)
+                author = pdf_metadata.author if pdf_metadata else None
 
         if not author:
             # Try to extract from URL
@@ -247,6 +216,8 @@ def generate_recommendations(assessment_path, metadata_path, pdf_dir=None):
 
         # Extract publication
         publication = extract_publication_from_url(meta['url'])
+        if not publication and pdf_metadata:
+            publication = pdf_metadata.publication
 
         # Track author scores
         if author:
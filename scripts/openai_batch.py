@@ -0,0 +1,167 @@
+"""
+OpenAI Batch API boundary for offline (overnight) assessment runs.
+
+Chat completion requests are written to a JSONL request file, submitted as a
+single batch, polled until the batch reaches a terminal state, and the output
+file is mapped back to each request's custom_id.
+
+All service calls go through a BatchBackend, so the flow can be exercised
+against a local stand-in server (pass base_url when creating the OpenAI
+client) or a different backend without touching the calling script.
+
+Usage:
+    from openai_batch import OpenAIBatchBackend, run_batch
+
+    backend = OpenAIBatchBackend(client)
+    results = run_batch(backend, [(custom_id, body), ...], "/tmp/batch-work")
+    # results[custom_id] -> response body dict, or None if that request failed
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Endpoint every request in the batch is sent to
+CHAT_COMPLETIONS_ENDPOINT = "/v1/chat/completions"
+
+# Batch states after which polling stops
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+DEFAULT_POLL_INTERVAL = 60  # seconds
+DEFAULT_COMPLETION_WINDOW = "24h"
+
+class BatchBackend:
+    """Interface for a batch service: submit a request file, poll it, fetch output."""
+
+    def submit(self, requests_path: str, description: str = "") -> str:
+        """Upload the request file and start a batch. Returns the batch ID."""
+        raise NotImplementedError
+
+    def status(self, batch_id: str) -> Dict:
+        """Return {'status': ..., 'completed': n, 'failed': n, 'total': n}."""
+        raise NotImplementedError
+
+    def fetch_output(self, batch_id: str) -> List[Dict]:
+        """Return the parsed output lines of a finished batch."""
+        raise NotImplementedError
+
+class OpenAIBatchBackend(BatchBackend):
+    """Batch backend using the OpenAI Files and Batches APIs."""
+
+    def __init__(self, client, endpoint: str = CHAT_COMPLETIONS_ENDPOINT,
+                 completion_window: str = DEFAULT_COMPLETION_WINDOW):
+        self.client = client
+        self.endpoint = endpoint
+        self.completion_window = completion_window
+
+    def submit(self, requests_path: str, description: str = "") -> str:
+        with open(requests_path, 'rb') as f:
+            upload = self.client.files.create(file=f, purpose="batch")
+
+        batch = self.client.batches.create(
+            input_file_id=upload.id,
+            endpoint=self.endpoint,
+            completion_window=self.completion_window,
+            metadata={"description": description} if description else None
+        )
+        return batch.id
+
+    def status(self, batch_id: str) -> Dict:
+        batch = self.client.batches.retrieve(batch_id)
+        counts = batch.request_counts
+        return {
+            "status": batch.status,
+            "completed": getattr(counts, "completed", 0) if counts else 0,
+            "failed": getattr(counts, "failed", 0) if counts else 0,
+            "total": getattr(counts, "total", 0) if counts else 0,
+        }
+
+    def fetch_output(self, batch_id: str) -> List[Dict]:
+        batch = self.client.batches.retrieve(batch_id)
+
+        lines = []
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            content = self.client.files.content(file_id).text
+            lines.extend(json.loads(line) for line in content.splitlines() if line.strip())
+
+        return lines
+
+def write_batch_requests(path: str, requests: List[Tuple[str, Dict]],
+                         endpoint: str = CHAT_COMPLETIONS_ENDPOINT) -> None:
+    """Write (custom_id, body) pairs as a Batch API JSONL request file."""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+    with open(path, 'w', encoding='utf-8') as f:
+        for custom_id, body in requests:
+            f.write(json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": endpoint,
+                "body": body
+            }, ensure_ascii=False) + "\n")
+
+def parse_batch_output(lines: List[Dict]) -> Dict[str, Optional[Dict]]:
+    """Map custom_id to the response body (None for failed requests)."""
+    results = {}
+
+    for line in lines:
+        custom_id = line.get("custom_id")
+        response = line.get("response") or {}
+
+        if line.get("error") or response.get("status_code") != 200:
+            error = line.get("error") or response.get("body", {}).get("error")
+            print(f"  ⚠ Batch request {custom_id} failed: {error}")
+            results[custom_id] = None
+        else:
+            results[custom_id] = response.get("body")
+
+    return results
+
+def run_batch(backend: BatchBackend, requests: List[Tuple[str, Dict]], work_dir: str,
+              label: str = "batch", poll_interval: int = DEFAULT_POLL_INTERVAL) -> Dict[str, Optional[Dict]]:
+    """
+    Submit requests as one batch, wait for it to finish and return results.
+
+    Args:
+        backend: Batch service to use
+        requests: (custom_id, request body) pairs
+        work_dir: Directory for the request file and batch ID record
+        label: Name for this batch (request file name and description)
+        poll_interval: Seconds between status checks
+
+    Returns:
+        Dict of custom_id -> response body, or None for requests that failed
+        or are missing from the output (e.g. expired batches)
+    """
+    if not requests:
+        return {}
+
+    requests_path = os.path.join(work_dir, f"{label}.requests.jsonl")
+    write_batch_requests(requests_path, requests)
+
+    batch_id = backend.submit(requests_path, description=label)
+    print(f"  → Submitted {label}: {len(requests)} requests (batch {batch_id})")
+
+    # Record the batch ID so an interrupted run can be inspected or recovered
+    with open(os.path.join(work_dir, f"{label}.batch-id"), 'w') as f:
+        f.write(batch_id + "\n")
+
+    while True:
+        status = backend.status(batch_id)
+        if status["status"] in TERMINAL_STATUSES:
+            break
+        print(f"  … {label}: {status['status']} "
+              f"({status['completed']}/{status['total']} done, {status['failed']} failed)")
+        time.sleep(poll_interval)
+
+    print(f"  ✓ {label}: {status['status']} "
+          f"({status['completed']}/{status['total']} done, {status['failed']} failed)")
+
+    results = parse_batch_output(backend.fetch_output(batch_id)) if status["status"] != "failed" else {}
+
+    # Anything missing from the output counts as failed
+    return {custom_id: results.get(custom_id) for custom_id, _ in requests}
@@ -0,0 +1,147 @@
+"""
+Article metadata (title, author, publication, date, reading time, URL) from PDFs.
+
+Medium PDFs carry everything on their first page:
+
+    Publication Name · Follow publication
+
+    Article Title
+    8 min read · Oct 8, 2025
+    Author Name  Follow
+
+plus the article URL in the browser's print header or footer. One parse of
+the first page fills a typed ArticleMetadata record. The page is cut from
+the full text when the PDF text store already has it (no extraction at all),
+else read with a first-page-only extraction (pdftotext -l 1). The record is
+stored next to the text, keyed by the PDF's content hash, so ID3 tagging,
+metadata fixes and recommendations share a single extraction.
+
+Fields that can't be found are None.
+
+Usage:
+    from pdf_metadata import extract_pdf_metadata
+
+    metadata = extract_pdf_metadata(pdf_path)
+    print(metadata.title, metadata.author, metadata.date, metadata.reading_time)
+"""
+
+import re
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+from content_cache import content_key
+from pdf_text import PDFTextStore, get_pdf_text_store
+from shared_patterns import MEDIUM_PUB_ARTICLE_PATTERN, MEDIUM_USER_ARTICLE_PATTERN
+
+# Bump when the parsing rules below change to invalidate stored records
+METADATA_VERSION = 1
+
+# Title between the publication/author "Follow" header and "min read"
+TITLE_AFTER_HEADER = re.compile(r'(?:· Follow publication|Follow)\s*\n\s*\n(.+?)\n\s*\d+\s+min read', re.DOTALL)
+TITLE_BEFORE_READ_TIME = re.compile(r'(.+?)\n\s*\d+\s+min read')
+
+READ_TIME = re.compile(r'(\d+)\s+min read')
+# "8 min read · Oct 8, 2025", followed by the author line
+READ_TIME_AND_DATE = re.compile(r'\d+\s+min read\s+·\s+([A-Z][a-z]+)\s+(\d+),\s+(\d+)')
+AUTHOR_AFTER_DATE = re.compile(r'\d+\s+min read\s+·\s+[A-Z][a-z]+\s+\d+,\s+\d+\s*\n\s*([^\n]+)')
+BUTTON_SUFFIX = re.compile(r'\s*(Follow|Listen|Share|More)\s*$')
+
+# Fallbacks: "Written by Name" / "By Name", or a bare 2-3 word name near the top
+AUTHOR_BYLINE = re.compile(r'(?:Written by|By)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)')
+AUTHOR_NAME_LINE = re.compile(r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})$')
+AUTHOR_SKIP_LINES = ['Medium', 'Member-only', 'Open in app', 'Sign up', 'Sign in']
+AUTHOR_FALSE_POSITIVES = {'The Context', 'Context Layer', 'Model Context'}
+
+PUBLICATION = re.compile(r'^\s*([^\n·]+?)\s*·\s*Follow publication', re.MULTILINE)
+
+MEDIUM_ARTICLE_URL = re.compile(f'{MEDIUM_USER_ARTICLE_PATTERN}|{MEDIUM_PUB_ARTICLE_PATTERN}')
+ANY_URL = re.compile(r'https?://[^\s<>"]+')
+
+class ArticleMetadata(NamedTuple):
+    title: Optional[str] = None
+    author: Optional[str] = None
+    publication: Optional[str] = None
+    date: Optional[str] = None            # As printed, e.g. "Oct 8, 2025"
+    reading_time: Optional[int] = None    # Minutes
+    url: Optional[str] = None             # Without query string or fragment
+
+def _one_line(text: str) -> str:
+    return ' '.join(text.split())
+
+def parse_title(text: str) -> Optional[str]:
+    match = TITLE_AFTER_HEADER.search(text) or TITLE_BEFORE_READ_TIME.search(text)
+    if not match:
+        return None
+    return _one_line(match.group(1)) or None
+
+def parse_author(text: str) -> Optional[str]:
+    match = AUTHOR_AFTER_DATE.search(text)
+    if match:
+        author = BUTTON_SUFFIX.sub('', match.group(1).strip())
+        if author:
+            return author
+
+    match = AUTHOR_BYLINE.search(text)
+    if match:
+        return match.group(1)
+
+    for line in text.split('\n')[:10]:
+        if any(skip in line for skip in AUTHOR_SKIP_LINES):
+            continue
+        match = AUTHOR_NAME_LINE.match(line.strip())
+        if match and match.group(1) not in AUTHOR_FALSE_POSITIVES:
+            return match.group(1)
+
+    return None
+
+def parse_url(text: str) -> Optional[str]:
+    """The Medium article URL if present, else the first URL on the page (canonical form)."""
+    match = MEDIUM_ARTICLE_URL.search(text) or ANY_URL.search(text)
+    if not match:
+        return None
+    return re.split(r'[?#]', match.group(0))[0].rstrip('.,;)')
+
+def parse_article_metadata(text: str) -> ArticleMetadata:
+    """All metadata fields from (first-page) PDF text."""
+    date_match = READ_TIME_AND_DATE.search(text)
+    read_time_match = READ_TIME.search(text)
+    publication_match = PUBLICATION.search(text)
+
+    return ArticleMetadata(
+        title=parse_title(text),
+        author=parse_author(text),
+        publication=publication_match.group(1).strip() if publication_match else None,
+        date="{} {}, {}".format(*date_match.groups()) if date_match else None,
+        reading_time=int(read_time_match.group(1)) if read_time_match else None,
+        url=parse_url(text),
+    )
+
+def extract_pdf_metadata(pdf_path, store: Optional[PDFTextStore] = None) -> ArticleMetadata:
+    """
+    Metadata of a PDF from its first page, stored with its text. Call it
+    after reading the full text (read_pdf_text) to avoid a second extraction.
+
+    Raises what read_pdf_text raises if the PDF can't be read.
+    """
+    store = store or get_pdf_text_store()
+    digest = store.fingerprint(pdf_path)
+    key = content_key('pdf-metadata', METADATA_VERSION, store.backend.version, digest)
+
+    stored = store.cache.get_json(key)
+    if isinstance(stored, dict) and isinstance(stored.get('metadata'), dict):
+        return ArticleMetadata(**{field: stored['metadata'].get(field) for field in ArticleMetadata._fields})
+
+    # Reuse stored full text (pages end with form feeds) before extracting page 1 alone
+    full_text = store.stored_text(pdf_path)
+    if full_text is not None:
+        first_page = full_text.split('\f', 1)[0]
+    else:
+        first_page = store.text(pdf_path, last_page=1)
+
+    metadata = parse_article_metadata(first_page)
+    store.cache.put_json(key, {
+        'sha256': digest,
+        'parsed': datetime.now().isoformat(timespec='seconds'),
+        'metadata': metadata._asdict(),
+    })
+    return metadata
@@ -0,0 +1,401 @@
+"""
+Shared PDF text extraction with a persistent on-disk text store.
+
+Every script used to run pdftotext on the same PDFs again and again. Here
+each extraction is stored once, keyed by the SHA-256 of the PDF's bytes plus
+the extraction mode (raw or -layout) and page range, so repeat reads - from
+any script, in any later run - are served from disk without a subprocess.
+
+Hashing a PDF on every read would cost almost as much as re-reading it, so
+the content hash is itself cached under the file's (resolved path, size,
+mtime). A touched or rewritten file gets a new stat key and is re-hashed; a
+PDF copied or moved elsewhere hashes to the same content and hits.
+
+Extraction goes through a pluggable backend: pdftotext (poppler, one
+subprocess per PDF) or pypdf (in-process, no fork/exec, safe in threads).
+PDF_TEXT_BACKEND=pdftotext|pypdf|auto picks one; auto (the default) uses
+pdftotext when installed - the cleaning rules were written against its
+output - and falls back to pypdf instead of failing when the binary is
+missing. Stored text is keyed by backend version, so outputs never mix.
+check-pdf-text-parity.py compares the two on the pdfs/ corpus.
+
+Errors are those of subprocess.run(check=True): TimeoutExpired,
+CalledProcessError with stderr (ExtractionError for in-process backends)
+and FileNotFoundError (missing PDF or backend). Failures are never stored.
+
+extract_pdfs() does the same for whole directories across a process pool
+(one worker per CPU), yielding results as they finish. Workers read and
+fill the same on-disk store, so a backfill warms it for every script.
+
+Usage:
+    from pdf_text import read_pdf_text, extract_pdfs
+
+    text = read_pdf_text(pdf_path)                      # pdftotext pdf -
+    text = read_pdf_text(pdf_path, layout=True)         # pdftotext -layout pdf -
+    first_page = read_pdf_text(pdf_path, last_page=1)   # pdftotext -l 1 pdf -
+
+    for result in extract_pdfs(["../pdfs/medium-articles-2025-10-22"]):
+        print(result.path, result.error or len(result.text))
+"""
+
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, List, NamedTuple, Optional
+
+from content_cache import ContentCache, DEFAULT_CACHE_ROOT, content_key
+
+# pypdf is optional - without it only the pdftotext backend is available
+try:
+    import pypdf
+    HAS_PYPDF = True
+except ImportError:
+    HAS_PYPDF = False
+
+PDF_TEXT_STORE_DIR = os.path.join(DEFAULT_CACHE_ROOT, "pdf-text")
+PDF_TEXT_STORE_MAX_MB = 500
+
+EXTRACTION_TIMEOUT = 30
+
+DEFAULT_BACKEND = os.environ.get("PDF_TEXT_BACKEND", "auto")
+
+HASH_BLOCK_SIZE = 1024 * 1024
+
+def sha256_file(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def run_pdftotext(pdf_path, layout: bool = False, first_page: Optional[int] = None,
+                  last_page: Optional[int] = None, timeout: float = EXTRACTION_TIMEOUT) -> str:
+    """Run pdftotext and return its output (raises like subprocess.run(check=True))."""
+    cmd = ['pdftotext']
+    if layout:
+        cmd.append('-layout')
+    if first_page:
+        cmd += ['-f', str(first_page)]
+    if last_page:
+        cmd += ['-l', str(last_page)]
+    cmd += [str(pdf_path), '-']
+
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=timeout)
+    return result.stdout
+
+class ExtractionError(subprocess.CalledProcessError):
+    """An in-process backend failed on a PDF (raised like a failed pdftotext run)."""
+
+    def __init__(self, backend: str, pdf_path, message: str):
+        super().__init__(1, [backend, str(pdf_path)], output='', stderr=message)
+
+    def __str__(self):
+        return f"{self.cmd[0]} could not read {self.cmd[1]}: {self.stderr}"
+
+class ExtractionBackend:
+    """
+    Turns a PDF, or a page range of it, into text.
+
+    Subclasses set name and version (version is part of the store key: bump
+    it when output changes) and implement extract(). Pages are 1-based and
+    inclusive, like pdftotext -f/-l; pages end with a form feed.
+    """
+
+    name = ''
+    version = ''
+
+    def available(self) -> bool:
+        return True
+
+    def extract(self, pdf_path, layout: bool = False, first_page: Optional[int] = None,
+                last_page: Optional[int] = None, timeout: float = EXTRACTION_TIMEOUT) -> str:
+        raise NotImplementedError
+
+class PdftotextBackend(ExtractionBackend):
+    """poppler's pdftotext, one subprocess per PDF."""
+
+    name = 'pdftotext'
+    version = 'pdftotext-1'
+
+    def available(self) -> bool:
+        return shutil.which('pdftotext') is not None
+
+    def extract(self, pdf_path, layout=False, first_page=None, last_page=None, timeout=EXTRACTION_TIMEOUT):
+        return run_pdftotext(pdf_path, layout=layout, first_page=first_page,
+                             last_page=last_page, timeout=timeout)
+
+class PypdfBackend(ExtractionBackend):
+    """
+    pypdf, in-process. Only the requested pages are parsed, so first-page
+    reads stay cheap. The timeout is not enforced (there is no process to kill).
+    """
+
+    name = 'pypdf'
+    version = f"pypdf-{pypdf.__version__}-1" if HAS_PYPDF else 'pypdf'
+
+    def available(self) -> bool:
+        return HAS_PYPDF
+
+    def extract(self, pdf_path, layout=False, first_page=None, last_page=None, timeout=EXTRACTION_TIMEOUT):
+        try:
+            reader = pypdf.PdfReader(str(pdf_path))
+            start = (first_page or 1) - 1
+            stop = min(last_page or len(reader.pages), len(reader.pages))
+
+            pages = []
+            for index in range(start, stop):
+                page = reader.pages[index]
+                text = page.extract_text(extraction_mode='layout') if layout else page.extract_text()
+                if text and not text.endswith('\n'):
+                    text += '\n'
+                pages.append(text + '\f')
+            return ''.join(pages)
+        except OSError:
+            raise
+        except Exception as e:
+            # pypdf raises a variety of parse errors on damaged PDFs
+            raise ExtractionError(self.name, pdf_path, str(e) or type(e).__name__) from e
+
+BACKENDS = {
+    'pdftotext': PdftotextBackend,
+    'pypdf': PypdfBackend,
+}
+
+def get_backend(name: Optional[str] = None) -> ExtractionBackend:
+    """
+    Backend by name, or for 'auto' pdftotext if installed, else pypdf.
+
+    Raises FileNotFoundError if the backend (or, for auto, any backend) is
+    not installed, and ValueError for an unknown name.
+    """
+    name = name or DEFAULT_BACKEND
+    if name == 'auto':
+        for backend_class in BACKENDS.values():
+            backend = backend_class()
+            if backend.available():
+                return backend
+        raise FileNotFoundError("No PDF text backend: install pdftotext (brew install poppler) or pypdf")
+
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown PDF text backend: {name} (choose from auto, {', '.join(BACKENDS)})")
+    backend = BACKENDS[name]()
+    if not backend.available():
+        raise FileNotFoundError(f"PDF text backend not installed: {name}")
+    return backend
+
+class PDFTextStore:
+    """
+    Extracted text of PDFs, stored on disk by content hash.
+
+    Args:
+        store_dir: Directory holding stored text and the stat -> hash index
+        max_bytes: Evict least recently used entries above this total size
+        read: If False, always re-extract (stored text is still refreshed)
+        write: If False, nothing is stored
+        backend: Extraction backend (default: get_backend())
+    """
+
+    def __init__(self, store_dir=PDF_TEXT_STORE_DIR, max_bytes: int = PDF_TEXT_STORE_MAX_MB * 1024 * 1024,
+                 read: bool = True, write: bool = True, backend: Optional[ExtractionBackend] = None):
+        self.cache = ContentCache(store_dir, max_bytes=max_bytes, suffix='.json', read=read, write=write)
+        self.backend = backend or get_backend()
+        self.extractions = 0   # Backend runs (store misses)
+        self._hashes = {}      # In-process memo of stat key -> content hash
+        self._lock = threading.Lock()
+
+    def fingerprint(self, pdf_path) -> str:
+        """SHA-256 of the PDF, hashed only when its path, size or mtime is new."""
+        path = Path(pdf_path).resolve()
+        stat = path.stat()
+        stat_key = content_key('pdf-stat', str(path), stat.st_size, stat.st_mtime_ns)
+
+        with self._lock:
+            digest = self._hashes.get(stat_key)
+        if digest:
+            return digest
+
+        entry = self.cache.get_json(stat_key)
+        digest = entry.get('sha256') if isinstance(entry, dict) else None
+        if not digest:
+            digest = sha256_file(path)
+            self.cache.put_json(stat_key, {'path': str(path), 'size': stat.st_size,
+                                           'mtime_ns': stat.st_mtime_ns, 'sha256': digest})
+
+        with self._lock:
+            self._hashes[stat_key] = digest
+        return digest
+
+    def _text_key(self, digest: str, layout: bool, first_page: Optional[int], last_page: Optional[int]) -> str:
+        mode = 'layout' if layout else 'raw'
+        return content_key('pdf-text', self.backend.version, digest, mode, first_page, last_page)
+
+    def stored_text(self, pdf_path, layout: bool = False, first_page: Optional[int] = None,
+                    last_page: Optional[int] = None) -> Optional[str]:
+        """Stored text of the PDF, or None if it hasn't been extracted (never extracts)."""
+        entry = self.cache.get_json(self._text_key(self.fingerprint(pdf_path), layout, first_page, last_page))
+        if isinstance(entry, dict) and isinstance(entry.get('text'), str):
+            return entry['text']
+        return None
+
+    def text(self, pdf_path, layout: bool = False, first_page: Optional[int] = None,
+             last_page: Optional[int] = None, timeout: float = EXTRACTION_TIMEOUT) -> str:
+        """Text of the PDF (from the store, or extracted and stored)."""
+        text = self.stored_text(pdf_path, layout=layout, first_page=first_page, last_page=last_page)
+        if text is not None:
+            return text
+
+        digest = self.fingerprint(pdf_path)
+        mode = 'layout' if layout else 'raw'
+        key = self._text_key(digest, layout, first_page, last_page)
+
+        text = self.backend.extract(pdf_path, layout=layout, first_page=first_page,
+                                    last_page=last_page, timeout=timeout)
+        with self._lock:
+            self.extractions += 1
+
+        self.cache.put_json(key, {
+            'sha256': digest,
+            'backend': self.backend.version,
+            'mode': mode,
+            'pages': [first_page, last_page],
+            'source': str(pdf_path),
+            'extracted': datetime.now().isoformat(timespec='seconds'),
+            'text': text,
+        })
+        return text
+
+def pdf_page_count(pdf_path, timeout: float = 10) -> Optional[int]:
+    """Number of pages (pypdf, else pdfinfo), without extracting text. None if unknown."""
+    if HAS_PYPDF:
+        try:
+            return len(pypdf.PdfReader(str(pdf_path)).pages)
+        except Exception:
+            return None
+
+    try:
+        result = subprocess.run(['pdfinfo', str(pdf_path)], capture_output=True, text=True,
+                                check=True, timeout=timeout)
+    except (subprocess.SubprocessError, OSError):
+        return None
+    match = re.search(r'^Pages:\s+(\d+)', result.stdout, re.MULTILINE)
+    return int(match.group(1)) if match else None
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+def get_pdf_text_store(**kwargs) -> PDFTextStore:
+    """Process-wide shared store (settings apply when it is first created)."""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = PDFTextStore(**kwargs)
+        return _default_store
+
+def read_pdf_text(pdf_path, layout: bool = False, first_page: Optional[int] = None,
+                  last_page: Optional[int] = None, timeout: float = EXTRACTION_TIMEOUT) -> str:
+    """Text of a PDF via the shared store (see PDFTextStore.text)."""
+    return get_pdf_text_store().text(pdf_path, layout=layout, first_page=first_page,
+                                     last_page=last_page, timeout=timeout)
+
+class ExtractionResult(NamedTuple):
+    path: Path
+    text: Optional[str]     # None on error, or when text wasn't requested
+    error: Optional[str]
+    extracted: bool         # True if the backend ran (store miss)
+
+def find_pdfs(sources: Iterable) -> List[Path]:
+    """PDF files from a mix of files and directories (searched recursively), without duplicates."""
+    pdfs = []
+    seen = set()
+    for source in sources:
+        source = Path(source)
+        candidates = sorted(source.rglob('*.pdf')) if source.is_dir() else [source]
+        for path in candidates:
+            if path not in seen:
+                seen.add(path)
+                pdfs.append(path)
+    return pdfs
+
+def describe_error(e: Exception) -> str:
+    """One-line message for an extraction failure (includes pdftotext's stderr)."""
+    if isinstance(e, ExtractionError):
+        return f"{e.cmd[0]}: {e.stderr}"
+    if isinstance(e, subprocess.TimeoutExpired):
+        return f"timeout after {e.timeout:g}s"
+    if isinstance(e, subprocess.CalledProcessError):
+        stderr = (e.stderr or '').strip().splitlines()
+        return f"{e.cmd[0]} exited {e.returncode}" + (f": {stderr[-1]}" if stderr else "")
+    return str(e)
+
+# Store of the current pool worker process (one per process, reused across PDFs)
+_worker_store = None
+
+def _extract_in_worker(pdf_path, store_dir, backend, layout, first_page, last_page, timeout, return_text):
+    global _worker_store
+    if (_worker_store is None or str(_worker_store.cache.cache_dir) != str(store_dir)
+            or _worker_store.backend.name != backend):
+        _worker_store = PDFTextStore(store_dir, backend=get_backend(backend))
+
+    before = _worker_store.extractions
+    try:
+        text = _worker_store.text(pdf_path, layout=layout, first_page=first_page,
+                                  last_page=last_page, timeout=timeout)
+    except (subprocess.SubprocessError, OSError) as e:
+        # Exceptions are flattened to text: CalledProcessError loses stderr when pickled
+        return None, describe_error(e), _worker_store.extractions > before
+    return (text if return_text else None), None, _worker_store.extractions > before
+
+def extract_pdfs(sources: Iterable, layout: bool = False, first_page: Optional[int] = None,
+                 last_page: Optional[int] = None, timeout: float = EXTRACTION_TIMEOUT,
+                 workers: Optional[int] = None, return_text: bool = True,
+                 store_dir=PDF_TEXT_STORE_DIR, backend: Optional[str] = None) -> Iterator[ExtractionResult]:
+    """
+    Extract many PDFs in parallel processes, yielding ExtractionResult as each finishes.
+
+    Args:
+        sources: PDF files and/or directories (searched recursively)
+        workers: Worker processes (default: CPU count)
+        return_text: If False, only fill the store (avoids sending text between processes)
+        store_dir: Text store shared by all workers
+        backend: Backend name (default: PDF_TEXT_BACKEND, resolved once here)
+
+    Results come back in completion order, not input order. At most a few
+    PDFs per worker are in flight, so memory stays flat on large trees.
+    """
+    pdfs = find_pdfs(sources)
+    if not pdfs:
+        return
+
+    backend = get_backend(backend).name
+    workers = max(1, min(workers or os.cpu_count() or 1, len(pdfs)))
+    pending = iter(pdfs)
+    in_flight = {}
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        def submit_next():
+            path = next(pending, None)
+            if path is not None:
+                future = executor.submit(_extract_in_worker, str(path), str(store_dir), backend, layout,
+                                         first_page, last_page, timeout, return_text)
+                in_flight[future] = path
+
+        for _ in range(workers * 4):
+            submit_next()
+
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = in_flight.pop(future)
+                try:
+                    text, error, extracted = future.result()
+                except Exception as e:
+                    # Worker died (e.g. killed) - report and keep going
+                    text, error, extracted = None, f"worker failed: {e}", False
+                submit_next()
+                yield ExtractionResult(path, text, error, extracted)
@@ -139,7 +139,8 @@ def main():
     print("   • Keep browser open between ALL articles (do not close)")
     print("   • Wait 30-45 seconds between each article navigation")
     print("   • Verify article text loads fully before saving PDF")
-    print("   • Check file size after each save: 400KB+ = success, ~115KB = paywall")
+    print("   • After saving, run: python3 check-pdf-quality.py <pdf folder>")
+    print("     (flags paywalled, empty or duplicated captures to re-save)")
     print()
 
     print("STEP 1: Navigate to each article and save as PDF with these EXACT filenames:")
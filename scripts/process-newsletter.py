@@ -14,6 +14,9 @@ import base64
 import email
 from email import policy
 
+from content_quality import find_paywall_markers
+from shared_patterns import MEMBER_ONLY_INDICATORS, PAYWALL_INDICATORS
+
 def extract_urls_from_email(email_path):
     """Extract Medium article URLs from email file"""
     with open(email_path, 'rb') as f:
@@ -80,19 +83,8 @@ def check_paywall(url):
         response = urllib.request.urlopen(req, timeout=10)
         content = response.read().decode('utf-8', errors='ignore')
 
-        # Check for paywall indicators
-        is_paywalled = False
-        paywall_indicators = [
-            'member-only',
-            'metered paywall',
-            'become a member',
-            'upgrade to read'
-        ]
-
-        for indicator in paywall_indicators:
-            if indicator.lower() in content.lower():
-                is_paywalled = True
-                break
+        # On the page itself a member-only badge does mean the story is gated
+        is_paywalled = bool(find_paywall_markers(content, PAYWALL_INDICATORS + MEMBER_ONLY_INDICATORS))
 
         # Try to extract title
         title_match = re.search(r'<title>([^<]+)</title>', content)
@@ -28,16 +28,23 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from strategic_context import STRATEGIC_CONTEXT
+
 # Constants
 FEEDBACK_LOG = "/Users/bgerby/Documents/dev/ai/feedback/article-feedback-log.jsonl"
-STRATEGIC_CONTEXT_PATH = "/Users/bgerby/Documents/dev/pivot/sprint-0/STRATEGIC_CONTEXT.md"
 
 def get_strategic_context_version() -> str:
-    """Get current strategic context version from file modification date."""
-    if os.path.exists(STRATEGIC_CONTEXT_PATH):
-        mtime = os.path.getmtime(STRATEGIC_CONTEXT_PATH)
-        return datetime.fromtimestamp(mtime).strftime("%Y-%m-%d")
-    return "unknown"
+    """
+    Get current strategic context version: the 12-character content hash that
+    assessments record in their header and JSON sidecar (e.g. "3f2a9c1b7d04").
+
+    Feedback recorded before this change stored the context file's modification
+    date ("YYYY-MM-DD") instead, so both formats appear in the feedback log.
+    """
+    try:
+        return STRATEGIC_CONTEXT.version
+    except Exception:
+        return "unknown"
 
 def get_article_metadata(ticket_id: str) -> Optional[Dict]:
     """
@@ -0,0 +1,251 @@
+"""
+Local relevance pre-filter that flags clear LOW articles before any LLM call.
+
+Each article (title plus the opening of its text) is scored with TF-IDF
+cosine similarity against two centroids built from historical assessments:
+articles previously rated HIGH and articles rated LOW. The strategic
+context's relevance criteria are added to the HIGH side, and a short list of
+known off-topic terms to the LOW side. Scoring is vectorized with NumPy over
+the whole batch.
+
+score = similarity(HIGH centroid) - similarity(LOW centroid)
+
+Articles scoring below the threshold are tagged LOW locally; everything else
+(borderline and likely relevant) still goes to the model.
+
+Usage:
+    from relevance_prefilter import RelevancePrefilter
+
+    prefilter = RelevancePrefilter.from_assessments("assessments/", strategic_context)
+    scores = prefilter.score([(title, text), ...])
+"""
+
+import math
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# NumPy is optional - without it the pre-filter is simply unavailable
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+DEFAULT_THRESHOLD = -0.05
+
+# Only the opening of each article is scored (title and lede carry most signal)
+MAX_SCORED_CHARS = 4000
+
+# Minimum labeled history per class before the pre-filter is trusted
+MIN_EXAMPLES_PER_CLASS = 10
+
+# Off-topic terms from the LOW relevance criteria (health, finance, beginner content)
+LOW_PRIORITY_TERMS = """
+health fitness diet weight sleep wellness meditation mindset motivation habits productivity
+finance investing stocks trading crypto bitcoin money income salary rich wealth retirement
+beginner beginners tutorial basics introduction learn course career interview resume job
+relationship dating parenting lifestyle travel writing writers medium followers
+"""
+
+STOPWORDS = set("""
+a about above after again against all also am an and any are as at be because been before
+being below between both but by can could did do does doing down during each few for from
+further had has have having he her here hers him his how i if in into is it its itself just
+me more most my no nor not now of off on once only or other our ours out over own same she
+should so some such than that the their theirs them then there these they this those through
+to too under until up very was we were what when where which while who whom why will with
+would you your yours new one two use using used get like make way via vs
+""".split())
+
+TOKEN_PATTERN = re.compile(r"[a-z][a-z0-9+#]*(?:[.-][a-z0-9+#]+)*")
+
+SECTION_PATTERN = re.compile(r'^###\s+(\S+)\s+-\s+(.+?)$', re.MULTILINE)
+
+# Rendered into assessment sections the pre-filter decided, so they are never
+# read back as labeled history (the model would retrain on its own guesses)
+PREFILTER_MARKER = "**Pre-filtered:** yes (scored locally, not reviewed by the model)"
+# Sections written before the marker existed carry this summary instead
+PREFILTER_SUMMARY_PREFIX = "Skipped by local relevance pre-filter"
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords or very short tokens."""
+    return [t for t in TOKEN_PATTERN.findall(text.lower()) if len(t) > 2 and t not in STOPWORDS]
+
+def load_labeled_examples(assessments_dir: str) -> List[Tuple[str, str]]:
+    """
+    Parse historical assessment markdown into (priority, text) examples.
+
+    The text is the article title, topics and key insights - the parts of an
+    assessment that describe the article itself rather than Jaxon's take on it.
+    Sections the pre-filter decided are skipped: only model ratings are labels.
+    """
+    examples = []
+
+    for path in sorted(Path(assessments_dir).glob("*.md")):
+        try:
+            content = path.read_text(encoding='utf-8')
+        except OSError:
+            continue
+
+        matches = list(SECTION_PATTERN.finditer(content))
+        for i, match in enumerate(matches):
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+            section = content[match.end():end]
+
+            if PREFILTER_MARKER in section or PREFILTER_SUMMARY_PREFIX in section:
+                continue
+
+            priority_match = re.search(r'\*\*Priority:\*\*\s+(HIGH|MEDIUM|LOW)', section)
+            if not priority_match:
+                continue
+
+            topics_match = re.search(r'\*\*Topics:\*\*\s*(.+)', section)
+            insights_match = re.search(r'\*\*Key Insights:\*\*\s*(.+?)(?=\n\*\*|$)', section, re.DOTALL)
+
+            text = " ".join(filter(None, [
+                match.group(2),
+                topics_match.group(1) if topics_match else "",
+                insights_match.group(1) if insights_match else ""
+            ]))
+            examples.append((priority_match.group(1), text))
+
+    return examples
+
+class RelevancePrefilter:
+    """TF-IDF centroid scorer trained on historical HIGH/LOW assessments."""
+
+    def __init__(self, high_docs: List[str], low_docs: List[str]):
+        if not HAS_NUMPY:
+            raise RuntimeError("numpy is required for the relevance pre-filter (pip3 install numpy)")
+
+        docs = [Counter(tokenize(doc)) for doc in high_docs + low_docs]
+
+        # Vocabulary and IDF from the labeled history
+        doc_freq = Counter()
+        for counts in docs:
+            doc_freq.update(counts.keys())
+        self.vocab = {term: i for i, term in enumerate(sorted(doc_freq))}
+        n_docs = len(docs)
+        self.idf = np.array(
+            [math.log((1 + n_docs) / (1 + doc_freq[term])) + 1 for term in sorted(doc_freq)],
+            dtype=np.float64
+        )
+
+        matrix = self._vectorize(docs)
+        self.high_centroid = self._normalize(matrix[:len(high_docs)].mean(axis=0, keepdims=True))[0]
+        self.low_centroid = self._normalize(matrix[len(high_docs):].mean(axis=0, keepdims=True))[0]
+
+    @classmethod
+    def from_assessments(cls, assessments_dir: str, strategic_context: str = "") -> "RelevancePrefilter":
+        """
+        Build a pre-filter from historical assessments plus relevance criteria.
+
+        Raises:
+            ValueError: If there are too few HIGH or LOW examples to trust
+        """
+        examples = load_labeled_examples(assessments_dir)
+        high_docs = [text for priority, text in examples if priority == "HIGH"]
+        low_docs = [text for priority, text in examples if priority == "LOW"]
+
+        if len(high_docs) < MIN_EXAMPLES_PER_CLASS or len(low_docs) < MIN_EXAMPLES_PER_CLASS:
+            raise ValueError(
+                f"Not enough labeled history in {assessments_dir} "
+                f"({len(high_docs)} HIGH, {len(low_docs)} LOW; need {MIN_EXAMPLES_PER_CLASS} each)"
+            )
+
+        if strategic_context:
+            high_docs.append(strategic_context)
+        low_docs.append(LOW_PRIORITY_TERMS)
+
+        return cls(high_docs, low_docs)
+
+    def _vectorize(self, docs: List[Counter]) -> "np.ndarray":
+        """L2-normalized TF-IDF rows (sublinear TF) over the training vocabulary."""
+        matrix = np.zeros((len(docs), len(self.vocab)), dtype=np.float64)
+        for row, counts in enumerate(docs):
+            for term, count in counts.items():
+                col = self.vocab.get(term)
+                if col is not None:
+                    matrix[row, col] = 1 + math.log(count)
+        return self._normalize(matrix * self.idf)
+
+    @staticmethod
+    def _normalize(matrix: "np.ndarray") -> "np.ndarray":
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        return matrix / norms
+
+    def score(self, articles: List[Tuple[str, str]]) -> List[float]:
+        """
+        Score (title, text) pairs; higher means more likely relevant.
+
+        The title is counted twice so it outweighs incidental body vocabulary.
+        """
+        docs = [
+            Counter(tokenize(f"{title} {title} {(text or '')[:MAX_SCORED_CHARS]}"))
+            for title, text in articles
+        ]
+        matrix = self._vectorize(docs)
+        return list(matrix @ self.high_centroid - matrix @ self.low_centroid)
+
+    def top_terms(self, text: str, limit: int = 5) -> List[str]:
+        """Highest-weighted known terms in text (for the audit report)."""
+        counts = Counter(tokenize(text[:MAX_SCORED_CHARS]))
+        weighted = [
+            (count * self.idf[self.vocab[term]], term)
+            for term, count in counts.items() if term in self.vocab
+        ]
+        return [term for _, term in sorted(weighted, reverse=True)[:limit]]
+
+def prefiltered_analysis(score: float, threshold: float, topics: List[str]) -> Dict:
+    """Analysis record for an article skipped by the pre-filter."""
+    return {
+        "priority": "LOW",
+        "stars": 1,
+        "relevance_summary": (
+            f"{PREFILTER_SUMMARY_PREFIX} (score {score:.3f} below threshold "
+            f"{threshold:.3f}); not sent to the model."
+        ),
+        "key_insights": [],
+        "strategic_implications": [],
+        "action_items": [],
+        "topics": topics,
+        "prefiltered": True
+    }
+
+def write_audit_report(path: str, rows: List[Dict], threshold: float,
+                       source: Optional[str] = None) -> None:
+    """
+    Write a markdown audit of pre-filter decisions, lowest scores first.
+
+    Each row: ticket_id, title, score, skipped (bool), terms (list).
+    """
+    skipped = [r for r in rows if r["skipped"]]
+
+    lines = [
+        "# Relevance Pre-filter Audit",
+        "",
+        f"**Threshold:** {threshold:.3f}",
+        f"**Scored:** {len(rows)} articles",
+        f"**Skipped (tagged LOW locally):** {len(skipped)}",
+        f"**Sent to model:** {len(rows) - len(skipped)}",
+    ]
+    if source:
+        lines.append(f"**Training data:** {source}")
+    lines += [
+        "",
+        "| Decision | Score | Ticket | Title | Top terms |",
+        "|---|---|---|---|---|",
+    ]
+
+    for row in sorted(rows, key=lambda r: r["score"]):
+        decision = "SKIPPED" if row["skipped"] else "sent"
+        title = row["title"].replace("|", "\\|")
+        lines.append(
+            f"| {decision} | {row['score']:.3f} | {row['ticket_id']} | {title} | {', '.join(row['terms'])} |"
+        )
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
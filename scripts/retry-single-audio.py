@@ -13,17 +13,15 @@ import subprocess
 import tempfile
 from pathlib import Path
 
+from tts_client import get_tts_client, split_for_tts
+from audio_assembly import assemble_mp3
+from episode_sources import save_episode_source
+from pdf_text import read_pdf_text
+
 def extract_pdf_text(pdf_path):
-    """Extract text from PDF using pdftotext."""
+    """Extract text from PDF using pdftotext -layout (via the shared text store)."""
     try:
-        result = subprocess.run(
-            ['pdftotext', '-layout', str(pdf_path), '-'],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=30
-        )
-        return result.stdout
+        return read_pdf_text(pdf_path, layout=True)
     except Exception as e:
         print(f"Error extracting PDF text: {e}")
         return None
@@ -60,123 +58,53 @@ def crop_footer(text):
 
     return '\n'.join(lines[:cutoff])
 
-def generate_audio_with_retry(text, output_path, max_retries=3):
-    """Generate audio using OpenAI TTS with retry logic."""
-    import time
+def generate_audio_with_retry(text, output_path, tags=None, max_retries=3):
+    """Generate audio using OpenAI TTS with retry logic, tagged with tags."""
+    # Split text into chunks (4096 char limit) on paragraph/sentence/clause boundaries
+    chunks = split_for_tts(text)
 
-    # Split text into chunks if needed (4096 char limit)
-    max_chunk_size = 4000
-    chunks = []
+    print(f"  Generating audio ({len(text)} chars, {len(chunks)} chunks)...")
 
-    if len(text) <= max_chunk_size:
-        chunks = [text]
-    else:
-        # Split by paragraphs
-        paragraphs = text.split('\n\n')
-        current_chunk = ""
+    # Generate chunks through the pooled TTS client (retried per chunk)
+    try:
+        client = get_tts_client(max_retries=max_retries)
+    except ValueError as e:
+        print(f"    {e}")
+        return False
 
-        for para in paragraphs:
-            if len(current_chunk) + len(para) + 2 <= max_chunk_size:
-                current_chunk += para + "\n\n"
-            else:
-                if current_chunk:
-                    chunks.append(current_chunk)
-                current_chunk = para + "\n\n"
+    chunk_files = [output_path.parent / f"{output_path.stem}.temp.chunk{i}.mp3" for i in range(len(chunks))]
+    ok = client.synthesize_chunks(chunks, chunk_files)
 
-        if current_chunk:
-            chunks.append(current_chunk)
+    if not all(ok):
+        # Cleanup and fail
+        for cf in chunk_files:
+            if cf.exists():
+                cf.unlink()
+        return False
 
-    print(f"  Generating audio ({len(text)} chars, {len(chunks)} chunks)...")
+    print(f"    ✓ {len(chunks)} chunks generated")
 
-    # Generate each chunk
-    chunk_files = []
-    for i, chunk in enumerate(chunks):
-        chunk_file = output_path.parent / f"{output_path.stem}.temp.chunk{i}.mp3"
-
-        # Retry logic for this chunk
-        for attempt in range(max_retries):
-            try:
-                # Create temp JSON file for request
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                    json.dump({
-                        "model": "tts-1",
-                        "input": chunk,
-                        "voice": "onyx"
-                    }, f)
-                    json_file = f.name
-
-                # Use curl to call OpenAI API
-                result = subprocess.run([
-                    'curl', '-s',
-                    'https://api.openai.com/v1/audio/speech',
-                    '-H', f'Authorization: Bearer {os.environ.get("OPENAI_API_KEY")}',
-                    '-H', 'Content-Type: application/json',
-                    '-d', f'@{json_file}',
-                    '--output', str(chunk_file)
-                ], capture_output=True, timeout=60, check=True)
-
-                os.unlink(json_file)
-
-                # Verify file was created and has content
-                if chunk_file.exists() and chunk_file.stat().st_size > 1000:
-                    chunk_files.append(chunk_file)
-                    print(f"    ✓ Chunk {i+1}/{len(chunks)} generated")
-                    break
-                else:
-                    raise Exception(f"Chunk file is too small or missing")
-
-            except Exception as e:
-                print(f"    Attempt {attempt + 1}/{max_retries} failed for chunk {i+1}: {e}")
-                if chunk_file.exists():
-                    chunk_file.unlink()
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                else:
-                    # Cleanup and fail
-                    for cf in chunk_files:
-                        if cf.exists():
-                            cf.unlink()
-                    return False
-
-    # Concatenate chunks if multiple
-    if len(chunk_files) == 1:
-        chunk_files[0].rename(output_path)
-    else:
-        # Use ffmpeg to concatenate
-        concat_list = output_path.parent / f"{output_path.stem}.concat.txt"
-        with open(concat_list, 'w') as f:
-            for chunk_file in chunk_files:
-                f.write(f"file '{chunk_file.name}'\n")
-
-        subprocess.run([
-            'ffmpeg', '-f', 'concat', '-safe', '0',
-            '-i', str(concat_list),
-            '-c', 'copy',
-            str(output_path)
-        ], capture_output=True, check=True)
-
-        # Cleanup
-        concat_list.unlink()
+    # Concatenate and tag in a single stream-copy pass
+    try:
+        assemble_mp3(chunk_files, output_path, tags)
+    except subprocess.CalledProcessError as e:
+        print(f"    Concatenation failed: {e}")
+        return False
+    finally:
         for chunk_file in chunk_files:
             chunk_file.unlink()
 
+    print(f"  ✓ Concatenated and tagged")
     return True
 
-def add_metadata(mp3_path, ticket_id, title):
-    """Add ID3 tags to MP3 file."""
-    subprocess.run([
-        'ffmpeg', '-i', str(mp3_path),
-        '-metadata', f'title={title}',
-        '-metadata', f'artist=Jaxon Research',
-        '-metadata', f'album=Medium Article Review',
-        '-metadata', f'comment={ticket_id}',
-        '-codec', 'copy',
-        '-y',
-        str(mp3_path) + '.tagged'
-    ], capture_output=True, check=True)
-
-    Path(str(mp3_path) + '.tagged').rename(mp3_path)
-    print(f"  ✓ Added metadata")
+def episode_tags(ticket_id, title):
+    """ID3 tags for a retried episode."""
+    return {
+        'title': title,
+        'artist': 'Jaxon Research',
+        'album': 'Medium Article Review',
+        'comment': ticket_id,
+    }
 
 def upload_to_drive(mp3_path, ticket_id):
     """Upload MP3 to Google Drive and return download link."""
@@ -274,14 +202,13 @@ def main():
     print(f"✓ Extracted {len(text)} characters\n")
 
     # Generate audio with retry
-    if not generate_audio_with_retry(text, output_mp3):
+    tags = episode_tags(ticket_id, title)
+    if not generate_audio_with_retry(text, output_mp3, tags):
         print("\n✗ Audio generation failed after retries")
         sys.exit(1)
 
     print(f"\n✓ Created: {output_mp3}")
-
-    # Add metadata
-    add_metadata(output_mp3, ticket_id, title)
+    save_episode_source(output_dir, ticket_id, text, tags=tags)
 
     # Upload to Drive
     print("\nUploading to Google Drive...")
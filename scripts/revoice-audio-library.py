@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Re-voice the audio library after a voice, model or speed change.
+
+Walks every episode in audio-reviews/ (GAT-N.mp3 and slugged GAT-N-slug.mp3)
+and rebuilds it with the new TTS settings. The voiced text comes from audio-reviews/sources/<ticket>.json
+(saved when the episode was generated); older episodes fall back to their
+PDF, extracted and cleaned the same way as generate-audio-from-assessment.py
+(without the executive summary intro, which was never saved).
+
+Chunks go through the shared pooled TTS client and its chunk cache, so an
+interrupted job resumes without paying for chunks it already voiced. Each
+finished episode is recorded in a checkpoint journal and skipped on the
+next run with the same settings. New audio replaces the old file with an
+atomic rename, so an episode is never missing or half-written.
+
+Re-voiced files are local only: Drive copies (and the RSS feed) keep the
+old audio until they are re-uploaded.
+
+Usage:
+    python3 revoice-audio-library.py --voice nova --plan
+    python3 revoice-audio-library.py --voice nova --budget-usd 20 --max-minutes 90
+    python3 revoice-audio-library.py --model tts-1-hd GAT-321 GAT-322
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from tts_client import (get_tts_client, split_for_tts, DEFAULT_MODEL, DEFAULT_VOICE, DEFAULT_SPEED,
+                        DEFAULT_CHUNK_WORKERS, DEFAULT_MAX_CONCURRENT)
+from audio_assembly import assemble_mp3
+from audio_estimate import estimate_article, calibrate_bitrate, format_duration, format_mb
+from episode_sources import load_episode_source
+from pdf_text import read_pdf_text
+from speech_cleaning import clean_text_for_speech
+
+AUDIO_DIR = Path("/Users/bgerby/Documents/dev/ai/audio-reviews")
+PDF_DIR = Path(__file__).parent.parent / "pdfs"
+
+# OpenAI TTS list prices (USD per 1M input characters)
+TTS_PRICE_PER_MILLION_CHARS = {
+    'tts-1': 15.0,
+    'tts-1-hd': 30.0,
+}
+
+DEFAULT_EPISODE_WORKERS = 2   # Episodes re-voiced at once (chunk requests are capped by the client)
+
+# GAT-N.mp3 (assessment audio) and GAT-N-slug.mp3 (generate-article-audio.py)
+EPISODE_PATTERN = re.compile(r'^(GAT-\d+)(?:-.+)?\.mp3$')
+# Work files next to episodes (progressive snapshots, assembly temp files)
+SIDE_FILE_SUFFIXES = ('.partial.mp3', '.assembling.mp3')
+
+class RevoiceJournal:
+    """
+    Append-only JSONL journal of re-voiced episodes.
+
+    One line is written (and fsynced) per finished episode; an episode counts
+    as done only for the exact settings it was voiced with.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+
+    def load(self, settings: str) -> set:
+        """Episodes (file stems) already re-voiced with settings."""
+        done = set()
+        if not self.path.exists():
+            return done
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        for line_num, line in enumerate(content.splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+                if entry["settings"] == settings:
+                    # Older entries have no episode name: the file was GAT-N.mp3
+                    done.add(entry.get("episode") or entry["ticket_id"])
+            except (ValueError, KeyError):
+                # A crash mid-write can leave a truncated final line
+                print(f"  ⚠ Skipping unreadable journal line {line_num} in {self.path}")
+
+        if content and not content.endswith("\n"):
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write("\n")
+
+        return done
+
+    def append(self, ticket_id: str, episode: str, settings: str, chars: int, cost: float):
+        """Durably record one re-voiced episode."""
+        entry = {
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "ticket_id": ticket_id,
+            "episode": episode,
+            "settings": settings,
+            "chars": chars,
+            "cost_usd": round(cost, 4),
+        }
+
+        with self.lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+class Budget:
+    """Thread-safe spend and time cap; episodes reserve their cost before starting."""
+
+    def __init__(self, max_usd=None, max_seconds=None):
+        self.max_usd = max_usd
+        self.max_seconds = max_seconds
+        self.started = time.monotonic()
+        self.committed = 0.0
+        self.lock = threading.Lock()
+
+    def reserve(self, cost):
+        """Reserve cost for an episode; returns None if allowed, else the reason it isn't."""
+        with self.lock:
+            if self.max_seconds is not None and time.monotonic() - self.started >= self.max_seconds:
+                return "time limit reached"
+            if self.max_usd is not None and self.committed + cost > self.max_usd:
+                return "budget exhausted"
+            self.committed += cost
+            return None
+
+def settings_key(model, voice, speed):
+    return f"{model}/{voice}/{speed:g}"
+
+def extract_pdf_text(pdf_path):
+    """Extract text from PDF using pdftotext (same mode as the audio generator)."""
+    try:
+        return read_pdf_text(pdf_path)
+    except Exception as e:
+        print(f"  ✗ Error extracting {pdf_path.name}: {e}")
+        return None
+
+def read_tags(audio_path):
+    """Current ID3 tags of an episode (via ffprobe), or {} if unavailable."""
+    try:
+        result = subprocess.run([
+            'ffprobe', '-v', 'quiet',
+            '-print_format', 'json',
+            '-show_format',
+            str(audio_path)
+        ], capture_output=True, text=True, check=True, timeout=30)
+        tags = json.loads(result.stdout).get('format', {}).get('tags', {})
+    except Exception:
+        return {}
+
+    keys = ('title', 'album', 'artist', 'album_artist', 'track', 'comment', 'genre')
+    return {key: tags[key] for key in keys if tags.get(key)}
+
+def load_source(audio_dir, pdf_dir, ticket_id, audio_path):
+    """Voiced text for an episode: saved source, else its PDF. Returns a dict or None."""
+    source = load_episode_source(audio_dir, ticket_id)
+    if source:
+        source['origin'] = 'source'
+        return source
+
+    pdfs = sorted(Path(pdf_dir).rglob(f"{ticket_id}-*.pdf"))
+    if not pdfs:
+        return None
+
+    text = extract_pdf_text(pdfs[-1])
+    if not text:
+        return None
+
+    text = clean_text_for_speech(text)
+    if len(text) < 100:
+        return None
+
+    return {
+        'ticket_id': ticket_id,
+        'intro': '',
+        'text': text,
+        'tags': read_tags(audio_path),
+        'origin': f"pdf ({pdfs[-1].name})",
+    }
+
+def revoice_episode(client, audio_path, source, backup_dir=None, workers=DEFAULT_CHUNK_WORKERS):
+    """Synthesize an episode with client and atomically replace audio_path. Returns True on success."""
+    chunks = (split_for_tts(source['intro']) if source.get('intro') else []) + split_for_tts(source['text'])
+    work_dir = audio_path.parent / ".revoice"
+    work_dir.mkdir(exist_ok=True)
+    chunk_files = [work_dir / f"{audio_path.stem}.chunk{i}.mp3" for i in range(len(chunks))]
+
+    try:
+        ok = client.synthesize_chunks(chunks, chunk_files, workers=workers)
+        if not all(ok):
+            failed = [str(i + 1) for i, success in enumerate(ok) if not success]
+            print(f"  ✗ {audio_path.stem}: Chunk(s) {', '.join(failed)} of {len(chunks)} failed")
+            return False
+
+        if backup_dir:
+            backup_dir.mkdir(parents=True, exist_ok=True)
+            backup_path = backup_dir / audio_path.name
+            if not backup_path.exists():
+                shutil.copy2(audio_path, backup_path)
+
+        # Assembled next to the episode and renamed over it (atomic swap)
+        assemble_mp3(chunk_files, audio_path, source.get('tags'))
+        return True
+
+    except subprocess.CalledProcessError as e:
+        print(f"  ✗ {audio_path.stem}: Assembly failed: {e.stderr}")
+        return False
+    finally:
+        for chunk_file in chunk_files:
+            if chunk_file.exists():
+                chunk_file.unlink()
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Re-voice existing audio episodes with new TTS settings",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument('tickets', nargs='*', help="Only these episodes (e.g. GAT-321); default: all")
+    parser.add_argument('--voice', default=DEFAULT_VOICE, help=f"TTS voice (default: {DEFAULT_VOICE})")
+    parser.add_argument('--model', default=DEFAULT_MODEL, help=f"TTS model (default: {DEFAULT_MODEL})")
+    parser.add_argument('--speed', type=float, default=DEFAULT_SPEED, help=f"TTS speed (default: {DEFAULT_SPEED})")
+    parser.add_argument('--audio-dir', default=str(AUDIO_DIR), help=f"Audio library (default: {AUDIO_DIR})")
+    parser.add_argument('--pdf-dir', default=str(PDF_DIR),
+                        help="Searched recursively for PDFs of episodes without a saved source")
+    parser.add_argument('--budget-usd', type=float, default=None,
+                        help="Stop starting episodes once estimated TTS spend would exceed this")
+    parser.add_argument('--max-minutes', type=float, default=None,
+                        help="Stop starting episodes after this many minutes")
+    parser.add_argument('--workers', type=int, default=DEFAULT_EPISODE_WORKERS,
+                        help=f"Episodes re-voiced at once (default: {DEFAULT_EPISODE_WORKERS})")
+    parser.add_argument('--journal', default=None,
+                        help="Checkpoint journal (default: <audio-dir>/revoice-journal.jsonl)")
+    parser.add_argument('--backup-dir', default=None, help="Copy each original episode here before replacing it")
+    parser.add_argument('--plan', action='store_true', help="Print what would be re-voiced and the estimate, then exit")
+    args = parser.parse_args()
+
+    audio_dir = Path(args.audio_dir)
+    if not audio_dir.exists():
+        print(f"Error: Audio directory not found: {audio_dir}")
+        sys.exit(1)
+
+    settings = settings_key(args.model, args.voice, args.speed)
+    price = TTS_PRICE_PER_MILLION_CHARS.get(args.model)
+    if price is None:
+        print(f"⚠ No price known for {args.model}; assuming {TTS_PRICE_PER_MILLION_CHARS[DEFAULT_MODEL]}/1M chars")
+        price = TTS_PRICE_PER_MILLION_CHARS[DEFAULT_MODEL]
+
+    journal = RevoiceJournal(args.journal or audio_dir / "revoice-journal.jsonl")
+    done = journal.load(settings)
+
+    print("=" * 70)
+    print("Re-voice Audio Library")
+    print("=" * 70)
+    print(f"Audio directory: {audio_dir}")
+    print(f"New settings: {settings}")
+    print(f"Journal: {journal.path} ({len(done)} episodes already done with these settings)")
+    print()
+
+    episodes = []
+    unmatched = []
+    for path in sorted(audio_dir.glob("*.mp3")):
+        if path.name.endswith(SIDE_FILE_SUFFIXES):
+            continue
+        match = EPISODE_PATTERN.match(path.name)
+        if not match:
+            unmatched.append(path.name)
+            continue
+        if args.tickets and match.group(1) not in args.tickets:
+            continue
+        if path.stem in done:
+            continue
+        episodes.append((match.group(1), path))
+
+    try:
+        client = get_tts_client(model=args.model, voice=args.voice, speed=args.speed)
+        is_cached = client.is_cached
+    except ValueError as e:
+        if not args.plan:
+            print(f"Error: {e}")
+            sys.exit(1)
+        client, is_cached = None, None
+
+    # Load sources and estimate every episode up front (cheap for saved sources)
+    bits_per_second = calibrate_bitrate(audio_dir)
+    jobs = []
+    missing = []
+    for ticket_id, path in episodes:
+        source = load_source(audio_dir, args.pdf_dir, ticket_id, path)
+        if not source:
+            missing.append(path.name)
+            continue
+        estimate = estimate_article(ticket_id, source.get('intro'), source['text'],
+                                    is_cached=is_cached, bits_per_second=bits_per_second)
+        estimate['cost'] = estimate['uncached_chars'] * price / 1_000_000
+        jobs.append((ticket_id, path, source, estimate))
+
+    total_cost = sum(e['cost'] for _, _, _, e in jobs)
+    from_pdf = len([1 for _, _, s, _ in jobs if s['origin'] != 'source'])
+    print(f"Episodes to re-voice: {len(jobs)} ({from_pdf} from PDF, no intro)")
+    if missing:
+        print(f"⚠ No source or PDF for {len(missing)} episodes: {', '.join(missing)}")
+    if unmatched:
+        print(f"⚠ Skipped {len(unmatched)} MP3s not named like an episode (GAT-N[-slug].mp3): "
+              f"{', '.join(unmatched)}")
+    print(f"Audio: ~{format_duration(sum(e['audio_seconds'] for _, _, _, e in jobs))}, "
+          f"{sum(e['chunks'] for _, _, _, e in jobs)} chunks "
+          f"({sum(e['cached_chunks'] for _, _, _, e in jobs)} cached), "
+          f"~{format_mb(sum(e['bytes'] for _, _, _, e in jobs))}")
+    print(f"Estimated TTS cost: ${total_cost:.2f}")
+    if args.budget_usd is not None:
+        print(f"Budget: ${args.budget_usd:.2f}")
+    print()
+
+    if args.plan or not jobs:
+        return
+
+    budget = Budget(args.budget_usd, args.max_minutes * 60 if args.max_minutes else None)
+    backup_dir = Path(args.backup_dir) if args.backup_dir else None
+    chunk_workers = max(1, DEFAULT_MAX_CONCURRENT // max(1, args.workers))
+    counts = {'revoiced': 0, 'failed': 0, 'stopped': 0}
+    spent = [0.0]
+    counts_lock = threading.Lock()
+
+    def run(job):
+        ticket_id, path, source, estimate = job
+        reason = budget.reserve(estimate['cost'])
+        if reason:
+            with counts_lock:
+                counts['stopped'] += 1
+            print(f"  ⏸ {ticket_id}: Not started ({reason})")
+            return
+
+        print(f"  {ticket_id}: Re-voicing {estimate['chars']:,} chars ({estimate['chunks']} chunks, "
+              f"{estimate['cached_chunks']} cached, from {source['origin']})...")
+        if revoice_episode(client, path, source, backup_dir=backup_dir, workers=chunk_workers):
+            journal.append(ticket_id, path.stem, settings, estimate['chars'], estimate['cost'])
+            with counts_lock:
+                counts['revoiced'] += 1
+                spent[0] += estimate['cost']
+            print(f"  ✓ {ticket_id}: Replaced {path.name}")
+        else:
+            # The reservation is kept: chunks that did succeed were paid for (and are cached)
+            with counts_lock:
+                counts['failed'] += 1
+
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        list(executor.map(run, jobs))
+
+    try:
+        (audio_dir / ".revoice").rmdir()
+    except OSError:
+        pass  # Missing, or holds leftovers worth inspecting
+
+    print(f"\n{'=' * 70}")
+    print(f"Re-voiced: {counts['revoiced']}")
+    print(f"Failed: {counts['failed']}")
+    if counts['stopped']:
+        print(f"Not started (budget/time cap): {counts['stopped']} - run again to continue")
+    print(f"Estimated spend: ${spent[0]:.2f}")
+    if unmatched:
+        print(f"Skipped (not an episode name): {', '.join(unmatched)}")
+    print(f"Journal: {journal.path}")
+    print("Note: Drive copies still have the old audio until re-uploaded")
+
+    if counts['failed']:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -61,12 +61,24 @@ PDF_MIN_CHARS = 100  # Minimum chars for valid PDF
 PDF_SUSPICIOUS_THRESHOLD = 500  # Chars below which PDF is suspicious
 PDF_PAYWALL_THRESHOLD = 2000  # Max chars for detected paywall content
 
+# Paywall markers (lowercase) for both PDF text and article HTML. On their own
+# they don't mean paywalled: full member captures show "Member-only story" too.
+# See content_quality.py for how they combine with length.
+# Text that only appears when the story itself is withheld
 PAYWALL_INDICATORS = [
-    'member-only story',
     'this story is for medium members',
     'upgrade to continue reading',
+    'upgrade to read',
     'become a member to read this story',
-    'sign up to read'
+    'sign up to read',
+    'metered paywall',
+]
+
+# Member-only badges and upsell chrome - also on fully readable stories,
+# so on their own they are not a paywall in captured PDF text
+MEMBER_ONLY_INDICATORS = [
+    'member-only',                        # "Member-only story" badge
+    'become a member',
 ]
 
 # State file locations
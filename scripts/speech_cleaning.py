@@ -0,0 +1,187 @@
+"""
+Precompiled text cleaner that turns extracted Medium PDF text into speech input.
+
+All patterns are compiled once at import. The eleven footer markers are one
+combined regex factored on their shared leading newline, so the text is
+scanned once for the earliest footer instead of once per marker. Code lines
+are detected by counting syntax characters with bytes.translate (in C)
+rather than a per-character Python loop, which was the bulk of the cost.
+
+Output is identical to the previous per-script implementations; see
+benchmark-speech-cleaner.py, which checks this against the pdfs/ corpus.
+
+Usage:
+    from speech_cleaning import clean_text_for_speech, ARTICLE_CLEANER
+
+    text = clean_text_for_speech(raw_text)     # Assessment audio (crops footers)
+    text = ARTICLE_CLEANER.clean(raw_text)     # generate-article-audio.py variant
+"""
+
+import re
+from typing import Iterable
+
+# "Open in app" header at the top of Medium PDFs
+APP_HEADER_PATTERN = re.compile(r'^Open in app\s*\n?', re.IGNORECASE | re.MULTILINE)
+
+# Login/account UI elements
+LOGIN_BANNER_PATTERN = re.compile(r'Welcome back\. You are signed into your member account.*?Not you\?', re.DOTALL)
+ACCOUNT_EMAIL = 'bg••••@jaxondigital.com'
+
+URL_PATTERN = re.compile(r'https?://\S+')
+
+# Medium UI elements, then buttons alone at the end of a line. The button
+# pattern has no leading \b (which stops the regex engine from scanning for
+# the literal words); the word boundary is checked in _drop_button instead.
+UI_PATTERN = re.compile(r'Sidebar menu|Medium Logo|Write|Search|Notifications|Follow publication|Member-only story')
+BUTTON_LINE_PATTERN = re.compile(r'(?:Follow|Listen|Share|More)\b\s*\n')
+WORD_CHAR = re.compile(r'\w')
+
+# "10 min read · Oct 8, 2025" or a bare "10 min read"
+READ_TIME_MARKER = ' min read'
+READ_TIME_PATTERN = re.compile(r'\d+ min read(?:\s*·\s*[A-Z][a-z]+\s+\d+,\s+\d+)?')
+
+# Footer sections (Topics, author bio, recommendations): text is cropped at
+# the earliest match of any of these
+FOOTER_PATTERNS = [
+    r'\n\s*Topics\s*\n',                    # "Topics" section header (explicit)
+    r'\n\s*Topics\s*$',                     # "Topics" at end of text
+    r'\nSee you next time!?\s*\n',          # Common author sign-off
+    r'\nReferences\s*\n',                   # References section (often before topics)
+    r'[\n\f]Written by\s+[\w\s]+\n',        # "Written by [Name]" (may have form feed)
+    r'\n(?:No )?[Rr]esponses?\s*\(',        # "Responses (12)" or "No responses yet"
+    r'\nSee all from\s+[\w\s]+\n',          # "See all from [Author]"
+    r'\nRecommended from Medium',           # Medium recommendations section
+    r'\nMore from\s+[\w\s]+\n',             # "More from [Publication]"
+    r'\n\s*--\s*\n',                        # Horizontal rule often precedes footer
+    r'\nIf you (?:like|enjoyed).*(?:comment|share|clap)',  # Call-to-action at end
+]
+
+def combine_footer_patterns(patterns: Iterable[str]) -> re.Pattern:
+    """
+    One regex that matches where the earliest of patterns would.
+
+    Every marker starts with a newline (one also allows a form feed), so that
+    character is factored out in front of the alternation and the engine only
+    tries the alternatives at line starts.
+    """
+    newline_markers = []
+    other_markers = []
+    for pattern in patterns:
+        if pattern.startswith(r'\n'):
+            newline_markers.append(pattern[len(r'\n'):])
+        elif pattern.startswith(r'[\n\f]'):
+            other_markers.append(pattern[len(r'[\n\f]'):])
+        else:
+            raise ValueError(f"Footer pattern must start with a newline: {pattern}")
+
+    alternatives = []
+    if newline_markers:
+        alternatives.append(r'(?<=\n)(?:' + '|'.join(newline_markers) + ')')
+    alternatives += other_markers
+    return re.compile(r'[\n\f](?:' + '|'.join(alternatives) + ')', re.IGNORECASE)
+
+FOOTER_PATTERN = combine_footer_patterns(FOOTER_PATTERNS)
+
+EXCESS_NEWLINES = re.compile(r'\n\s*\n\s*\n+')
+
+# Code detection: lines where >30% of the (stripped) characters are syntax
+CODE_CHARS = b'{}[]();,=<>|&'
+CODE_CHAR_RATIO = 0.3
+CODE_MIN_CHARS = 10        # Shorter lines are never treated as code
+CODE_FRAGMENT_CHARS = 20   # Short lines right after code are dropped as fragments
+
+def remove_code_lines(text: str) -> str:
+    """Drop lines dense in code syntax, plus short fragments that follow them."""
+    lines = text.split('\n')
+    # Code characters are ASCII, so counting them in the UTF-8 bytes gives the
+    # same result, and bytes.translate deletes them in C
+    encoded_lines = text.encode('utf-8', 'surrogatepass').split(b'\n')
+
+    cleaned_lines = []
+    in_code_block = False
+
+    for line, encoded in zip(lines, encoded_lines):
+        total_chars = len(line.strip())
+
+        if total_chars > CODE_MIN_CHARS:
+            code_chars = len(encoded) - len(encoded.translate(None, CODE_CHARS))
+            if code_chars / total_chars > CODE_CHAR_RATIO:
+                in_code_block = True
+                continue
+
+        # Skip short lines immediately after code (often fragments)
+        if in_code_block and total_chars < CODE_FRAGMENT_CHARS:
+            continue
+
+        in_code_block = False
+        cleaned_lines.append(line)
+
+    return '\n'.join(cleaned_lines)
+
+def _drop_button(match: re.Match) -> str:
+    """Remove a button line unless the word is the end of a longer word."""
+    start = match.start()
+    if start > 0 and WORD_CHAR.match(match.string, start - 1):
+        return match.group(0)
+    return ''
+
+class SpeechCleaner:
+    """
+    Cleaning pipeline over the precompiled patterns.
+
+    Args:
+        remove_app_header: Strip the "Open in app" header line
+        crop_footer: Truncate at the first footer marker (Topics, Written by, ...)
+        extra_patterns: Additional patterns removed after the standard ones
+    """
+
+    def __init__(self, remove_app_header: bool = True, crop_footer: bool = True,
+                 extra_patterns: Iterable[str] = ()):
+        self.remove_app_header = remove_app_header
+        self.crop_footer = crop_footer
+        self.extra = [re.compile(p) for p in extra_patterns]
+
+    def clean(self, text: str) -> str:
+        """Clean text to make it better for text-to-speech."""
+        if self.remove_app_header:
+            text = APP_HEADER_PATTERN.sub('', text)
+
+        # Login/account UI elements (substring checks skip absent ones cheaply)
+        if 'Welcome back' in text:
+            text = LOGIN_BANNER_PATTERN.sub('', text)
+        text = text.replace(ACCOUNT_EMAIL, '')
+        if '://' in text:
+            text = URL_PATTERN.sub('', text)
+
+        # Medium UI elements, buttons and reading time
+        text = UI_PATTERN.sub('', text)
+        text = BUTTON_LINE_PATTERN.sub(_drop_button, text)
+        if READ_TIME_MARKER in text:
+            text = READ_TIME_PATTERN.sub('', text)
+
+        for pattern in self.extra:
+            text = pattern.sub('', text)
+
+        # Crop at the earliest footer marker (one scan for all markers)
+        if self.crop_footer:
+            match = FOOTER_PATTERN.search(text)
+            if match:
+                text = text[:match.start()]
+
+        text = remove_code_lines(text)
+        text = EXCESS_NEWLINES.sub('\n\n', text)
+        return text.strip()
+
+# Assessment audio (generate-audio-from-assessment.py): header removal and footer cropping
+ASSESSMENT_CLEANER = SpeechCleaner()
+
+# generate-article-audio.py: no footer cropping, but drops recommendation lines
+ARTICLE_CLEANER = SpeechCleaner(
+    remove_app_header=False,
+    crop_footer=False,
+    extra_patterns=[r'See all from.*', r'Recommended from Medium']
+)
+
+def clean_text_for_speech(text: str) -> str:
+    """Clean extracted article text for TTS (header, UI, footer and code removal)."""
+    return ASSESSMENT_CLEANER.clean(text)
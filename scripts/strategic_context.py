@@ -0,0 +1,157 @@
+"""
+Jaxon Digital strategic context used to score article relevance.
+
+The context is read from the canonical Pivot project file the first time it
+is needed (not at import), memoized, and re-read only when the file's mtime
+changes. A short content hash is exposed as the context version so caches
+and feedback records can tell which context an assessment was made against.
+
+Usage:
+    from strategic_context import STRATEGIC_CONTEXT
+
+    prompt = f"...{STRATEGIC_CONTEXT.text}..."
+    version = STRATEGIC_CONTEXT.version
+"""
+
+import hashlib
+import os
+import re
+import threading
+from typing import Optional
+
+# Path to canonical strategic context in Pivot project
+PIVOT_STRATEGIC_CONTEXT_PATH = "/Users/bgerby/Documents/dev/pivot/sprint-0/STRATEGIC_CONTEXT.md"
+
+# Legacy strategic context (fallback for when Pivot project unavailable)
+JAXON_STRATEGIC_CONTEXT_LEGACY = """
+Jaxon Digital is an Optimizely implementation partner focused on AI agent initiatives:
+
+**Current Focus:**
+- Custom MCP (Model Context Protocol) development for Optimizely DXP operations
+- Building production agents for CMS, Commerce, and DevOps automation
+- Managed agent operations service ($8-20K/month)
+- Custom system integrations ($40-100K per MCP)
+
+**Technology Stack:**
+- Custom MCPs for Optimizely-specific operations
+- n8n for workflow orchestration
+- Multi-MCP orchestration for complex workflows
+- Event-driven proactive monitoring agents
+
+**Relevance Criteria:**
+
+HIGH Priority (⭐⭐⭐⭐⭐):
+- Direct MCP development insights or competitive intelligence
+- AI agent architecture and production patterns
+- Optimizely platform integration strategies
+- Competitive analysis (e.g., other developers building Optimizely MCPs)
+- Event-driven automation and proactive monitoring
+
+MEDIUM Priority (⭐⭐⭐):
+- Optimizely platform features and capabilities
+- DevOps automation and deployment workflows
+- CMS/Commerce enhancements
+- General AI/ML trends applicable to our work
+- Client education topics
+
+LOW Priority (⭐):
+- Niche technical implementations not applicable to our clients
+- Off-topic content (health, finance, etc.)
+- Basic tutorials or beginner content
+- Peripheral technologies unrelated to our stack
+"""
+
+def load_strategic_context(path: str = PIVOT_STRATEGIC_CONTEXT_PATH) -> str:
+    """
+    Load strategic context from canonical Pivot project source with fallback.
+
+    Returns:
+        Strategic context string for AI analysis
+    """
+    try:
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+
+                # Extract "For AI Analysis & Content Review" section (lines 309-353)
+                match = re.search(
+                    r'## For AI Analysis & Content Review.*?(?=\n---)',
+                    content,
+                    re.DOTALL
+                )
+
+                if match:
+                    context = match.group(0)
+                    print("✓ Loaded strategic context from Pivot project")
+                    return f"""
+Jaxon Digital Strategic Context (Source: Pivot Project)
+
+NOTE: Jaxon Digital is transforming from an Optimizely implementation partner
+to a SaaS platform for AI Operations (October 2025 - 6 month transformation).
+
+{context}
+
+**Current Focus:**
+- Building AI Operations Platform (SaaS model)
+- Agent orchestration with LangGraph + n8n
+- Agent #19 (Early Warning System) as top priority
+- Product-led growth targeting agencies first
+- Multi-tenant platform architecture
+- Subscription billing and managed services
+"""
+
+        # Fallback to legacy context
+        print("⚠ Pivot context not found, using legacy strategic context")
+        return JAXON_STRATEGIC_CONTEXT_LEGACY
+
+    except Exception as e:
+        print(f"⚠ Error loading Pivot context: {e}, using legacy strategic context")
+        return JAXON_STRATEGIC_CONTEXT_LEGACY
+
+class StrategicContext:
+    """
+    Lazily loaded, memoized strategic context with mtime-based invalidation.
+
+    Attribute access is cheap after the first load: each access only stats
+    the source file and reloads when its mtime (or existence) has changed.
+    Safe to use from multiple threads.
+    """
+
+    def __init__(self, path: str = PIVOT_STRATEGIC_CONTEXT_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._mtime: Optional[float] = None
+        self._text = ""
+        self._version = ""
+
+    def _source_mtime(self) -> Optional[float]:
+        try:
+            return os.path.getmtime(self.path)
+        except OSError:
+            return None
+
+    def _refresh(self):
+        mtime = self._source_mtime()
+        with self._lock:
+            if self._loaded and mtime == self._mtime:
+                return
+            self._text = load_strategic_context(self.path)
+            self._version = hashlib.sha256(self._text.encode('utf-8')).hexdigest()[:12]
+            self._mtime = mtime
+            self._loaded = True
+
+    @property
+    def text(self) -> str:
+        """Strategic context string for AI analysis prompts."""
+        self._refresh()
+        return self._text
+
+    @property
+    def version(self) -> str:
+        """Short content hash of the current context (changes whenever the text does)."""
+        self._refresh()
+        return self._version
+
+# Shared instance - nothing is read until .text or .version is first used
+STRATEGIC_CONTEXT = StrategicContext()
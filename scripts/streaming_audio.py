@@ -0,0 +1,179 @@
+"""
+Progressive MP3 output for audio generation.
+
+TTS chunks finish out of order; ProgressiveEpisode appends each one to a
+growing MP3 as soon as every chunk before it has arrived. MP3 is a sequence
+of self-contained frames, so the file is playable at any point while it
+grows (no ffmpeg, no re-encode). The finished episode is still assembled by
+audio_assembly.assemble_mp3; the progressive file is only for listening early.
+
+Once the contiguous audio reaches a configured length, a tagged snapshot of
+it can be handed to a callback (e.g. to publish a partial episode).
+
+Usage:
+    from streaming_audio import ProgressiveEpisode
+
+    episode = ProgressiveEpisode(Path("streaming/GAT-123.mp3"), total_chunks=12, tags=tags,
+                                 partial_path=Path("GAT-123.partial.mp3"), partial_after=300,
+                                 on_partial=publish)
+    client.synthesize_chunks(chunks, chunk_files, on_chunk=episode.chunk_ready)
+    episode.finish()
+"""
+
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+# Bitrates (kbps) by header index: MPEG-1 Layer III and MPEG-2/2.5 Layer III
+MPEG1_LAYER3_BITRATES = [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 0]
+MPEG2_LAYER3_BITRATES = [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160, 0]
+
+# ID3v2.3 text frames for the tag keys used by the audio scripts
+ID3_TEXT_FRAMES = {
+    'title': 'TIT2',
+    'album': 'TALB',
+    'artist': 'TPE1',
+    'album_artist': 'TPE2',
+    'track': 'TRCK',
+    'genre': 'TCON',
+}
+
+def _syncsafe(size: int) -> bytes:
+    """ID3v2 tag size: 28 bits spread over four 7-bit bytes."""
+    return bytes([(size >> 21) & 0x7F, (size >> 14) & 0x7F, (size >> 7) & 0x7F, size & 0x7F])
+
+def id3v2_tag(tags: Dict[str, str]) -> bytes:
+    """Minimal ID3v2.3 tag (UTF-16 text frames and a comment) for tags."""
+    frames = b''
+    for key, frame_id in ID3_TEXT_FRAMES.items():
+        if tags.get(key):
+            payload = b'\x01' + str(tags[key]).encode('utf-16')
+            frames += frame_id.encode('ascii') + struct.pack('>I', len(payload)) + b'\x00\x00' + payload
+    if tags.get('comment'):
+        # Encoding, language, empty description, text
+        payload = b'\x01eng' + ''.encode('utf-16') + b'\x00\x00' + str(tags['comment']).encode('utf-16')
+        frames += b'COMM' + struct.pack('>I', len(payload)) + b'\x00\x00' + payload
+    return b'ID3\x03\x00\x00' + _syncsafe(len(frames)) + frames
+
+def strip_id3v2(data: bytes) -> bytes:
+    """Audio frames of an MP3 without a leading ID3v2 tag (if any)."""
+    if len(data) >= 10 and data.startswith(b'ID3'):
+        size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        footer = 10 if data[5] & 0x10 else 0
+        return data[10 + size + footer:]
+    return data
+
+def mp3_bitrate(data: bytes) -> Optional[int]:
+    """Bitrate (bits/s) from the first Layer III frame header in data, or None."""
+    for i in range(min(len(data) - 3, 4096)):
+        if data[i] != 0xFF or (data[i + 1] & 0xE0) != 0xE0:
+            continue
+        version = (data[i + 1] >> 3) & 0x03   # 3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5
+        layer = (data[i + 1] >> 1) & 0x03     # 1 = Layer III
+        index = data[i + 2] >> 4
+        if version == 1 or layer != 1:
+            continue
+        table = MPEG1_LAYER3_BITRATES if version == 3 else MPEG2_LAYER3_BITRATES
+        if table[index]:
+            return table[index] * 1000
+    return None
+
+def mp3_duration(data: bytes) -> float:
+    """Approximate duration in seconds of constant-bitrate MP3 audio data."""
+    bitrate = mp3_bitrate(data)
+    return len(data) * 8 / bitrate if bitrate else 0.0
+
+class ProgressiveEpisode:
+    """
+    Growing, playable MP3 fed by TTS chunks that may finish in any order.
+
+    Args:
+        stream_path: The progressive MP3 (rewritten from scratch on start)
+        total_chunks: Number of chunks the episode will have
+        tags: ID3 fields written at the start of the stream
+        partial_path: Where to write the partial-episode snapshot
+        partial_after: Seconds of contiguous audio before the snapshot is taken
+        partial_tags: ID3 fields for the snapshot (default: tags)
+        on_partial: Called as on_partial(partial_path, seconds) once the snapshot exists
+    """
+
+    def __init__(self, stream_path: Path, total_chunks: int, tags: Optional[Dict[str, str]] = None,
+                 partial_path: Optional[Path] = None, partial_after: Optional[float] = None,
+                 partial_tags: Optional[Dict[str, str]] = None,
+                 on_partial: Optional[Callable[[Path, float], None]] = None):
+        self.stream_path = Path(stream_path)
+        self.total_chunks = total_chunks
+        self.partial_path = Path(partial_path) if partial_path else None
+        self.partial_after = partial_after
+        self.partial_tags = partial_tags or tags or {}
+        self.on_partial = on_partial
+
+        self.lock = threading.Lock()
+        self.ready = {}          # chunk index -> audio frames, waiting for earlier chunks
+        self.next_index = 0      # First chunk not yet in the stream
+        self.seconds = 0.0       # Duration of audio in the stream
+        self.partial_taken = self.partial_path is None or partial_after is None
+        self.failed = False
+
+        self.stream_path.parent.mkdir(parents=True, exist_ok=True)
+        header = id3v2_tag(tags or {})
+        self.header_size = len(header)
+        with open(self.stream_path, 'wb') as f:
+            f.write(header)
+
+    def chunk_ready(self, index: int, chunk_path: Path):
+        """Record a finished chunk and append every chunk now in order. Thread-safe."""
+        snapshot = None
+        with self.lock:
+            if self.failed:
+                return
+            try:
+                self.ready[index] = strip_id3v2(Path(chunk_path).read_bytes())
+
+                if self.next_index in self.ready:
+                    with open(self.stream_path, 'ab') as f:
+                        while self.next_index in self.ready:
+                            frames = self.ready.pop(self.next_index)
+                            f.write(frames)
+                            f.flush()
+                            self.seconds += mp3_duration(frames)
+                            self.next_index += 1
+
+                if not self.partial_taken and self.seconds >= self.partial_after and not self.complete:
+                    self._write_snapshot()
+                    self.partial_taken = True
+                    snapshot = (self.partial_path, self.seconds)
+            except OSError as e:
+                # Streaming is a convenience: never fail the episode over it
+                print(f"  ⚠ Progressive audio stopped ({self.stream_path.name}): {e}")
+                self.failed = True
+                self.ready.clear()
+                return
+
+        # Outside the lock: publishing can be slow and must not stall other chunks
+        if snapshot and self.on_partial:
+            self.on_partial(*snapshot)
+
+    @property
+    def complete(self) -> bool:
+        return self.next_index >= self.total_chunks
+
+    def _write_snapshot(self):
+        """Write the audio so far, with the partial tags, to partial_path."""
+        temp_path = self.partial_path.with_name(self.partial_path.name + '.tmp')
+        with open(self.stream_path, 'rb') as src, open(temp_path, 'wb') as dst:
+            dst.write(id3v2_tag(self.partial_tags))
+            src.seek(self.header_size)
+            while True:
+                block = src.read(1024 * 1024)
+                if not block:
+                    break
+                dst.write(block)
+        os.replace(temp_path, self.partial_path)
+
+    def finish(self, keep_stream: bool = False):
+        """Remove the progressive file once the final episode exists (unless keep_stream)."""
+        if not keep_stream and self.stream_path.exists():
+            self.stream_path.unlink()
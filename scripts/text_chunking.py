@@ -0,0 +1,201 @@
+"""
+Boundary-aware text chunking shared by the assessment and audio scripts.
+
+Text is split into paragraphs; a paragraph that is too large on its own falls
+back to sentence boundaries, a sentence that is still too large falls back to
+clause boundaries (commas, semicolons, colons, dashes), and only then to word
+boundaries. The resulting pieces are packed greedily into chunks that never
+exceed the limit, measured by any size function (characters for TTS, tokens
+for LLM prompts).
+
+balanced_chunks() uses the same minimal number of chunks but evens out their
+sizes, so chunks synthesized in parallel finish at about the same time.
+
+Usage:
+    from text_chunking import pack_chunks, balanced_chunks, get_token_counter
+
+    count_tokens = get_token_counter("gpt-4-turbo-preview")
+    chunks = pack_chunks(text, limit=16000, measure=count_tokens)
+    tts_chunks = balanced_chunks(text, limit=4000)
+"""
+
+import math
+import re
+from typing import Callable, List, Tuple
+
+# Try to import tiktoken for exact token counts (optional)
+try:
+    import tiktoken
+    HAS_TIKTOKEN = True
+except ImportError:
+    HAS_TIKTOKEN = False
+
+# Fallback estimate when tiktoken is unavailable (English prose averages ~4
+# chars/token; 3.5 keeps estimates on the high side so chunks stay in budget)
+CHARS_PER_TOKEN_ESTIMATE = 3.5
+
+PARAGRAPH_SEPARATOR = '\n\n'
+SENTENCE_SEPARATOR = ' '
+
+# Sentence end: . ! ? (optionally followed by a closing quote/bracket) then whitespace
+SENTENCE_BOUNDARY = re.compile(r'(?:(?<=[.!?])|(?<=[.!?]["\')\]]))\s+')
+# Clause end: , ; : or a dash, then whitespace (natural pause points for speech)
+CLAUSE_BOUNDARY = re.compile(r'(?:(?<=[,;:])|(?<=\s[—–-]))\s+')
+PARAGRAPH_BOUNDARY = re.compile(r'\n\s*\n')
+
+def get_token_counter(model: str = "gpt-4-turbo-preview") -> Callable[[str], int]:
+    """
+    Return a function that counts tokens for the given model.
+
+    Uses tiktoken when installed, otherwise a conservative character-based
+    estimate.
+    """
+    if HAS_TIKTOKEN:
+        try:
+            encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            encoding = tiktoken.get_encoding("cl100k_base")
+        return lambda text: len(encoding.encode(text, disallowed_special=()))
+
+    return lambda text: math.ceil(len(text) / CHARS_PER_TOKEN_ESTIMATE)
+
+def split_paragraphs(text: str) -> List[str]:
+    """Split on blank lines, dropping empty paragraphs."""
+    return [p.strip() for p in PARAGRAPH_BOUNDARY.split(text) if p.strip()]
+
+def split_sentences(text: str) -> List[str]:
+    """Split a paragraph into sentences on terminal punctuation."""
+    return [s.strip() for s in SENTENCE_BOUNDARY.split(text.strip()) if s.strip()]
+
+def split_clauses(text: str) -> List[str]:
+    """Split a sentence into clauses on commas, semicolons, colons and dashes."""
+    return [c.strip() for c in CLAUSE_BOUNDARY.split(text.strip()) if c.strip()]
+
+def split_words(text: str, limit: int, measure: Callable[[str], int]) -> List[str]:
+    """Last resort: pack words up to the limit, slicing any single oversized word."""
+    pieces = []
+    current = ""
+
+    for word in text.split():
+        candidate = f"{current} {word}" if current else word
+        if measure(candidate) <= limit:
+            current = candidate
+            continue
+
+        if current:
+            pieces.append(current)
+            current = ""
+
+        # A single word (e.g. a long URL) that alone exceeds the limit
+        while measure(word) > limit:
+            cut = max(1, len(word) * limit // max(1, measure(word)))
+            pieces.append(word[:cut])
+            word = word[cut:]
+        current = word
+
+    if current:
+        pieces.append(current)
+
+    return pieces
+
+def split_units(text: str, limit: int, measure: Callable[[str], int]) -> List[Tuple[str, str]]:
+    """
+    Break text into (piece, separator) units that each fit within limit.
+
+    The separator is the string that joined the piece to its predecessor in
+    the original text (paragraph break or a space).
+    """
+    units = []
+
+    for paragraph in split_paragraphs(text):
+        if measure(paragraph) <= limit:
+            units.append((paragraph, PARAGRAPH_SEPARATOR))
+            continue
+
+        separator = PARAGRAPH_SEPARATOR
+        for sentence in split_sentences(paragraph):
+            if measure(sentence) <= limit:
+                pieces = [sentence]
+            else:
+                pieces = []
+                for clause in split_clauses(sentence):
+                    pieces.extend([clause] if measure(clause) <= limit else split_words(clause, limit, measure))
+            for piece in pieces:
+                units.append((piece, separator))
+                separator = SENTENCE_SEPARATOR
+
+    return units
+
+def pack_units(units: List[Tuple[str, str]], limit: int, measure: Callable[[str], int]) -> List[str]:
+    """Greedily join (piece, separator) units into chunks of at most limit (oversized units stand alone)."""
+    chunks = []
+    current = ""
+    current_size = 0
+
+    for piece, separator in units:
+        piece_size = measure(piece)
+
+        if current:
+            joined_size = current_size + measure(separator) + piece_size
+            if joined_size <= limit:
+                current += separator + piece
+                current_size = joined_size
+                continue
+            chunks.append(current)
+
+        current = piece
+        current_size = piece_size
+
+    if current:
+        chunks.append(current)
+
+    return chunks
+
+def pack_chunks(text: str, limit: int, measure: Callable[[str], int] = len) -> List[str]:
+    """
+    Split text into chunks no larger than limit, breaking on natural boundaries.
+
+    Args:
+        text: Text to split
+        limit: Maximum chunk size in measure units
+        measure: Size function (len for characters, a token counter for tokens)
+
+    Returns:
+        List of chunks in document order (a single chunk if text already fits)
+    """
+    text = text.strip()
+    if not text:
+        return []
+    if measure(text) <= limit:
+        return [text]
+
+    return pack_units(split_units(text, limit, measure), limit, measure)
+
+def balanced_chunks(text: str, limit: int, measure: Callable[[str], int] = len) -> List[str]:
+    """
+    Split text into the fewest chunks within limit, with sizes as even as possible.
+
+    Finds (by binary search) the smallest packing target that still needs no
+    more chunks than greedy packing at the full limit, so every chunk lands
+    near total/n instead of n-1 full chunks and a short tail.
+    """
+    text = text.strip()
+    if not text:
+        return []
+    if measure(text) <= limit:
+        return [text]
+
+    units = split_units(text, limit, measure)
+    count = len(pack_units(units, limit, measure))
+
+    # Smallest target that still packs into `count` chunks (the full limit always does)
+    low = max(1, measure(text) // count)
+    high = limit
+    while low < high:
+        target = (low + high) // 2
+        if len(pack_units(units, target, measure)) <= count:
+            high = target
+        else:
+            low = target + 1
+
+    return pack_units(units, high, measure)
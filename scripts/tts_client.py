@@ -0,0 +1,338 @@
+"""
+In-process OpenAI text-to-speech client shared by the audio scripts.
+
+Replaces the per-chunk `curl` subprocess (process spawn, temp JSON file and
+fresh TLS handshake per chunk) with pooled keep-alive HTTPS connections:
+idle connections go back to a bounded pool on the client, so any thread
+reuses them across chunks and articles. Every response
+is checked for HTTP status and an audio content type, and the body is
+streamed straight to disk, so an error payload can never be saved as an MP3.
+
+Concurrency is capped per client with a semaphore, so sharing one client
+(get_tts_client(), one per distinct set of settings) caps in-flight TTS
+requests across all articles.
+
+Synthesized chunks are kept in a content-addressed cache keyed by (text,
+model, voice, speed), so regenerating an article only pays for chunks whose
+text actually changed. The cache is size-capped with LRU eviction.
+
+Usage:
+    from tts_client import get_tts_client
+
+    client = get_tts_client()
+    client.synthesize("Hello world", Path("/tmp/hello.mp3"))
+    chunks = split_for_tts(text)
+    ok = client.synthesize_chunks(chunks, chunk_paths, workers=4)
+    client.close()    # Optional: the shared client is closed at exit
+"""
+
+import atexit
+import http.client
+import inspect
+import json
+import os
+import queue
+import random
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Optional
+from urllib.parse import urlparse
+
+from content_cache import ContentCache, DEFAULT_CACHE_ROOT, content_key
+from shared_patterns import AUDIO_CHUNK_MAX_CHARS
+from text_chunking import balanced_chunks
+
+DEFAULT_BASE_URL = "https://api.openai.com/v1"
+DEFAULT_MODEL = "tts-1"
+DEFAULT_VOICE = "onyx"
+DEFAULT_SPEED = 1.0
+
+# Characters per request (the API rejects input over 4096)
+TTS_MAX_CHUNK_CHARS = AUDIO_CHUNK_MAX_CHARS
+
+DEFAULT_MAX_CONCURRENT = 6   # In-flight requests across all users of one client
+DEFAULT_CHUNK_WORKERS = 4    # Chunks of one article synthesized at once
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_TIMEOUT = 120        # Seconds per request
+
+MIN_AUDIO_BYTES = 1000       # Anything smaller is not a usable chunk
+STREAM_BLOCK_SIZE = 64 * 1024
+
+# Synthesized chunk cache
+TTS_CACHE_DIR = os.path.join(DEFAULT_CACHE_ROOT, "tts")
+TTS_CACHE_MAX_MB = 2048
+
+# HTTP statuses worth retrying (rate limit, transient server errors)
+RETRYABLE_STATUSES = {408, 409, 429, 500, 502, 503, 504}
+
+def split_for_tts(text: str, max_chars: int = TTS_MAX_CHUNK_CHARS) -> List[str]:
+    """
+    Split text into evenly sized TTS chunks that never exceed max_chars.
+
+    Breaks on paragraphs, then sentences, then clauses, so chunk joins fall
+    on natural pauses; even sizes keep parallel synthesis balanced.
+    """
+    return balanced_chunks(text, max_chars)
+
+class TTSError(Exception):
+    """A TTS request failed. `retryable` is False for errors a retry won't fix."""
+
+    def __init__(self, message: str, status: Optional[int] = None,
+                 retryable: bool = True, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status = status
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+class TTSClient:
+    """
+    Thread-safe TTS client with a bounded pool of keep-alive connections.
+
+    A connection is in use by one request at a time (at most max_concurrent
+    at once) and up to max_concurrent stay open between requests, for any
+    thread to reuse. close() closes them.
+
+    Args:
+        api_key: OpenAI API key (default: OPENAI_API_KEY)
+        base_url: API base URL (default: OPENAI_BASE_URL or the public API);
+                  http:// URLs are allowed for a local stand-in server
+        model, voice, speed: Synthesis settings sent with every request
+        max_concurrent: Cap on in-flight requests through this client
+        max_retries: Attempts per chunk before giving up
+        timeout: Socket timeout per request in seconds
+        cache: ContentCache for synthesized chunks (None disables caching)
+    """
+
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None,
+                 model: str = DEFAULT_MODEL, voice: str = DEFAULT_VOICE, speed: float = DEFAULT_SPEED,
+                 max_concurrent: int = DEFAULT_MAX_CONCURRENT, max_retries: int = DEFAULT_MAX_RETRIES,
+                 timeout: float = DEFAULT_TIMEOUT, cache: Optional[ContentCache] = None):
+        self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
+        if not self.api_key:
+            raise ValueError("OPENAI_API_KEY not set in environment")
+
+        url = urlparse(base_url or os.environ.get("OPENAI_BASE_URL") or DEFAULT_BASE_URL)
+        self.scheme = url.scheme or "https"
+        self.host = url.hostname
+        self.port = url.port
+        self.path = url.path.rstrip("/") + "/audio/speech"
+
+        self.model = model
+        self.voice = voice
+        self.speed = speed
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.cache = cache
+        self.semaphore = threading.BoundedSemaphore(max(1, max_concurrent))
+        self._idle = queue.LifoQueue(maxsize=max(1, max_concurrent))
+        self._idle_lock = threading.Lock()
+        self._closed = False
+
+    def _checkout(self) -> http.client.HTTPConnection:
+        """An idle pooled connection (most recently used first), else a new one."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        if self.scheme == "http":
+            return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout)
+
+    def _checkin(self, conn: http.client.HTTPConnection):
+        """Return a fully read connection to the pool; closed if the pool is full or closed."""
+        with self._idle_lock:
+            if not self._closed:
+                try:
+                    self._idle.put_nowait(conn)
+                    return
+                except queue.Full:
+                    pass
+        conn.close()
+
+    def close(self):
+        """Close all pooled connections. Ones still in use are closed when their request ends."""
+        with self._idle_lock:
+            self._closed = True
+            while True:
+                try:
+                    self._idle.get_nowait().close()
+                except queue.Empty:
+                    break
+
+    def _request(self, text: str, output_path: Path):
+        """Send one request and stream a validated audio body to output_path."""
+        body = json.dumps({
+            "model": self.model,
+            "input": text,
+            "voice": self.voice,
+            "speed": self.speed
+        }).encode("utf-8")
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "Connection": "keep-alive"
+        }
+
+        conn = self._checkout()
+        try:
+            self._send(conn, body, headers, output_path)
+        except BaseException:
+            # The response may be half-read - never reuse the connection
+            conn.close()
+            raise
+        self._checkin(conn)
+
+    def _send(self, conn: http.client.HTTPConnection, body: bytes, headers: dict, output_path: Path):
+        """One request on conn; returns only once the response has been fully read."""
+        try:
+            conn.request("POST", self.path, body=body, headers=headers)
+            response = conn.getresponse()
+        except (OSError, http.client.HTTPException) as e:
+            raise TTSError(f"connection error: {e}")
+
+        content_type = response.getheader("Content-Type", "")
+
+        if response.status != 200:
+            detail = response.read(2000).decode("utf-8", errors="replace")
+            retry_after = response.getheader("Retry-After")
+            try:
+                detail = json.loads(detail)["error"]["message"]
+            except (ValueError, KeyError, TypeError):
+                pass
+            raise TTSError(
+                f"HTTP {response.status}: {detail}",
+                status=response.status,
+                retryable=response.status in RETRYABLE_STATUSES,
+                retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None
+            )
+
+        if not (content_type.startswith("audio/") or content_type.startswith("application/octet-stream")):
+            detail = response.read(500).decode("utf-8", errors="replace")
+            raise TTSError(f"unexpected content type {content_type!r}: {detail}")
+
+        # Stream to a temp file and rename, so output_path is only ever a complete chunk
+        temp_path = output_path.with_name(output_path.name + ".part")
+        size = 0
+        try:
+            with open(temp_path, "wb") as f:
+                while True:
+                    block = response.read(STREAM_BLOCK_SIZE)
+                    if not block:
+                        break
+                    f.write(block)
+                    size += len(block)
+        except (OSError, http.client.HTTPException) as e:
+            if temp_path.exists():
+                temp_path.unlink()
+            raise TTSError(f"connection error while streaming audio: {e}")
+
+        if size < MIN_AUDIO_BYTES:
+            temp_path.unlink()
+            raise TTSError(f"audio too small ({size} bytes)")
+
+        os.replace(temp_path, output_path)
+
+    def cache_key(self, text: str) -> str:
+        """Cache key for a chunk: everything that changes the synthesized audio."""
+        return content_key("tts", self.model, self.voice, self.speed, text)
+
+    def is_cached(self, text: str) -> bool:
+        return self.cache is not None and self.cache.contains(self.cache_key(text))
+
+    def _copy_from_cache(self, text: str, output_path: Path) -> bool:
+        """Copy a cached chunk to output_path. Returns False on a miss."""
+        if self.cache is None:
+            return False
+
+        cached_path = self.cache.get_path(self.cache_key(text))
+        if cached_path is None:
+            return False
+
+        temp_path = output_path.with_name(output_path.name + ".part")
+        try:
+            shutil.copyfile(cached_path, temp_path)
+            os.replace(temp_path, output_path)
+            return True
+        except OSError:
+            # Evicted mid-copy - synthesize instead
+            if temp_path.exists():
+                temp_path.unlink()
+            return False
+
+    def synthesize(self, text: str, output_path: Path, label: str = "") -> bool:
+        """
+        Synthesize text to output_path, retrying transient failures.
+
+        Chunks already in the cache are copied without an API call. Each
+        attempt holds a slot of the client's semaphore. Returns False (after
+        printing why) if every attempt failed.
+        """
+        output_path = Path(output_path)
+
+        if self._copy_from_cache(text, output_path):
+            return True
+
+        for attempt in range(self.max_retries):
+            try:
+                with self.semaphore:
+                    self._request(text, output_path)
+                if self.cache is not None:
+                    self.cache.put_file(self.cache_key(text), output_path)
+                return True
+            except TTSError as e:
+                print(f"  ⚠ {label}attempt {attempt + 1}/{self.max_retries} failed: {e}")
+                if not e.retryable or attempt == self.max_retries - 1:
+                    break
+                delay = e.retry_after if e.retry_after is not None else 2 ** attempt + random.uniform(0, 1)
+                time.sleep(delay)
+
+        return False
+
+    def synthesize_chunks(self, chunks: List[str], chunk_paths: List[Path],
+                          workers: int = DEFAULT_CHUNK_WORKERS,
+                          on_chunk: Optional[Callable[[int, Path], None]] = None) -> List[bool]:
+        """
+        Synthesize chunks concurrently; returns per-chunk success in chunk order.
+
+        on_chunk(index, path) is called from the worker thread as each chunk
+        succeeds (in completion order, not chunk order).
+        """
+        def run(i):
+            ok = self.synthesize(chunks[i], chunk_paths[i], label=f"Chunk {i + 1}/{len(chunks)}: ")
+            if ok and on_chunk is not None:
+                on_chunk(i, chunk_paths[i])
+            return ok
+
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(chunks)))) as executor:
+            return list(executor.map(run, range(len(chunks))))
+
+_shared_clients = {}
+_shared_clients_lock = threading.Lock()
+
+def get_tts_client(use_cache: bool = True, **kwargs) -> TTSClient:
+    """
+    Process-wide shared client for these settings (TTSClient arguments).
+
+    Calls with the same settings get the same client, so its concurrency cap
+    spans all articles; arguments equal to TTSClient's defaults count as
+    omitted. Different settings (e.g. another voice or max_retries) get their
+    own client rather than silently reusing one configured differently. With
+    use_cache, chunks are cached under TTS_CACHE_DIR. Clients are closed at exit.
+    """
+    defaults = {name: param.default for name, param in inspect.signature(TTSClient).parameters.items()}
+    settings = {name: value for name, value in kwargs.items() if name not in defaults or value != defaults[name]}
+    key = (use_cache, tuple(sorted(settings.items())))
+
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            if use_cache and "cache" not in settings:
+                settings["cache"] = ContentCache(TTS_CACHE_DIR, max_bytes=TTS_CACHE_MAX_MB * 1024 * 1024,
+                                                 suffix=".mp3")
+            client = TTSClient(**settings)
+            atexit.register(client.close)
+            _shared_clients[key] = client
+        return client